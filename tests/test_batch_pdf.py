@@ -0,0 +1,43 @@
+"""
+Tests for converting several documents to PDF in one LibreOffice run.
+"""
+
+import asyncio
+import os
+import stat
+
+from docx import Document
+
+from word_document_server.tools import extended_document_tools
+
+
+_FAKE_SOFFICE = """#!/bin/sh
+# Converts good.docx only and complains about everything else, like a failed run
+while [ "$1" != "--outdir" ]; do shift; done
+outdir="$2"; shift 2
+for doc in "$@"; do
+    case "$doc" in
+        *good.docx) : > "$outdir/good.pdf" ;;
+        *) echo "Error: source file could not be loaded" >&2 ;;
+    esac
+done
+"""
+
+
+def test_batch_failures_report_libreoffice_stderr(tmp_path, monkeypatch):
+    soffice = tmp_path / "soffice"
+    soffice.write_text(_FAKE_SOFFICE)
+    soffice.chmod(soffice.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setattr(extended_document_tools, "find_libreoffice", lambda: str(soffice))
+    monkeypatch.setattr(extended_document_tools, "convert_with_lo_server", lambda *args: False)
+
+    good, bad = str(tmp_path / "good.docx"), str(tmp_path / "bad.docx")
+    for path in (good, bad):
+        Document().save(path)
+    out_dir = str(tmp_path / "pdfs")
+
+    result = asyncio.run(extended_document_tools.convert_documents_to_pdf([good, bad], out_dir))
+
+    assert "Converted 1 of 2 documents to PDF:" in result
+    assert os.path.exists(os.path.join(out_dir, "good.pdf"))
+    assert f"- {bad} ({soffice} error: Error: source file could not be loaded)" in result
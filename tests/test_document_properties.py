@@ -0,0 +1,38 @@
+"""
+Tests for the document statistics streamed from word/document.xml.
+"""
+
+from docx import Document
+from docx.enum.section import WD_SECTION
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+from word_document_server.utils.document_utils import get_document_properties
+
+
+def _track_section_change(sectPr):
+    """Record earlier section properties in a w:sectPrChange, as Word does with track changes."""
+    sectPr.append(
+        parse_xml(
+            f'<w:sectPrChange {nsdecls("w")} w:id="1" w:author="a" w:date="2024-01-01T00:00:00Z">'
+            "<w:sectPr/></w:sectPrChange>"
+        )
+    )
+
+
+def test_section_count_ignores_tracked_section_changes(tmp_path):
+    path = str(tmp_path / "sections.docx")
+    doc = Document()
+    doc.add_paragraph("first section")
+    doc.add_section(WD_SECTION.NEW_PAGE)
+    doc.add_paragraph("second section")
+    for section in doc.sections:
+        _track_section_change(section._sectPr)
+    doc.save(path)
+
+    reloaded = Document(path)
+    assert len(reloaded.sections) == 2
+
+    fast = get_document_properties(path)
+    assert fast["page_count"] == 2
+    assert fast == get_document_properties(path, fast=False)
@@ -0,0 +1,130 @@
+"""
+Tests for the lifecycle of the persistent LibreOffice listener.
+"""
+
+import sys
+import threading
+import types
+
+import pytest
+
+from word_document_server.utils import conversion_utils
+
+
+class _FakeProcess:
+    """Popen stand-in whose exit status the test controls."""
+
+    def __init__(self, args, **kwargs):
+        self.args = args
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+@pytest.fixture
+def lo_server(monkeypatch):
+    started = []
+
+    def popen(args, **kwargs):
+        process = _FakeProcess(args, **kwargs)
+        started.append(process)
+        return process
+
+    monkeypatch.setattr(conversion_utils, "find_libreoffice", lambda: "soffice")
+    monkeypatch.setattr(conversion_utils.subprocess, "Popen", popen)
+    monkeypatch.setattr(conversion_utils.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(conversion_utils, "_lo_server_failed_at", None)
+    yield started
+    conversion_utils._stop_lo_server()
+
+
+def test_listener_uses_private_pipe_and_restarts_after_exit(lo_server):
+    ctx = conversion_utils._start_lo_server(lambda url: url)
+
+    accept = [arg for arg in lo_server[0].args if arg.startswith("--accept=")]
+    assert accept[0].startswith("--accept=pipe,name=word_mcp_lo_")
+    assert "port=" not in ctx
+    assert conversion_utils._start_lo_server(lambda url: url) == ctx
+    assert len(lo_server) == 1
+
+    # A listener that died is never trusted; a new one with a new name replaces it
+    lo_server[0].returncode = 1
+    new_ctx = conversion_utils._start_lo_server(lambda url: url)
+    assert len(lo_server) == 2
+    assert new_ctx != ctx
+
+
+def test_listener_that_exits_before_accepting_is_abandoned(lo_server):
+    def connect(url):
+        lo_server[-1].returncode = 1
+        raise OSError("connection refused")
+
+    assert conversion_utils._start_lo_server(connect) is None
+    assert len(lo_server) == 1
+    assert conversion_utils._LO_SERVER is None
+
+
+def test_failed_start_is_retried_after_backoff(lo_server, monkeypatch):
+    def refuse(url):
+        lo_server[-1].returncode = 1
+        raise OSError("connection refused")
+
+    assert conversion_utils._start_lo_server(refuse) is None
+    assert conversion_utils._start_lo_server(lambda url: url) is None
+    assert len(lo_server) == 1
+
+    failed_at = conversion_utils._lo_server_failed_at
+    monkeypatch.setattr(
+        conversion_utils.time,
+        "monotonic",
+        lambda: failed_at + conversion_utils._LO_SERVER_RETRY_AFTER,
+    )
+    assert conversion_utils._start_lo_server(lambda url: url) is not None
+    assert len(lo_server) == 2
+
+
+def test_hung_conversion_stops_listener_and_releases_lock(lo_server, monkeypatch, tmp_path):
+    release = threading.Event()
+
+    class Desktop:
+        # Also stands in for the URL resolver, which is created the same way
+        resolve = None
+
+        def loadComponentFromURL(self, *args):
+            release.wait()
+            raise RuntimeError("listener killed")
+
+    class ServiceManager:
+        def createInstanceWithContext(self, name, ctx):
+            return Desktop()
+
+    ctx = types.SimpleNamespace(ServiceManager=ServiceManager())
+    uno = types.SimpleNamespace(
+        getComponentContext=lambda: ctx,
+        systemPathToFileUrl=lambda path: "file://" + path,
+    )
+    beans = types.SimpleNamespace(PropertyValue=types.SimpleNamespace)
+    monkeypatch.setitem(sys.modules, "uno", uno)
+    monkeypatch.setitem(sys.modules, "com", types.ModuleType("com"))
+    monkeypatch.setitem(sys.modules, "com.sun", types.ModuleType("com.sun"))
+    monkeypatch.setitem(sys.modules, "com.sun.star", types.ModuleType("com.sun.star"))
+    monkeypatch.setitem(sys.modules, "com.sun.star.beans", beans)
+    monkeypatch.setattr(conversion_utils, "_start_lo_server", lambda connect: ctx)
+    monkeypatch.setattr(conversion_utils, "_LO_SERVER_CONVERT_TIMEOUT", 0.2)
+    stopped = []
+    monkeypatch.setattr(conversion_utils, "_stop_lo_server", lambda: stopped.append(True))
+
+    try:
+        assert not conversion_utils.convert_with_lo_server("a.docx", str(tmp_path / "a.pdf"))
+        assert stopped
+        assert conversion_utils._lo_server_lock.acquire(blocking=False)
+        conversion_utils._lo_server_lock.release()
+    finally:
+        release.set()
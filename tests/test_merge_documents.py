@@ -0,0 +1,82 @@
+"""
+Tests for merge_documents.
+"""
+
+import asyncio
+import io
+import zipfile
+
+from docx import Document
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from PIL import Image
+
+from word_document_server.tools.document_tools import merge_documents
+
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+
+def _png(color):
+    buf = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buf, format="PNG")
+    buf.seek(0)
+    return buf
+
+
+def _add_hyperlink(doc, text, url):
+    rid = doc.part.relate_to(url, RT.HYPERLINK, is_external=True)
+    doc.add_paragraph()._p.append(
+        parse_xml(
+            f'<w:hyperlink {nsdecls("w", "r")} r:id="{rid}"><w:r><w:t>{text}</w:t></w:r></w:hyperlink>'
+        )
+    )
+
+
+def _source(path, color, url):
+    doc = Document()
+    doc.add_paragraph(f"Document with {color} image")
+    # Pad the relationships so source rIds collide with the target's own
+    for i in range(6):
+        doc.part.relate_to(f"https://example.com/unused/{i}", RT.HYPERLINK, is_external=True)
+    doc.add_picture(_png(color))
+    _add_hyperlink(doc, "link", url)
+    doc.save(path)
+    return str(path)
+
+
+def test_merge_carries_images_and_hyperlinks(tmp_path):
+    first = _source(tmp_path / "first.docx", "red", "https://example.com/first")
+    second = _source(tmp_path / "second.docx", "blue", "https://example.com/second")
+    merged = str(tmp_path / "merged.docx")
+
+    result = asyncio.run(merge_documents(merged, [first, second]))
+    assert result.startswith("Successfully merged"), result
+
+    doc = Document(merged)
+    rels = doc.part.rels
+    referenced = [
+        (name, value)
+        for elem in doc.element.body.iter()
+        for name, value in elem.items()
+        if name.startswith(_R_NS)
+    ]
+    assert len(referenced) == 4
+    for _, rid in referenced:
+        assert rid in rels
+
+    urls = sorted(
+        rels[rid].target_ref for name, rid in referenced if rels[rid].reltype == RT.HYPERLINK
+    )
+    assert urls == ["https://example.com/first", "https://example.com/second"]
+
+    colors = sorted(
+        Image.open(io.BytesIO(rels[rid].target_part.blob)).getpixel((0, 0))
+        for name, rid in referenced
+        if rels[rid].reltype == RT.IMAGE
+    )
+    assert colors == [(0, 0, 255), (255, 0, 0)]
+
+    with zipfile.ZipFile(merged) as z:
+        media = [name for name in z.namelist() if name.startswith("word/media/")]
+    assert len(media) == 2
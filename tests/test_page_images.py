@@ -0,0 +1,47 @@
+"""
+Tests for rendering document pages to images.
+"""
+
+import asyncio
+import json
+import time
+
+from docx import Document
+
+from word_document_server.tools import imaging_tools
+
+
+def test_conversion_does_not_block_the_event_loop(tmp_path, monkeypatch):
+    path = str(tmp_path / "doc.docx")
+    Document().save(path)
+
+    def slow_convert(filename):
+        time.sleep(0.5)
+        return False, "no converter"
+
+    monkeypatch.setattr(imaging_tools, "convert_docx_to_pdf_cached", slow_convert)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await imaging_tools.get_document_page_images(path, [1], inline=True)
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(run())
+    assert json.loads(result) == {"error": "Failed to convert DOCX to PDF: no converter"}
+    assert ticks >= 5
+
+
+def test_compress_level_rejects_bools():
+    assert imaging_tools._validate_compress_level(True) is not None
+    assert imaging_tools._validate_compress_level(False) is not None
+    assert imaging_tools._validate_compress_level(0) is None
+    assert imaging_tools._validate_compress_level(9) is None
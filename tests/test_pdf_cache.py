@@ -0,0 +1,59 @@
+"""
+Tests for the on-disk cache of converted PDFs.
+"""
+
+import os
+
+from docx import Document
+
+from word_document_server.utils import conversion_utils
+
+
+def _fake_convert(filename, temp_dir=None):
+    """Stand-in for the LibreOffice conversion that records where it wrote."""
+    fd, path = conversion_utils.tempfile.mkstemp(suffix=".pdf", dir=temp_dir)
+    os.close(fd)
+    return True, path
+
+
+def test_cache_dir_is_created_private(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversion_utils, "convert_docx_to_pdf_temp", _fake_convert)
+    source = str(tmp_path / "doc.docx")
+    Document().save(source)
+    cache_dir = str(tmp_path / "cache")
+
+    success, pdf = conversion_utils.convert_docx_to_pdf_cached(source, cache_dir)
+
+    assert success and os.path.dirname(pdf) == cache_dir
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+    assert conversion_utils.convert_docx_to_pdf_cached(source, cache_dir) == (True, pdf)
+
+
+def test_cache_dir_behind_symlink_is_not_trusted(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversion_utils, "convert_docx_to_pdf_temp", _fake_convert)
+    source = str(tmp_path / "doc.docx")
+    Document().save(source)
+    planted = tmp_path / "planted"
+    planted.mkdir()
+    cache_dir = str(tmp_path / "cache")
+    os.symlink(planted, cache_dir)
+
+    success, pdf = conversion_utils.convert_docx_to_pdf_cached(source, cache_dir)
+
+    assert success
+    assert os.path.dirname(pdf) != cache_dir
+    assert not os.listdir(planted)
+    os.unlink(pdf)
+
+
+def test_cleanup_keeps_pdf_in_custom_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversion_utils, "convert_docx_to_pdf_temp", _fake_convert)
+    source = str(tmp_path / "doc.docx")
+    Document().save(source)
+    cache_dir = str(tmp_path / "cache")
+
+    success, pdf = conversion_utils.convert_docx_to_pdf_cached(source, cache_dir)
+
+    assert success and conversion_utils.cleanup_temp_file(pdf)
+    assert os.path.exists(pdf)
+    assert conversion_utils.convert_docx_to_pdf_cached(source, cache_dir) == (True, pdf)
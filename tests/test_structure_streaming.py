@@ -0,0 +1,69 @@
+"""
+Tests for the streamed document structure and its table worker pool.
+"""
+
+import asyncio
+import json
+
+from docx import Document
+
+from word_document_server.tools.extended_document_tools import (
+    get_document_structure_details_from_document,
+)
+from word_document_server.utils import document_analyzer
+from word_document_server.utils.document_analyzer import (
+    DocumentAnalyzer,
+    get_complete_structure_streaming,
+)
+
+
+def _table_document(path, style=None):
+    doc = Document()
+    for t in range(6):
+        table = doc.add_table(rows=2, cols=2)
+        if style:
+            table.style = style
+        table.cell(0, 0).text = f"table {t}"
+        table.cell(1, 0).merge(table.cell(1, 1))
+        doc.add_paragraph(f"after {t}")
+    doc.save(path)
+    return str(path)
+
+
+def test_pooled_tables_match_serial_analysis_across_documents(tmp_path, monkeypatch):
+    monkeypatch.setattr(document_analyzer, "_PARALLEL_MIN_XML_BYTES", 0)
+    monkeypatch.setattr(document_analyzer, "_PARALLEL_MIN_TABLE_BYTES", 0)
+    monkeypatch.setattr(document_analyzer.os, "cpu_count", lambda: 2)
+
+    paths = [
+        _table_document(tmp_path / "plain.docx"),
+        _table_document(tmp_path / "grid.docx", style="Table Grid"),
+    ]
+    try:
+        for path in paths:
+            # The same workers serve both documents, each with its own styles
+            assert get_complete_structure_streaming(path) == DocumentAnalyzer(path).get_complete_structure()
+        assert document_analyzer._table_pool is not None
+    finally:
+        document_analyzer._shutdown_table_pool()
+
+
+def test_structure_pages_cover_the_whole_document(tmp_path):
+    path = _table_document(tmp_path / "doc.docx")
+    full = DocumentAnalyzer(path).get_complete_structure()
+
+    paragraphs, tables = [], []
+    offset = 0
+    while True:
+        page = json.loads(
+            asyncio.run(get_document_structure_details_from_document(path, offset=offset, limit=4))
+        )
+        assert page["document_info"] == full["document_info"]
+        paragraphs += page["paragraphs"]
+        tables += page["tables"]
+        if len(page["paragraphs"]) < 4 and len(page["tables"]) < 4:
+            break
+        offset += 4
+
+    assert paragraphs == full["paragraphs"]
+    assert tables == full["tables"]
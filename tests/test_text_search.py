@@ -0,0 +1,112 @@
+"""
+Tests for the streaming text search and its raw-XML prefilter.
+"""
+
+import asyncio
+import json
+import zipfile
+
+from docx import Document
+from lxml import etree
+
+from word_document_server.tools.extended_document_tools import (
+    find_many_texts,
+    find_text_in_document,
+)
+from word_document_server.utils.document_analyzer import DocumentAnalyzer
+
+
+def _split_run_document(path, pretty_print=False):
+    """Save a document whose only match for "Hello world" spans two runs."""
+    doc = Document()
+    paragraph = doc.add_paragraph()
+    paragraph.add_run("Hello ")
+    paragraph.add_run("world")
+    doc.save(path)
+
+    if pretty_print:
+        with zipfile.ZipFile(path) as z:
+            parts = {info.filename: z.read(info) for info in z.infolist()}
+        root = etree.fromstring(parts["word/document.xml"])
+        parts["word/document.xml"] = etree.tostring(
+            root, xml_declaration=True, encoding="UTF-8", standalone=True, pretty_print=True
+        )
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+            for name, data in parts.items():
+                z.writestr(name, data)
+    return str(path)
+
+
+def test_match_across_runs_in_indented_document_xml(tmp_path):
+    path = _split_run_document(tmp_path / "indented.docx", pretty_print=True)
+    with zipfile.ZipFile(path) as z:
+        assert b"</w:t>\n" in z.read("word/document.xml")
+
+    assert DocumentAnalyzer(path).find_text("Hello world")["total_count"] == 1
+
+    for match_case, query in ((True, "Hello world"), (False, "hello WORLD")):
+        result = json.loads(asyncio.run(find_text_in_document(path, query, match_case)))
+        assert result["total_count"] == 1
+
+        result = json.loads(asyncio.run(find_many_texts(path, [query], match_case)))
+        assert result["total_count"] == 1
+
+
+def test_prefilter_still_rejects_absent_text(tmp_path):
+    path = _split_run_document(tmp_path / "compact.docx")
+
+    result = json.loads(asyncio.run(find_text_in_document(path, "Hello there")))
+    assert result["total_count"] == 0
+
+
+def test_ignore_case_agrees_on_non_ascii_text(tmp_path):
+    path = str(tmp_path / "non_ascii.docx")
+    doc = Document()
+    doc.add_paragraph("İstanbul and ISTANBUL")
+    doc.add_paragraph("Grüße aus Köln, KÖLN")
+    doc.save(path)
+
+    for query in ("istanbul", "İSTANBUL", "köln", "GRÜSSE", "grüße aus"):
+        expected = DocumentAnalyzer(path).find_text(query, match_case=False)
+
+        single = json.loads(asyncio.run(find_text_in_document(path, query, False)))
+        many = json.loads(asyncio.run(find_many_texts(path, [query, "and"], False)))
+
+        assert single["occurrences"] == expected["occurrences"]
+        assert many["results"][query]["occurrences"] == expected["occurrences"]
+
+
+def test_whole_word_skips_overlapping_matches_like_find_text(tmp_path):
+    path = str(tmp_path / "overlap.docx")
+    doc = Document()
+    doc.add_paragraph("a a a")
+    doc.add_paragraph("ba a a")
+    doc.save(path)
+
+    for query in ("a a", "a"):
+        expected = DocumentAnalyzer(path).find_text(query, whole_word=True)
+        many = json.loads(asyncio.run(find_many_texts(path, ["a a", "a"], whole_word=True)))
+        assert many["results"][query]["occurrences"] == expected["occurrences"]
+    assert many["results"]["a a"]["total_count"] == 2
+
+
+def test_many_texts_fall_back_for_non_standard_main_part(tmp_path):
+    path = str(tmp_path / "renamed.docx")
+    doc = Document()
+    doc.add_paragraph("alpha beta alpha")
+    doc.save(path)
+
+    with zipfile.ZipFile(path) as z:
+        parts = {info.filename: z.read(info) for info in z.infolist()}
+    parts["word/main.xml"] = parts.pop("word/document.xml")
+    parts["word/_rels/main.xml.rels"] = parts.pop("word/_rels/document.xml.rels")
+    for name in ("[Content_Types].xml", "_rels/.rels"):
+        parts[name] = parts[name].replace(b"document.xml", b"main.xml")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, data in parts.items():
+            z.writestr(name, data)
+
+    result = json.loads(asyncio.run(find_many_texts(path, ["alpha", "beta"])))
+    assert result["results"]["alpha"]["total_count"] == 2
+    assert result["results"]["beta"]["total_count"] == 1
+    assert result["total_count"] == 3
@@ -0,0 +1,100 @@
+"""
+Tests for the per-file write lock and atomic saves shared by the write tools.
+"""
+
+import asyncio
+import os
+import shutil
+import zipfile
+
+import pytest
+from docx import Document
+
+from word_document_server.tools.content_tools import add_paragraph
+from word_document_server.tools.extended_document_tools import (
+    insert_paragraph_after_index,
+)
+from word_document_server.utils.doc_cache import checkin_document, checkout_document
+from word_document_server.utils import file_utils
+from word_document_server.utils.file_utils import save_document
+
+
+def test_concurrent_writers_keep_every_edit(tmp_path):
+    path = str(tmp_path / "doc.docx")
+    doc = Document()
+    doc.add_paragraph("first")
+    doc.save(path)
+
+    async def edit():
+        await asyncio.gather(
+            *[add_paragraph(path, f"appended {i}") for i in range(5)],
+            *[insert_paragraph_after_index(path, 0, f"inserted {i}") for i in range(5)],
+        )
+
+    asyncio.run(edit())
+
+    texts = {p.text for p in Document(path).paragraphs}
+    assert {f"appended {i}" for i in range(5)} <= texts
+    assert {f"inserted {i}" for i in range(5)} <= texts
+
+
+def test_failed_save_leaves_original_untouched(tmp_path):
+    path = str(tmp_path / "doc.docx")
+    doc = Document()
+    doc.add_paragraph("original")
+    doc.save(path)
+    os.chmod(path, 0o640)
+    with open(path, "rb") as f:
+        before = f.read()
+
+    class Broken:
+        def save(self, stream):
+            stream.write(b"partial")
+            raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        save_document(Broken(), path)
+
+    with open(path, "rb") as f:
+        assert f.read() == before
+    assert os.listdir(tmp_path) == ["doc.docx"]
+
+    save_document(Document(path), path)
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+def test_checkout_ignores_replaced_file_with_same_mtime_and_size(tmp_path):
+    path = str(tmp_path / "doc.docx")
+    doc = Document()
+    doc.add_paragraph("saved")
+    doc.save(path)
+    checkin_document(path, doc)
+    assert checkout_document(path) is doc
+    checkin_document(path, doc)
+
+    # Same bytes, size and mtime, but a different file
+    st = os.stat(path)
+    shutil.copyfile(path, path + ".new")
+    os.replace(path + ".new", path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert checkout_document(path) is not doc
+
+
+@pytest.mark.parametrize("direct_writer", [True, False])
+def test_uncompressed_save_matches_normal_package(tmp_path, monkeypatch, direct_writer):
+    monkeypatch.setattr(file_utils, "_HAS_PKG_WRITER_STEPS", direct_writer)
+    doc = Document()
+    doc.add_heading("Title", level=1)
+    doc.add_table(rows=2, cols=2).cell(0, 0).text = "cell"
+    normal = str(tmp_path / "normal.docx")
+    stored = str(tmp_path / "stored.docx")
+    save_document(doc, normal)
+    save_document(doc, stored, compress=False)
+
+    with zipfile.ZipFile(normal) as a, zipfile.ZipFile(stored) as b:
+        assert sorted(a.namelist()) == sorted(b.namelist())
+        for info in b.infolist():
+            assert info.compress_type == zipfile.ZIP_STORED
+            assert b.read(info) == a.read(info.filename)
+    assert [p.text for p in Document(stored).paragraphs] == ["Title"]
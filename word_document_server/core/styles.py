@@ -13,27 +13,29 @@ def ensure_heading_style(doc):
     Args:
         doc: Document object
     """
+    # Each doc.styles[name] lookup scans the whole styles part, so collect names once
+    existing_names = {style.name for style in doc.styles}
+
     for i in range(1, 10):  # Create Heading 1 through Heading 9
         style_name = f"Heading {i}"
+        if style_name in existing_names:
+            continue
+
+        # Create the style if it doesn't exist
         try:
-            # Try to access the style to see if it exists
-            style = doc.styles[style_name]
-        except KeyError:
-            # Create the style if it doesn't exist
-            try:
-                style = doc.styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
-                if i == 1:
-                    style.font.size = Pt(16)
-                    style.font.bold = True
-                elif i == 2:
-                    style.font.size = Pt(14)
-                    style.font.bold = True
-                else:
-                    style.font.size = Pt(12)
-                    style.font.bold = True
-            except Exception:
-                # If style creation fails, we'll just use default formatting
-                pass
+            style = doc.styles.add_style(style_name, WD_STYLE_TYPE.PARAGRAPH)
+            if i == 1:
+                style.font.size = Pt(16)
+                style.font.bold = True
+            elif i == 2:
+                style.font.size = Pt(14)
+                style.font.bold = True
+            else:
+                style.font.size = Pt(12)
+                style.font.bold = True
+        except Exception:
+            # If style creation fails, we'll just use default formatting
+            pass
 
 
 def ensure_table_style(doc):
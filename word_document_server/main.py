@@ -56,7 +56,9 @@ def register_tools():
     # Extended document tools
     mcp.tool()(extended_document_tools.get_paragraph_text_from_document)
     mcp.tool()(extended_document_tools.find_text_in_document)
+    mcp.tool()(extended_document_tools.find_many_texts)
     mcp.tool()(extended_document_tools.convert_to_pdf)
+    mcp.tool()(extended_document_tools.convert_documents_to_pdf)
     mcp.tool()(extended_document_tools.get_document_structure_details_from_document)
     mcp.tool()(extended_document_tools.get_table_cell_content_from_document)
     mcp.tool()(extended_document_tools.set_table_cell_text)
@@ -66,6 +68,7 @@ def register_tools():
     mcp.tool()(extended_document_tools.add_paragraph_to_table_cell)
     mcp.tool()(extended_document_tools.search_and_replace_in_scope)
     mcp.tool()(extended_document_tools.is_element_empty)
+    mcp.tool()(extended_document_tools.document_batch_ops)
 
     # Imaging tools
     mcp.tool()(imaging_tools.get_document_page_images)
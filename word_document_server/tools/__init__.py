@@ -5,72 +5,69 @@ This package contains the MCP tool implementations that expose functionality
 to clients through the Model Context Protocol.
 """
 
-# Document tools
-from word_document_server.tools.document_tools import (
-    create_document,
-    get_document_info,
-    get_document_text,
-    get_document_outline,
-    list_available_documents,
-    copy_document,
-    merge_documents,
-)
+import importlib
 
-# Content tools
-from word_document_server.tools.content_tools import (
-    add_heading,
-    add_paragraph,
-    add_table,
-    add_picture,
-    add_page_break,
-    add_table_of_contents,
-    delete_paragraph,
-    search_and_replace,
-)
+# Tool modules are imported on first attribute access, so importing this
+# package (or a single tool module) does not pull in every tool and its
+# dependencies up front.
+_LAZY = {
+    # Document tools
+    "create_document": "word_document_server.tools.document_tools",
+    "get_document_info": "word_document_server.tools.document_tools",
+    "get_document_text": "word_document_server.tools.document_tools",
+    "get_document_outline": "word_document_server.tools.document_tools",
+    "list_available_documents": "word_document_server.tools.document_tools",
+    "copy_document": "word_document_server.tools.document_tools",
+    "merge_documents": "word_document_server.tools.document_tools",
 
-# Format tools
-from word_document_server.tools.format_tools import (
-    format_text,
-    create_custom_style,
-    format_table,
-)
+    # Content tools
+    "add_heading": "word_document_server.tools.content_tools",
+    "add_paragraph": "word_document_server.tools.content_tools",
+    "add_table": "word_document_server.tools.content_tools",
+    "add_picture": "word_document_server.tools.content_tools",
+    "add_page_break": "word_document_server.tools.content_tools",
+    "add_table_of_contents": "word_document_server.tools.content_tools",
+    "delete_paragraph": "word_document_server.tools.content_tools",
+    "search_and_replace": "word_document_server.tools.content_tools",
 
-# Protection tools
-from word_document_server.tools.protection_tools import (
-    protect_document,
-    add_restricted_editing,
-    add_digital_signature,
-    verify_document,
-)
+    # Format tools
+    "format_text": "word_document_server.tools.format_tools",
+    "create_custom_style": "word_document_server.tools.format_tools",
+    "format_table": "word_document_server.tools.format_tools",
 
-# Footnote tools
-from word_document_server.tools.footnote_tools import (
-    add_footnote_to_document,
-    add_endnote_to_document,
-    convert_footnotes_to_endnotes_in_document,
-    customize_footnote_style,
-)
+    # Protection tools
+    "protect_document": "word_document_server.tools.protection_tools",
+    "add_restricted_editing": "word_document_server.tools.protection_tools",
+    "add_digital_signature": "word_document_server.tools.protection_tools",
+    "verify_document": "word_document_server.tools.protection_tools",
 
-# Extended document tools
-from word_document_server.tools.extended_document_tools import (
-    get_paragraph_text_from_document,
-    find_text_in_document,
-    convert_to_pdf,
-    get_document_structure_details_from_document,
-    get_table_cell_content_from_document,
-    set_table_cell_text,
-    set_paragraph_text,
-    insert_paragraph_after_index,
-    clear_table_cell_content,
-    add_paragraph_to_table_cell,
-    search_and_replace_in_scope,
-    is_element_empty,
-)
+    # Footnote tools
+    "add_footnote_to_document": "word_document_server.tools.footnote_tools",
+    "add_endnote_to_document": "word_document_server.tools.footnote_tools",
+    "convert_footnotes_to_endnotes_in_document": "word_document_server.tools.footnote_tools",
+    "customize_footnote_style": "word_document_server.tools.footnote_tools",
+
+    # Extended document tools
+    "get_paragraph_text_from_document": "word_document_server.tools.extended_document_tools",
+    "find_text_in_document": "word_document_server.tools.extended_document_tools",
+    "find_many_texts": "word_document_server.tools.extended_document_tools",
+    "convert_to_pdf": "word_document_server.tools.extended_document_tools",
+    "convert_documents_to_pdf": "word_document_server.tools.extended_document_tools",
+    "get_document_structure_details_from_document": "word_document_server.tools.extended_document_tools",
+    "get_table_cell_content_from_document": "word_document_server.tools.extended_document_tools",
+    "set_table_cell_text": "word_document_server.tools.extended_document_tools",
+    "set_paragraph_text": "word_document_server.tools.extended_document_tools",
+    "insert_paragraph_after_index": "word_document_server.tools.extended_document_tools",
+    "clear_table_cell_content": "word_document_server.tools.extended_document_tools",
+    "add_paragraph_to_table_cell": "word_document_server.tools.extended_document_tools",
+    "search_and_replace_in_scope": "word_document_server.tools.extended_document_tools",
+    "is_element_empty": "word_document_server.tools.extended_document_tools",
+    "document_batch_ops": "word_document_server.tools.extended_document_tools",
+
+    # Imaging tools
+    "get_document_page_images": "word_document_server.tools.imaging_tools",
+}
 
-# Imaging tools
-from word_document_server.tools.imaging_tools import (
-    get_document_page_images,
-)
 
 __all__ = [
     # Document tools
@@ -107,7 +104,9 @@ __all__ = [
     # Extended document tools
     "get_paragraph_text_from_document",
     "find_text_in_document",
+    "find_many_texts",
     "convert_to_pdf",
+    "convert_documents_to_pdf",
     "get_document_structure_details_from_document",
     "get_table_cell_content_from_document",
     "set_table_cell_text",
@@ -117,6 +116,18 @@ __all__ = [
     "add_paragraph_to_table_cell",
     "search_and_replace_in_scope",
     "is_element_empty",
+    "document_batch_ops",
     # Imaging tools
     "get_document_page_images",
 ]
+
+
+def __getattr__(name):
+    """Import the tool module that defines ``name`` and cache the attribute."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -5,6 +5,7 @@ These tools add various types of content to Word documents,
 including headings, paragraphs, tables, images, and page breaks.
 """
 
+import asyncio
 import os
 from typing import List, Optional
 from docx import Document
@@ -13,11 +14,26 @@ from docx.shared import Inches, Pt
 from word_document_server.utils.file_utils import (
     check_file_writeable,
     ensure_docx_extension,
+    save_document,
+    write_lock,
+)
+from word_document_server.utils.doc_cache import (
+    load_document,
+    checkout_document,
+    checkin_document,
+    invalidate,
 )
 from word_document_server.utils.document_utils import find_and_replace_text
 from word_document_server.core.styles import ensure_heading_style
 
 
+def _save(doc, filename: str) -> None:
+    """Save a checked-out document and keep it parsed for the next edit of the file."""
+    save_document(doc, filename)
+    checkin_document(filename, doc)
+    invalidate(filename)
+
+
 async def add_heading(filename: str, text: str, level: int = 1) -> str:
     """Add a heading to a Word document.
 
@@ -47,8 +63,8 @@ async def add_heading(filename: str, text: str, level: int = 1) -> str:
         # Suggest creating a copy
         return f"Cannot modify document: {error_message}. Consider creating a copy first or creating a new document."
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Ensure heading styles exist
         ensure_heading_style(doc)
@@ -56,7 +72,7 @@ async def add_heading(filename: str, text: str, level: int = 1) -> str:
         # Try to add heading with style
         try:
             doc.add_heading(text, level=level)
-            doc.save(filename)
+            _save(doc, filename)
             return f"Heading '{text}' (level {level}) added to {filename}"
         except Exception:
             # If style-based approach fails, use direct formatting
@@ -72,8 +88,12 @@ async def add_heading(filename: str, text: str, level: int = 1) -> str:
             else:
                 run.font.size = Pt(12)
 
-            doc.save(filename)
+            _save(doc, filename)
             return f"Heading '{text}' added to {filename} with direct formatting (style not available)"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add heading: {str(e)}"
 
@@ -97,8 +117,8 @@ async def add_paragraph(filename: str, text: str, style: Optional[str] = None) -
         # Suggest creating a copy
         return f"Cannot modify document: {error_message}. Consider creating a copy first or creating a new document."
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
         paragraph = doc.add_paragraph(text)
 
         if style:
@@ -107,11 +127,15 @@ async def add_paragraph(filename: str, text: str, style: Optional[str] = None) -
             except KeyError:
                 # Style doesn't exist, use normal and report it
                 paragraph.style = doc.styles["Normal"]
-                doc.save(filename)
+                _save(doc, filename)
                 return f"Style '{style}' not found, paragraph added with default style to {filename}"
 
-        doc.save(filename)
+        _save(doc, filename)
         return f"Paragraph added to {filename}"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add paragraph: {str(e)}"
 
@@ -138,8 +162,8 @@ async def add_table(
         # Suggest creating a copy
         return f"Cannot modify document: {error_message}. Consider creating a copy first or creating a new document."
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
         table = doc.add_table(rows=rows, cols=cols)
 
         # Try to set the table style
@@ -159,8 +183,12 @@ async def add_table(
                         break
                     table.cell(i, j).text = str(cell_text)
 
-        doc.save(filename)
+        _save(doc, filename)
         return f"Table ({rows}x{cols}) added to {filename}"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add table: {str(e)}"
 
@@ -202,8 +230,8 @@ async def add_picture(
     if not is_writeable:
         return f"Cannot modify document: {error_message}. Consider creating a copy first or creating a new document."
 
-    try:
-        doc = Document(abs_filename)
+    def _write():
+        doc = checkout_document(abs_filename)
         # Additional diagnostic info
         diagnostic = f"Attempting to add image ({abs_image_path}, {image_size:.2f} KB) to document ({abs_filename})"
 
@@ -212,13 +240,17 @@ async def add_picture(
                 doc.add_picture(abs_image_path, width=Inches(width))
             else:
                 doc.add_picture(abs_image_path)
-            doc.save(abs_filename)
+            _save(doc, abs_filename)
             return f"Picture {image_path} added to {filename}"
         except Exception as inner_error:
             # More detailed error for the specific operation
             error_type = type(inner_error).__name__
             error_msg = str(inner_error)
             return f"Failed to add picture: {error_type} - {error_msg or 'No error details available'}\nDiagnostic info: {diagnostic}"
+
+    try:
+        async with write_lock(abs_filename):
+            return await asyncio.to_thread(_write)
     except Exception as outer_error:
         # Fallback error handling
         error_type = type(outer_error).__name__
@@ -244,11 +276,15 @@ async def add_page_break(filename: str) -> str:
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
         doc.add_page_break()
-        doc.save(filename)
+        _save(doc, filename)
         return f"Page break added to {filename}."
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add page break: {str(e)}"
 
@@ -275,11 +311,12 @@ async def add_table_of_contents(
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        # Ensure max_level is within valid range
-        max_level = max(1, min(max_level, 9))
+    # Ensure max_level is within valid range
+    max_level = max(1, min(max_level, 9))
 
-        doc = Document(filename)
+    def _write():
+        # The source is only read; the result is built in a new document
+        doc = load_document(filename)
 
         # Collect headings and their positions
         headings = []
@@ -337,9 +374,14 @@ async def add_table_of_contents(
                         new_table.cell(i, j).text = paragraph.text
 
         # Save the new document with TOC
-        toc_doc.save(filename)
+        save_document(toc_doc, filename)
+        invalidate(filename)
 
         return f"Table of contents with {len(headings)} entries added to {filename}"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add table of contents: {str(e)}"
 
@@ -363,8 +405,8 @@ async def delete_paragraph(filename: str, paragraph_index: int) -> str:
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Validate paragraph index
         if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
@@ -376,8 +418,12 @@ async def delete_paragraph(filename: str, paragraph_index: int) -> str:
         p = paragraph._p
         p.getparent().remove(p)
 
-        doc.save(filename)
+        _save(doc, filename)
         return f"Paragraph at index {paragraph_index} deleted successfully."
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to delete paragraph: {str(e)}"
 
@@ -402,16 +448,20 @@ async def search_and_replace(filename: str, find_text: str, replace_text: str) -
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Perform find and replace
         count = find_and_replace_text(doc, find_text, replace_text)
 
         if count > 0:
-            doc.save(filename)
+            _save(doc, filename)
             return f"Replaced {count} occurrence(s) of '{find_text}' with '{replace_text}'."
         else:
             return f"No occurrences of '{find_text}' found."
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to search and replace: {str(e)}"
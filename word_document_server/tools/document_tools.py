@@ -3,16 +3,25 @@ Document creation and manipulation tools for Word Document Server.
 """
 
 import os
-import json
-from typing import List, Optional
+import re
+import hashlib
+from typing import Dict, List, Optional, Tuple
 from docx import Document
 import asyncio
+from copy import deepcopy
+from docx.opc.part import Part
+from docx.oxml.ns import qn
 
 from word_document_server.utils.file_utils import (
     check_file_writeable,
     ensure_docx_extension,
     create_document_copy,
+    save_document,
+    write_lock,
 )
+from word_document_server.utils.doc_cache import load_document
+from word_document_server.utils.fast_props import read_props
+from word_document_server.utils.json_utils import dumps
 from word_document_server.utils.document_utils import (
     get_document_properties,
     extract_document_text,
@@ -21,6 +30,91 @@ from word_document_server.utils.document_utils import (
 from word_document_server.core.styles import ensure_heading_style, ensure_table_style
 
 
+_P_TAG = qn("w:p")
+_TBL_TAG = qn("w:tbl")
+
+# Attributes in this namespace (r:embed, r:id, r:link, ...) name package relationships
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+# Elements dropped as a whole when the part they reference cannot be carried over
+_OBJECT_TAGS = {qn("w:drawing"), qn("w:object"), qn("w:pict")}
+_ALTERNATE_CONTENT_TAG = "{http://schemas.openxmlformats.org/markup-compatibility/2006}AlternateContent"
+
+
+def _partname_template(partname: str) -> str:
+    """Turn /word/media/image3.png into /word/media/image%d.png for next_partname."""
+    return re.sub(r"\d*(\.[^./]*)?$", lambda m: "%d" + (m.group(1) or ""), partname, count=1)
+
+
+def _copy_relationship(
+    rel, target_doc, copied_parts: Dict[Tuple[str, str, str], Part]
+) -> Optional[str]:
+    """
+    Recreate a source relationship on the target's main document part.
+
+    External targets (hyperlinks, linked images) are re-linked; internal parts are
+    copied when they have no relationships of their own, which covers images and
+    embedded files. Returns the new rId, or None if the target cannot be carried over.
+    """
+    target_part = target_doc.part
+    if rel.is_external:
+        return target_part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+
+    source_part = rel.target_part
+    if len(source_part.rels):
+        # e.g. charts and diagrams, which reference further parts
+        return None
+
+    blob = source_part.blob
+    key = (hashlib.sha1(blob).hexdigest(), source_part.content_type, rel.reltype)
+    part = copied_parts.get(key)
+    if part is None:
+        package = target_part.package
+        partname = package.next_partname(_partname_template(source_part.partname))
+        part = copied_parts[key] = Part(partname, source_part.content_type, blob, package)
+    return target_part.relate_to(part, rel.reltype)
+
+
+def _remap_relationships(
+    clone, source_doc, target_doc, rid_map: Dict[str, Optional[str]], copied_parts
+) -> None:
+    """
+    Point every relationship reference in a cloned element at the target package.
+
+    References that cannot be carried over take their drawing, object or picture
+    with them, so the merged package never holds a dangling rId.
+    """
+    source_rels = source_doc.part.rels
+    unsupported = []
+    for elem in clone.iter():
+        for name, rid in elem.items():
+            if not name.startswith(_R_NS):
+                continue
+            if rid not in rid_map:
+                rel = source_rels.get(rid)
+                rid_map[rid] = (
+                    _copy_relationship(rel, target_doc, copied_parts) if rel is not None else None
+                )
+            if rid_map[rid] is None:
+                unsupported.append(elem)
+                break
+            elem.set(name, rid_map[rid])
+
+    for elem in unsupported:
+        # Drop the enclosing drawing or object, together with any mc:AlternateContent
+        # wrapper offering it; other elements (e.g. a header reference) go on their own
+        doomed = next((a for a in elem.iterancestors() if a.tag in _OBJECT_TAGS), elem)
+        doomed = next(doomed.iterancestors(_ALTERNATE_CONTENT_TAG), doomed)
+        parent = doomed.getparent()
+        if parent is None:
+            # Already removed with an earlier element
+            continue
+        if doomed.tag == qn("w:hyperlink"):
+            # Keep the link text; only the link itself is lost
+            for child in list(doomed):
+                doomed.addprevious(child)
+        parent.remove(doomed)
+
+
 async def create_document(
     filename: str, title: Optional[str] = None, author: Optional[str] = None
 ) -> str:
@@ -54,7 +148,7 @@ async def create_document(
     if not is_writeable:
         return f"Cannot create document: {error_message}"
 
-    try:
+    def _build():
         doc = Document()
 
         # Set properties if provided
@@ -68,14 +162,21 @@ async def create_document(
         ensure_table_style(doc)
 
         # Save the document
-        doc.save(filename)
+        save_document(doc, filename)
+
+    try:
+        # Building and saving the package is blocking work; keep it off the event loop
+        async with write_lock(filename):
+            await asyncio.to_thread(_build)
 
         return f"Document {filename} created successfully"
     except Exception as e:
         return f"Failed to create document: {str(e)}"
 
 
-async def get_document_info(filename: str) -> str:
+async def get_document_info(
+    filename: str, include_statistics: bool = True, pretty: bool = False
+) -> str:
     """Get comprehensive metadata and statistics about a Word document (.docx only).
 
     Extracts document properties, creation/modification dates, word count, paragraph count,
@@ -89,12 +190,17 @@ async def get_document_info(filename: str) -> str:
 
     Args:
         filename: Path to the Word document (.docx format only)
+        include_statistics: If True (default), count words, paragraphs, tables and sections
+            from the document body. If False, only the small metadata parts are read, which
+            is much faster for large documents.
+        pretty: If True, indent the JSON output for readability (default: False)
 
     Returns:
         JSON formatted string containing:
         - title, author, subject, keywords
         - created/modified dates and last modified by
-        - word count, paragraph count, table count, page count
+        - word count, paragraph count, table count, page count (with include_statistics)
+        - app_statistics as recorded by the authoring application (without include_statistics)
         - revision number
         - error message if document doesn't exist or can't be read
 
@@ -102,6 +208,7 @@ async def get_document_info(filename: str) -> str:
         - Only works with .docx format (Microsoft Word 2007+)
         - Cannot read password-protected documents
         - Word count may not match Word's count exactly for complex formatting
+        - app_statistics are only refreshed by Word and may be stale after edits by other tools
     """
     filename = ensure_docx_extension(filename)
 
@@ -109,8 +216,11 @@ async def get_document_info(filename: str) -> str:
         return f"Document {filename} does not exist"
 
     try:
-        properties = get_document_properties(filename)
-        return json.dumps(properties, indent=2)
+        if include_statistics:
+            properties = get_document_properties(filename)
+        else:
+            properties = read_props(filename)
+        return dumps(properties, pretty=pretty)
     except Exception as e:
         return f"Failed to get document info: {str(e)}"
 
@@ -122,7 +232,7 @@ async def get_document_text(filename: str) -> str:
     return await asyncio.to_thread(document_utils.get_document_text, filename)
 
 
-async def get_document_outline(filename: str) -> str:
+async def get_document_outline(filename: str, pretty: bool = False) -> str:
     """Get structural overview of a Word document (.docx only) without full content.
 
     Provides a summary of document structure including paragraph previews and table
@@ -137,6 +247,7 @@ async def get_document_outline(filename: str) -> str:
 
     Args:
         filename: Path to the Word document (.docx format only)
+        pretty: If True, indent the JSON output for readability (default: False)
 
     Returns:
         JSON formatted string containing:
@@ -153,7 +264,7 @@ async def get_document_outline(filename: str) -> str:
     filename = ensure_docx_extension(filename)
 
     structure = get_document_structure(filename)
-    return json.dumps(structure, indent=2)
+    return dumps(structure, pretty=pretty)
 
 
 async def list_available_documents(directory: str = ".") -> str:
@@ -184,18 +295,18 @@ async def list_available_documents(directory: str = ".") -> str:
         if not os.path.exists(directory):
             return f"Directory {directory} does not exist"
 
-        docx_files = [f for f in os.listdir(directory) if f.endswith(".docx")]
+        # scandir entries carry the file type from the directory read itself
+        with os.scandir(directory) as it:
+            entries = [e for e in it if e.is_file() and e.name.endswith(".docx")]
 
-        if not docx_files:
+        if not entries:
             return f"No Word documents found in {directory}"
 
-        result = f"Found {len(docx_files)} Word documents in {directory}:\n"
-        for file in docx_files:
-            file_path = os.path.join(directory, file)
-            size = os.path.getsize(file_path) / 1024  # KB
-            result += f"- {file} ({size:.2f} KB)\n"
-
-        return result
+        lines = [
+            f"- {e.name} ({e.stat().st_size / 1024:.2f} KB)\n"  # KB
+            for e in entries
+        ]
+        return f"Found {len(entries)} Word documents in {directory}:\n" + "".join(lines)
     except Exception as e:
         return f"Failed to list documents: {str(e)}"
 
@@ -232,8 +343,8 @@ async def copy_document(
     if destination_filename:
         destination_filename = ensure_docx_extension(destination_filename)
 
-    success, message, new_path = create_document_copy(
-        source_filename, destination_filename
+    success, message, new_path = await asyncio.to_thread(
+        create_document_copy, source_filename, destination_filename
     )
     if success:
         return message
@@ -247,8 +358,9 @@ async def merge_documents(
     """Merge multiple Word documents (.docx only) into a single document.
 
     Combines multiple Word documents by copying all paragraphs and tables from
-    source documents into a new target document. Attempts to preserve basic
-    formatting but may not maintain complex styles perfectly.
+    source documents into a new target document. Paragraph and table XML is
+    cloned as-is, so run-level formatting is preserved. Images, embedded files and
+    hyperlinks are copied along with the parts and relationships they reference.
 
     Use this tool when:
     - Combining multiple related documents into one
@@ -266,21 +378,19 @@ async def merge_documents(
 
     Process:
         - Creates new document with content from all sources in order
-        - Copies paragraphs maintaining text and basic formatting
-        - Copies tables with structure and content
-        - Attempts to match styles when possible
+        - Clones paragraphs and tables in their original order with full formatting
+        - Keeps style references; styles missing from the target fall back to defaults
         - Adds page breaks between documents if requested
 
     Limitations:
         - Only works with .docx format (Microsoft Word 2007+)
-        - Complex formatting may not be preserved perfectly
+        - Charts, diagrams and other objects whose parts reference further parts are left out
+        - Numbering, footnotes and comments are not merged
         - Document order is the order in source_filenames list
         - Cannot merge password-protected documents
         - Some advanced features (headers/footers, sections) not copied
         - Style conflicts resolved by using target document styles
     """
-    from word_document_server.core.tables import copy_table
-
     target_filename = ensure_docx_extension(target_filename)
 
     # Check if target file is writeable
@@ -288,60 +398,52 @@ async def merge_documents(
     if not is_writeable:
         return f"Cannot create target document: {error_message}"
 
-    # Validate all source documents exist
-    missing_files = []
-    for filename in source_filenames:
-        doc_filename = ensure_docx_extension(filename)
-        if not os.path.exists(doc_filename):
-            missing_files.append(doc_filename)
+    doc_filenames = [ensure_docx_extension(filename) for filename in source_filenames]
+
+    # Validate all source documents exist before parsing any of them
+    missing_files = [f for f in doc_filenames if not os.path.exists(f)]
 
     if missing_files:
         return f"Cannot merge documents. The following source files do not exist: {', '.join(missing_files)}"
 
     try:
+        # Parse all sources concurrently; unzipping and XML parsing run off the event loop
+        source_docs = await asyncio.gather(
+            *[asyncio.to_thread(load_document, doc_filename) for doc_filename in doc_filenames]
+        )
+
         # Create a new document for the merged result
         target_doc = Document()
 
+        target_body = target_doc.element.body
+        # The body must end with its section properties, so clones go before them
+        target_sect_pr = target_body.sectPr
+
+        # Parts copied into the target, keyed by content, so repeated images are stored once
+        copied_parts = {}
+
         # Process each source document
-        for i, filename in enumerate(source_filenames):
-            doc_filename = ensure_docx_extension(filename)
-            source_doc = Document(doc_filename)
+        # Cached documents are shared, so the sources are only ever read here
+        for i, source_doc in enumerate(source_docs):
+            # Source rId -> target rId (None when the target cannot be carried over)
+            rid_map = {}
 
             # Add page break between documents (except before the first one)
             if add_page_breaks and i > 0:
                 target_doc.add_page_break()
 
-            # Copy all paragraphs
-            for paragraph in source_doc.paragraphs:
-                # Create a new paragraph with the same text and style
-                new_paragraph = target_doc.add_paragraph(paragraph.text)
-                new_paragraph.style = target_doc.styles["Normal"]  # Default style
-
-                # Try to match the style if possible
-                try:
-                    if paragraph.style and paragraph.style.name in target_doc.styles:
-                        new_paragraph.style = target_doc.styles[paragraph.style.name]
-                except Exception:
-                    pass
-
-                # Copy run formatting
-                for i, run in enumerate(paragraph.runs):
-                    if i < len(new_paragraph.runs):
-                        new_run = new_paragraph.runs[i]
-                        # Copy basic formatting
-                        new_run.bold = run.bold
-                        new_run.italic = run.italic
-                        new_run.underline = run.underline
-                        # Font size if specified
-                        if run.font.size:
-                            new_run.font.size = run.font.size
-
-            # Copy all tables
-            for table in source_doc.tables:
-                copy_table(table, target_doc)
+            # Clone paragraphs and tables in document order, keeping all formatting
+            for child in source_doc.element.body.iterchildren(_P_TAG, _TBL_TAG):
+                clone = deepcopy(child)
+                _remap_relationships(clone, source_doc, target_doc, rid_map, copied_parts)
+                if target_sect_pr is not None:
+                    target_sect_pr.addprevious(clone)
+                else:
+                    target_body.append(clone)
 
         # Save the merged document
-        target_doc.save(target_filename)
+        async with write_lock(target_filename):
+            await asyncio.to_thread(save_document, target_doc, target_filename)
         return f"Successfully merged {len(source_filenames)} documents into {target_filename}"
     except Exception as e:
         return f"Failed to merge documents: {str(e)}"
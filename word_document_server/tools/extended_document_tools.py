@@ -6,38 +6,60 @@ detailed content inspection, targeted editing, and scope-specific operations.
 """
 
 import os
-import json
+import asyncio
 import subprocess
-import platform
 import shutil
-from typing import Optional
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
 
 from word_document_server.utils.file_utils import (
     check_file_writeable,
     ensure_docx_extension,
+    save_document,
+    write_lock,
+)
+from word_document_server.utils.doc_cache import (
+    cached_document,
+    load_derived,
+    checkout_document,
+    checkin_document,
+    invalidate,
+)
+from word_document_server.utils.json_utils import dumps
+from word_document_server.utils.conversion_utils import (
+    SYSTEM,
+    find_libreoffice,
+    convert_with_lo_server,
+    get_docx2pdf_convert,
 )
 from word_document_server.utils.paragraph_utils import (
     get_paragraph_text,
-    set_paragraph_text_util,
-    insert_paragraph_after_index_util,
+    set_paragraph_text_in_document,
+    insert_paragraph_after_index_in_document,
 )
 
-from word_document_server.utils.document_analyzer import DocumentAnalyzer
+from word_document_server.utils.document_analyzer import (
+    DocumentAnalyzer,
+    find_text_streaming,
+    find_many_texts_streaming,
+    get_complete_structure_streaming,
+    iter_structure_streaming,
+)
+from word_document_server.utils.doc_structure_utils import shared_analyzer
 from word_document_server.utils.table_manager import TableManager, CellLocation
 from word_document_server.utils.formatted_editor import FormattedEditor, ScopeLocation
 
 
-def _validate_file_exists(filename: str) -> Optional[str]:
-    """Validate that a file exists and return user-friendly error if not."""
-    if not os.path.exists(filename):
-        return f"The document '{filename}' could not be found. Please check the file path and try again."
-    return None
+# Error templates are only formatted when validation fails
+_ERR_NEGATIVE_INDEX = "The {name} must be 0 or greater (you provided {value}). {kind} start from 0."
+_ERR_FILE_NOT_FOUND = "The document '{filename}' could not be found. Please check the file path and try again."
+_ERR_NOT_WRITABLE = "Cannot modify the document: File {filename} is not writeable (permission denied). Try creating a copy first or check file permissions."
 
 
 def _validate_non_negative_index(value: int, param_name: str) -> Optional[str]:
     """Validate that an index is non-negative and return user-friendly error if not."""
     if value < 0:
-        return f"The {param_name} must be 0 or greater (you provided {value}). Indexes start from 0."
+        return _ERR_NEGATIVE_INDEX.format(name=param_name, value=value, kind="Indexes")
     return None
 
 
@@ -45,21 +67,59 @@ def _validate_table_coordinates(
     table_index: int, row_index: int, col_index: int
 ) -> Optional[str]:
     """Validate table coordinates and return user-friendly error if invalid."""
-    if table_index < 0:
-        return f"The table_index must be 0 or greater (you provided {table_index}). Table indexes start from 0."
-    if row_index < 0:
-        return f"The row_index must be 0 or greater (you provided {row_index}). Row indexes start from 0."
-    if col_index < 0:
-        return f"The col_index must be 0 or greater (you provided {col_index}). Column indexes start from 0."
-    return None
+    if table_index >= 0 and row_index >= 0 and col_index >= 0:
+        return None
+    for name, value, kind in (
+        ("table_index", table_index, "Table indexes"),
+        ("row_index", row_index, "Row indexes"),
+        ("col_index", col_index, "Column indexes"),
+    ):
+        if value < 0:
+            return _ERR_NEGATIVE_INDEX.format(name=name, value=value, kind=kind)
 
 
-def _check_file_writable(filename: str) -> Optional[str]:
-    """Check if file is writable and return user-friendly error if not."""
-    is_writeable, error_message = check_file_writeable(filename)
-    if not is_writeable:
-        return f"Cannot modify the document: {error_message}. Try creating a copy first or check file permissions."
-    return None
+def _stat_or_error(
+    filename: str, write: bool = False
+) -> Tuple[Optional[os.stat_result], Optional[str]]:
+    """
+    Stat a file once, checking that it exists and optionally that it is writable.
+
+    The stat result is handed on to the document cache so it does not stat again.
+    """
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None, _ERR_FILE_NOT_FOUND.format(filename=filename)
+    if write and not os.access(filename, os.W_OK):
+        return None, _ERR_NOT_WRITABLE.format(filename=filename)
+    return st, None
+
+
+def _get_analyzer(filename: str, st: Optional[os.stat_result] = None) -> DocumentAnalyzer:
+    """Analyzer for the cached document, shared until the file changes."""
+    return shared_analyzer(filename, st)
+
+
+def _get_table_reader(filename: str, st: Optional[os.stat_result] = None) -> TableManager:
+    """Read-only TableManager for the cached document, shared until the file changes."""
+    def _build(doc):
+        manager = TableManager.from_document(doc, filename)
+        manager.autosave = False
+        return manager
+
+    return load_derived(filename, "table_reader", _build, st)
+
+
+# Valid scope types and the keys each needs in its scope_identifier.
+# The usage hint is shown when any of the keys are missing.
+_SCOPE_REQUIRED_KEYS = {
+    "paragraph": ("paragraph_index",),
+    "table_cell": ("table_index", "row_index", "col_index"),
+}
+_SCOPE_USAGE = {
+    "paragraph": 'For paragraph scope, use: {"paragraph_index": 0}',
+    "table_cell": 'For table_cell scope, use: {"table_index": 0, "row_index": 1, "col_index": 2}. Missing: ',
+}
 
 
 def _validate_scope_identifier(
@@ -69,19 +129,34 @@ def _validate_scope_identifier(
     if not isinstance(scope_identifier, dict):
         return "The scope_identifier must be a dictionary. See the function documentation for examples."
 
-    if scope_type == "paragraph":
-        if "paragraph_index" not in scope_identifier:
-            return 'For paragraph scope, use: {"paragraph_index": 0}'
-    elif scope_type == "table_cell":
-        required_keys = ["table_index", "row_index", "col_index"]
-        missing_keys = [key for key in required_keys if key not in scope_identifier]
-        if missing_keys:
-            return f'For table_cell scope, use: {{"table_index": 0, "row_index": 1, "col_index": 2}}. Missing: {missing_keys}'
-
-    return None
-
-
-async def get_paragraph_text_from_document(filename: str, paragraph_index: int) -> str:
+    required_keys = _SCOPE_REQUIRED_KEYS.get(scope_type, ())
+    if all(key in scope_identifier for key in required_keys):
+        return None
+
+    missing_keys = [key for key in required_keys if key not in scope_identifier]
+    if scope_type == "table_cell":
+        return f"{_SCOPE_USAGE[scope_type]}{missing_keys}"
+    return _SCOPE_USAGE[scope_type]
+
+
+# ScopeLocation builders per scope type; identifiers are validated before use
+_SCOPE_BUILDERS = {
+    "paragraph": lambda identifier: ScopeLocation(
+        scope_type="paragraph",
+        paragraph_index=identifier["paragraph_index"],
+    ),
+    "table_cell": lambda identifier: ScopeLocation(
+        scope_type="table_cell",
+        table_index=identifier["table_index"],
+        row_index=identifier["row_index"],
+        col_index=identifier["col_index"],
+    ),
+}
+
+
+async def get_paragraph_text_from_document(
+    filename: str, paragraph_index: int, pretty: bool = False
+) -> str:
     """Get text content from a specific paragraph in a Word document (.docx only).
 
     Retrieves the complete text content and metadata from a single paragraph by index.
@@ -96,6 +171,7 @@ async def get_paragraph_text_from_document(filename: str, paragraph_index: int)
     Args:
         filename: Path to the Word document (.docx format only)
         paragraph_index: Index of the paragraph to read (0-based, first paragraph = 0)
+        pretty: If True, indent the JSON output for readability (default: False)
 
     Returns:
         JSON string containing:
@@ -118,21 +194,29 @@ async def get_paragraph_text_from_document(filename: str, paragraph_index: int)
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    _, error = _stat_or_error(filename)
+    if error:
         return error
 
     if error := _validate_non_negative_index(paragraph_index, "paragraph_index"):
         return error
 
+    def _read():
+        return dumps(get_paragraph_text(filename, paragraph_index), pretty=pretty)
+
     try:
-        result = get_paragraph_text(filename, paragraph_index)
-        return json.dumps(result, indent=2)
+        return await asyncio.to_thread(_read)
     except Exception as e:
         return f"Unable to read paragraph text: {str(e)}"
 
 
 async def find_text_in_document(
-    filename: str, text_to_find: str, match_case: bool = True, whole_word: bool = False
+    filename: str,
+    text_to_find: str,
+    match_case: bool = True,
+    whole_word: bool = False,
+    pretty: bool = False,
+    count_only: bool = False,
 ) -> str:
     """Find all occurrences of text in a Word document (.docx only) with precise location details.
 
@@ -150,11 +234,14 @@ async def find_text_in_document(
         text_to_find: Text string to search for (cannot be empty)
         match_case: Whether search should be case-sensitive (default: True)
         whole_word: Whether to match whole words only (default: False)
+        pretty: If True, indent the JSON output for readability (default: False)
+        count_only: If True, return only the total count without the matches, which is
+            much faster and smaller when there are many of them (default: False)
 
     Returns:
         JSON string containing:
         - query details (search text, options used)
-        - array of all matches with locations
+        - array of all matches with locations (omitted with count_only)
         - total count of matches
         - context text around each match
         - table/paragraph location details for each match
@@ -178,16 +265,91 @@ async def find_text_in_document(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    st, error = _stat_or_error(filename)
+    if error:
         return error
 
     if not text_to_find.strip():
         return "Please provide text to search for. Empty search text is not allowed."
 
+    def _find():
+        try:
+            result = find_text_streaming(
+                filename, text_to_find, match_case, whole_word, count_only
+            )
+        except Exception:
+            # Unusual packages (e.g. a non-standard main part name) need the full parser
+            result = _get_analyzer(filename, st).find_text(
+                text_to_find, match_case, whole_word, count_only
+            )
+        return dumps(result, pretty=pretty)
+
+    try:
+        # Parsing and searching are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(_find)
+    except Exception as e:
+        return f"Search failed: {str(e)}"
+
+
+async def find_many_texts(
+    filename: str,
+    texts_to_find: List[str],
+    match_case: bool = True,
+    whole_word: bool = False,
+    pretty: bool = False,
+) -> str:
+    """Find all occurrences of several texts in a Word document (.docx only) in one pass.
+
+    Equivalent to calling find_text_in_document once per text, but the document is
+    read and scanned only once, so searching for many terms costs about the same as
+    searching for one.
+
+    Use this tool when:
+    - Need to locate many different terms, names or placeholders at once
+    - Preparing several replacements in the same document
+
+    Args:
+        filename: Path to the Word document (.docx format only)
+        texts_to_find: List of texts to search for (empty strings are ignored)
+        match_case: Whether search should be case-sensitive (default: True)
+        whole_word: Whether to match whole words only (default: False)
+        pretty: If True, indent the JSON output for readability (default: False)
+
+    Returns:
+        JSON string containing:
+        - results: for each searched text, its occurrences (same format as
+          find_text_in_document) and their count
+        - total_count: number of matches across all texts
+
+    Limitations:
+        - Only works with .docx format (Microsoft Word 2007+)
+        - Does not search headers, footers, or footnotes
+
+    Example:
+        find_many_texts("contract.docx", ["{{name}}", "{{date}}", "{{amount}}"])
+    """
+    filename = ensure_docx_extension(filename)
+
+    # Validate inputs
+    st, error = _stat_or_error(filename)
+    if error:
+        return error
+
+    if not any(text.strip() for text in texts_to_find):
+        return "Please provide text to search for. Empty search text is not allowed."
+
+    def _find():
+        try:
+            result = find_many_texts_streaming(filename, texts_to_find, match_case, whole_word)
+        except Exception:
+            # Unusual packages (e.g. a non-standard main part name) need the full parser
+            result = _get_analyzer(filename, st).find_many_texts(
+                texts_to_find, match_case, whole_word
+            )
+        return dumps(result, pretty=pretty)
+
     try:
-        analyzer = DocumentAnalyzer(filename)
-        result = analyzer.find_text(text_to_find, match_case, whole_word)
-        return json.dumps(result, indent=2)
+        return await asyncio.to_thread(_find)
     except Exception as e:
         return f"Search failed: {str(e)}"
 
@@ -244,16 +406,9 @@ async def convert_to_pdf(filename: str, output_filename: Optional[str] = None) -
     elif not output_filename.lower().endswith(".pdf"):
         output_filename = f"{output_filename}.pdf"
 
-    # Convert to absolute path if not already
-    if not os.path.isabs(output_filename):
-        output_filename = os.path.abspath(output_filename)
-
-    # Ensure the output directory exists
+    # Work with an absolute path; its directory is computed and created once here
+    output_filename = os.path.abspath(output_filename)
     output_dir = os.path.dirname(output_filename)
-    if not output_dir:
-        output_dir = os.path.abspath(".")
-
-    # Create the directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
     # Check if output file can be written
@@ -261,145 +416,378 @@ async def convert_to_pdf(filename: str, output_filename: Optional[str] = None) -
     if not is_writeable:
         return f"Cannot create PDF: {error_message} (Path: {output_filename}, Dir: {output_dir})"
 
-    try:
-        # Determine platform for appropriate conversion method
-        system = platform.system()
+    def _convert():
+        try:
+            system = SYSTEM
 
-        if system == "Windows":
-            # On Windows, try docx2pdf which uses Microsoft Word
-            try:
-                from docx2pdf import convert
-
-                convert(filename, output_filename)
-                return f"Document successfully converted to PDF: {output_filename}"
-            except (ImportError, Exception) as e:
-                return f"Failed to convert document to PDF: {str(e)}\nNote: docx2pdf requires Microsoft Word to be installed."
-
-        elif system in ["Linux", "Darwin"]:  # Linux or macOS
-            # Try using LibreOffice if available (common on Linux/macOS)
-            try:
-                # Choose the appropriate command based on OS
-                if system == "Darwin":  # macOS
-                    lo_commands = [
-                        "soffice",
-                        "/Applications/LibreOffice.app/Contents/MacOS/soffice",
-                    ]
-                else:  # Linux
-                    lo_commands = ["libreoffice", "soffice"]
-
-                # Try each possible command
-                conversion_successful = False
-                errors = []
-
-                for cmd_name in lo_commands:
-                    try:
-                        # Construct LibreOffice conversion command
-                        output_dir = os.path.dirname(output_filename)
-                        # If output_dir is empty, use current directory
-                        if not output_dir:
-                            output_dir = "."
-                        # Ensure the directory exists
-                        os.makedirs(output_dir, exist_ok=True)
-
-                        cmd = [
-                            cmd_name,
-                            "--headless",
-                            "--convert-to",
-                            "pdf",
-                            "--outdir",
-                            output_dir,
-                            filename,
-                        ]
-
-                        result = subprocess.run(
-                            cmd, capture_output=True, text=True, timeout=60
-                        )
-
-                        if result.returncode == 0:
-                            # LibreOffice creates the PDF with the same basename
+            if system == "Windows":
+                # On Windows, try docx2pdf which uses Microsoft Word
+                try:
+                    get_docx2pdf_convert()(filename, output_filename)
+                    return f"Document successfully converted to PDF: {output_filename}"
+                except (ImportError, Exception) as e:
+                    return f"Failed to convert document to PDF: {str(e)}\nNote: docx2pdf requires Microsoft Word to be installed."
+
+            elif system in ["Linux", "Darwin"]:  # Linux or macOS
+                # Try using LibreOffice if available (common on Linux/macOS)
+                try:
+                    errors = []
+                    lo_binary = find_libreoffice()
+
+                    if lo_binary:
+                        # Convert into a scratch directory next to the output so the finished
+                        # PDF can be published with an atomic rename on the same filesystem
+                        work_dir = tempfile.mkdtemp(dir=output_dir)
+                        try:
                             base_name = os.path.basename(filename)
                             pdf_base_name = os.path.splitext(base_name)[0] + ".pdf"
-                            created_pdf = os.path.join(
-                                os.path.dirname(output_filename) or ".", pdf_base_name
+                            created_pdf = os.path.join(work_dir, pdf_base_name)
+
+                            # Prefer the already-running LibreOffice listener
+                            if convert_with_lo_server(filename, created_pdf):
+                                os.replace(created_pdf, output_filename)
+                                return f"Document successfully converted to PDF: {output_filename}"
+
+                            cmd = [
+                                lo_binary,
+                                "--headless",
+                                "--convert-to",
+                                "pdf",
+                                "--outdir",
+                                work_dir,
+                                filename,
+                            ]
+
+                            # Only stderr is ever reported, and only when the conversion fails
+                            result = subprocess.run(
+                                cmd,
+                                stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE,
+                                timeout=60,
                             )
 
-                            # If the created PDF is not at the desired location, move it
-                            if created_pdf != output_filename and os.path.exists(
-                                created_pdf
-                            ):
-                                shutil.move(created_pdf, output_filename)
-
-                            conversion_successful = True
-                            break  # Exit the loop if successful
-                        else:
-                            errors.append(f"{cmd_name} error: {result.stderr}")
-                    except (subprocess.SubprocessError, FileNotFoundError) as e:
-                        errors.append(f"{cmd_name} error: {str(e)}")
+                            if result.returncode == 0:
+                                # LibreOffice creates the PDF with the same basename
+                                os.replace(created_pdf, output_filename)
+                                return f"Document successfully converted to PDF: {output_filename}"
 
-                if conversion_successful:
-                    return f"Document successfully converted to PDF: {output_filename}"
-                else:
-                    # If all LibreOffice attempts failed, try docx2pdf as fallback
+                            errors.append(
+                                f"{lo_binary} error: {result.stderr.decode('utf-8', errors='replace')}"
+                            )
+                        except (subprocess.SubprocessError, OSError) as e:
+                            errors.append(f"{lo_binary} error: {str(e)}")
+                        finally:
+                            shutil.rmtree(work_dir, ignore_errors=True)
+                    else:
+                        errors.append("LibreOffice executable not found")
+
+                    # If LibreOffice is unavailable or failed, try docx2pdf as fallback
                     try:
-                        from docx2pdf import convert
-
-                        convert(filename, output_filename)
-                        return (
-                            f"Document successfully converted to PDF: {output_filename}"
-                        )
+                        get_docx2pdf_convert()(filename, output_filename)
+                        return f"Document successfully converted to PDF: {output_filename}"
                     except (ImportError, Exception) as e:
                         error_msg = "Failed to convert document to PDF using LibreOffice or docx2pdf.\n"
                         error_msg += "LibreOffice errors: " + "; ".join(errors) + "\n"
                         error_msg += f"docx2pdf error: {str(e)}\n"
-                        error_msg += (
-                            "To convert documents to PDF, please install either:\n"
-                        )
+                        error_msg += "To convert documents to PDF, please install either:\n"
                         error_msg += "1. LibreOffice (recommended for Linux/macOS)\n"
-                        error_msg += (
-                            "2. Microsoft Word (required for docx2pdf on Windows/macOS)"
-                        )
+                        error_msg += "2. Microsoft Word (required for docx2pdf on Windows/macOS)"
                         return error_msg
 
-            except Exception as e:
-                return f"Failed to convert document to PDF: {str(e)}"
-        else:
-            return f"PDF conversion not supported on {system} platform"
+                except Exception as e:
+                    return f"Failed to convert document to PDF: {str(e)}"
+            else:
+                return f"PDF conversion not supported on {system} platform"
 
-    except Exception as e:
-        return f"Failed to convert document to PDF: {str(e)}"
+        except Exception as e:
+            return f"Failed to convert document to PDF: {str(e)}"
+
+    # LibreOffice and Word can take up to a minute; run them off the event loop
+    return await asyncio.to_thread(_convert)
+
+
+async def convert_documents_to_pdf(
+    filenames: List[str], output_dir: Optional[str] = None
+) -> str:
+    """Convert several Word documents (.docx only) to PDF in one go.
 
+    Starting LibreOffice dominates the time taken to convert a small document, so all
+    documents are handed to a single LibreOffice run instead of one run per file.
+
+    Use this tool when:
+    - Need PDF versions of more than one document
+    - Converting a folder of reports or exported templates
+
+    Args:
+        filenames: Paths to the Word documents (.docx format only)
+        output_dir: Directory for the PDFs. If not provided, each PDF is written next
+            to its source document.
+
+    Returns:
+        Summary listing each created PDF and any documents that failed to convert
 
-async def get_document_structure_details_from_document(filename: str) -> str:
+    Limitations:
+        - PDFs are named after their source documents and replace existing files
+        - Two documents with the same name cannot share one output directory
+        - Without LibreOffice, documents are converted one at a time like convert_to_pdf
+
+    Example:
+        convert_documents_to_pdf(["q1.docx", "q2.docx"], "pdfs")
+    """
+    if not filenames:
+        return "No documents to convert."
+
+    doc_filenames = [os.path.abspath(ensure_docx_extension(f)) for f in filenames]
+
+    missing_files = [f for f in doc_filenames if not os.path.exists(f)]
+    if missing_files:
+        return f"Cannot convert documents. The following files do not exist: {', '.join(missing_files)}"
+
+    # One LibreOffice run per output directory
+    groups: Dict[str, Dict[str, str]] = {}
+    for doc_filename in doc_filenames:
+        target_dir = os.path.abspath(output_dir) if output_dir else os.path.dirname(doc_filename)
+        pdf_base_name = os.path.splitext(os.path.basename(doc_filename))[0] + ".pdf"
+        group = groups.setdefault(target_dir, {})
+        if group.get(pdf_base_name, doc_filename) != doc_filename:
+            return f"Cannot convert documents: more than one document would be written to {os.path.join(target_dir, pdf_base_name)}"
+        group[pdf_base_name] = doc_filename
+
+    lo_binary = find_libreoffice()
+    if not lo_binary:
+        results = []
+        for target_dir, group in groups.items():
+            os.makedirs(target_dir, exist_ok=True)
+            for pdf_base_name, doc_filename in group.items():
+                results.append(
+                    await convert_to_pdf(doc_filename, os.path.join(target_dir, pdf_base_name))
+                )
+        return "\n".join(results)
+
+    def _convert_group(target_dir: str, group: Dict[str, str]):
+        os.makedirs(target_dir, exist_ok=True)
+        converted, failed = [], []
+        work_dir = tempfile.mkdtemp(dir=target_dir)
+        try:
+            # The listener converts each document without starting LibreOffice at all
+            pending = {}
+            for pdf_base_name, doc_filename in group.items():
+                if convert_with_lo_server(doc_filename, os.path.join(work_dir, pdf_base_name)):
+                    continue
+                pending[pdf_base_name] = doc_filename
+
+            errors = {}
+            stderr = ""
+            if pending:
+                cmd = [
+                    lo_binary,
+                    "--headless",
+                    "--convert-to",
+                    "pdf",
+                    "--outdir",
+                    work_dir,
+                    *pending.values(),
+                ]
+                try:
+                    # Only stderr is ever reported, and only for documents that fail
+                    result = subprocess.run(
+                        cmd,
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        timeout=60 * len(pending),
+                    )
+                    stderr = result.stderr.decode("utf-8", errors="replace").strip()
+                except (subprocess.SubprocessError, OSError) as e:
+                    # A timeout can still leave PDFs for the documents finished so far
+                    errors = {pdf_base_name: str(e) for pdf_base_name in pending}
+
+            # LibreOffice can succeed for some inputs and not others, so check each PDF
+            for pdf_base_name, doc_filename in group.items():
+                created_pdf = os.path.join(work_dir, pdf_base_name)
+                if os.path.exists(created_pdf):
+                    output_filename = os.path.join(target_dir, pdf_base_name)
+                    os.replace(created_pdf, output_filename)
+                    converted.append(output_filename)
+                elif pdf_base_name in errors:
+                    failed.append(f"{doc_filename} ({errors[pdf_base_name]})")
+                elif pdf_base_name in pending and stderr:
+                    failed.append(f"{doc_filename} ({lo_binary} error: {stderr})")
+                else:
+                    failed.append(doc_filename)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        return converted, failed
+
+    def _convert():
+        converted, failed = [], []
+        for target_dir, group in groups.items():
+            group_converted, group_failed = _convert_group(target_dir, group)
+            converted.extend(group_converted)
+            failed.extend(group_failed)
+        return converted, failed
+
+    try:
+        converted, failed = await asyncio.to_thread(_convert)
+    except Exception as e:
+        return f"Failed to convert documents to PDF: {str(e)}"
+
+    lines = [f"Converted {len(converted)} of {len(converted) + len(failed)} documents to PDF:"]
+    lines.extend(f"- {path}" for path in converted)
+    if failed:
+        lines.append("Failed to convert:")
+        lines.extend(f"- {path}" for path in failed)
+    return "\n".join(lines)
+
+
+def _analyzer_structure_parts(analyzer: DocumentAnalyzer):
+    """The parts of get_complete_structure as (kind, value) pairs, like iter_structure_streaming."""
+    yield "document_info", analyzer.get_basic_info()
+    yield "styles", analyzer.get_styles()
+    for paragraph in analyzer.iter_paragraphs():
+        yield "paragraph", paragraph
+    for table in analyzer.iter_tables():
+        yield "table", table
+
+
+def _page_structure_parts(parts, offset: int, limit: Optional[int]):
+    """Keep paragraphs and tables offset .. offset + limit - 1 of each kind; others pass through."""
+    seen = {"paragraph": 0, "table": 0}
+    for kind, value in parts:
+        if kind in seen:
+            position = seen[kind]
+            seen[kind] += 1
+            if position < offset or (limit is not None and position >= offset + limit):
+                continue
+        yield kind, value
+
+
+def _collect_structure(parts) -> Dict[str, Any]:
+    """Assemble structure parts into the get_complete_structure layout."""
+    collected = {"paragraph": [], "table": []}
+    for kind, value in parts:
+        if kind in collected:
+            collected[kind].append(value)
+        else:
+            collected[kind] = value
+    return {
+        "document_info": collected["document_info"],
+        "styles": collected["styles"],
+        "paragraphs": collected["paragraph"],
+        "tables": collected["table"],
+    }
+
+
+def _structure_json_lines(parts) -> str:
+    """Serialise structure parts one at a time, so only their JSON text is kept."""
+    summary = {}
+    paragraph_lines = []
+    table_lines = []
+    for kind, value in parts:
+        if kind == "paragraph":
+            paragraph_lines.append(dumps({"paragraph": value}, pretty=False))
+        elif kind == "table":
+            table_lines.append(dumps({"table": value}, pretty=False))
+        else:
+            summary[kind] = value
+    return "\n".join(
+        [
+            dumps({"document_info": summary["document_info"]}, pretty=False),
+            dumps({"styles": summary["styles"]}, pretty=False),
+            *paragraph_lines,
+            *table_lines,
+        ]
+    )
+
+
+async def get_document_structure_details_from_document(
+    filename: str,
+    pretty: bool = False,
+    json_lines: bool = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> str:
     """Get comprehensive structure details of a Word document including paragraphs, tables, styles, and run-level formatting.
 
     This function provides deep analysis of a document's structure, useful for understanding
     content layout, formatting patterns, and preparing for targeted modifications.
 
+    Large documents can be read in pages: offset and limit select a window of the
+    paragraph list and, independently, of the table list, while document_info always
+    reports the full counts. Request offset=0, limit, then offset=limit and so on until
+    both lists come back short. Only the requested window is kept in memory.
+
     Args:
         filename: Path to the Word document
+        pretty: If True, indent the JSON output for readability (default: False)
+        json_lines: If True, return one JSON object per line instead of a single object:
+            {"document_info": ...}, {"styles": [...]}, then one {"paragraph": {...}} line
+            per paragraph and one {"table": {...}} line per table. This only changes the
+            output format; the response is still one string holding every returned
+            element, so use offset and limit to bound its size. Ignores pretty (default: False)
+        offset: Index of the first paragraph and of the first table to return (default: 0)
+        limit: Maximum number of paragraphs and of tables to return; None returns all
+            (default: None)
 
     Returns:
         JSON string containing detailed document structure information
 
     Example:
         get_document_structure_details_from_document("report.docx")
+        get_document_structure_details_from_document("report.docx", offset=200, limit=100)
     """
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    st, error = _stat_or_error(filename)
+    if error:
+        return error
+
+    if error := _validate_non_negative_index(offset, "offset"):
         return error
+    if limit is not None and limit < 1:
+        return f"The limit must be 1 or greater (you provided {limit}), or omitted to return everything."
+
+    paged = offset > 0 or limit is not None
+
+    def _parts(streaming: bool):
+        if streaming:
+            parts = iter_structure_streaming(filename)
+        else:
+            parts = _analyzer_structure_parts(_get_analyzer(filename, st))
+        return _page_structure_parts(parts, offset, limit) if paged else parts
+
+    def _build(parts):
+        return _structure_json_lines(parts) if json_lines else dumps(_collect_structure(parts), pretty=pretty)
+
+    def _analyze():
+        if cached_document(filename, st) is not None:
+            return _build(_parts(streaming=False))
+        if not json_lines and not paged:
+            # Whole-document requests may analyze large tables in the worker pool
+            try:
+                structure = get_complete_structure_streaming(filename)
+            except Exception:
+                # Unusual packages (e.g. a non-standard main part name) need the full parser
+                structure = _get_analyzer(filename, st).get_complete_structure()
+            # Serialising large structures is slow too, so it runs in the worker thread as well
+            return dumps(structure, pretty=pretty)
+        # Nothing is parsed yet, so stream the body rather than build the whole tree
+        try:
+            return _build(_parts(streaming=True))
+        except Exception:
+            # Unusual packages (e.g. a non-standard main part name) need the full parser
+            return _build(_parts(streaming=False))
 
     try:
-        analyzer = DocumentAnalyzer(filename)
-        result = analyzer.get_complete_structure()
-        return json.dumps(result, indent=2)
+        return await asyncio.to_thread(_analyze)
     except Exception as e:
         return f"Unable to get document structure: {str(e)}"
 
 
 async def get_table_cell_content_from_document(
-    filename: str, table_index: int, row_index: int, col_index: int
+    filename: str, table_index: int, row_index: int, col_index: int, pretty: bool = False
 ) -> str:
     """Get detailed content and formatting from a specific table cell in a Word document (.docx only).
 
@@ -417,6 +805,7 @@ async def get_table_cell_content_from_document(
         table_index: Index of the table (0-based, first table = 0)
         row_index: Index of the row (0-based, first row = 0)
         col_index: Index of the column (0-based, first column = 0)
+        pretty: If True, indent the JSON output for readability (default: False)
 
     Returns:
         JSON string containing:
@@ -445,17 +834,20 @@ async def get_table_cell_content_from_document(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    st, error = _stat_or_error(filename)
+    if error:
         return error
 
     if error := _validate_table_coordinates(table_index, row_index, col_index):
         return error
 
-    try:
-        table_manager = TableManager(filename)
+    def _read():
+        table_manager = _get_table_reader(filename, st)
         location = CellLocation(table_index, row_index, col_index)
-        result = table_manager.get_cell_content(location)
-        return json.dumps(result, indent=2)
+        return dumps(table_manager.get_cell_content(location), pretty=pretty)
+
+    try:
+        return await asyncio.to_thread(_read)
     except Exception as e:
         return f"Unable to read table cell content: {str(e)}"
 
@@ -489,24 +881,30 @@ async def set_table_cell_text(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    _, error = _stat_or_error(filename, write=True)
+    if error:
         return error
 
     if error := _validate_table_coordinates(table_index, row_index, col_index):
         return error
 
-    if error := _check_file_writable(filename):
-        return error
-
-    try:
-        table_manager = TableManager(filename)
+    def _write():
+        doc = checkout_document(filename)
+        table_manager = TableManager.from_document(doc, filename)
         location = CellLocation(table_index, row_index, col_index)
         result = table_manager.set_cell_text(
             location, text_to_set, clear_existing_content, paragraph_style
         )
         if "error" in result:
             return f"Failed to update table cell: {result['error']}"
+        checkin_document(filename, doc)
+        if result.get("changed", True):
+            invalidate(filename)
         return result["message"]
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Unable to set table cell text: {str(e)}"
 
@@ -534,22 +932,29 @@ async def set_paragraph_text(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    _, error = _stat_or_error(filename, write=True)
+    if error:
         return error
 
     if error := _validate_non_negative_index(paragraph_index, "paragraph_index"):
         return error
 
-    if error := _check_file_writable(filename):
-        return error
-
-    try:
-        result = set_paragraph_text_util(
-            filename, paragraph_index, new_text, style_to_apply
+    def _write():
+        doc = checkout_document(filename)
+        result = set_paragraph_text_in_document(
+            doc, paragraph_index, new_text, style_to_apply
         )
         if "error" in result:
             return f"Failed to update paragraph: {result['error']}"
+        if result.get("changed", True):
+            save_document(doc, filename)
+            invalidate(filename)
+        checkin_document(filename, doc)
         return result["message"]
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Unable to set paragraph text: {str(e)}"
 
@@ -578,7 +983,8 @@ async def insert_paragraph_after_index(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    _, error = _stat_or_error(filename, write=True)
+    if error:
         return error
 
     if error := _validate_non_negative_index(
@@ -586,16 +992,21 @@ async def insert_paragraph_after_index(
     ):
         return error
 
-    if error := _check_file_writable(filename):
-        return error
-
-    try:
-        result = insert_paragraph_after_index_util(
-            filename, target_paragraph_index, text_to_insert, style_to_apply
+    def _write():
+        doc = checkout_document(filename)
+        result = insert_paragraph_after_index_in_document(
+            doc, target_paragraph_index, text_to_insert, style_to_apply
         )
         if "error" in result:
             return f"Failed to insert paragraph: {result['error']}"
+        save_document(doc, filename)
+        checkin_document(filename, doc)
+        invalidate(filename)
         return result["message"]
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Unable to insert paragraph: {str(e)}"
 
@@ -621,22 +1032,27 @@ async def clear_table_cell_content(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    _, error = _stat_or_error(filename, write=True)
+    if error:
         return error
 
     if error := _validate_table_coordinates(table_index, row_index, col_index):
         return error
 
-    if error := _check_file_writable(filename):
-        return error
-
-    try:
-        table_manager = TableManager(filename)
+    def _write():
+        doc = checkout_document(filename)
+        table_manager = TableManager.from_document(doc, filename)
         location = CellLocation(table_index, row_index, col_index)
         result = table_manager.clear_cell_content(location)
         if "error" in result:
             return f"Failed to clear cell content: {result['error']}"
+        checkin_document(filename, doc)
+        invalidate(filename)
         return result["message"]
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Unable to clear table cell content: {str(e)}"
 
@@ -668,24 +1084,29 @@ async def add_paragraph_to_table_cell(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    _, error = _stat_or_error(filename, write=True)
+    if error:
         return error
 
     if error := _validate_table_coordinates(table_index, row_index, col_index):
         return error
 
-    if error := _check_file_writable(filename):
-        return error
-
-    try:
-        table_manager = TableManager(filename)
+    def _write():
+        doc = checkout_document(filename)
+        table_manager = TableManager.from_document(doc, filename)
         location = CellLocation(table_index, row_index, col_index)
         result = table_manager.add_paragraph_to_cell(
             location, paragraph_text, paragraph_style
         )
         if "error" in result:
             return f"Failed to add paragraph to cell: {result['error']}"
+        checkin_document(filename, doc)
+        invalidate(filename)
         return result["message"]
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Unable to add paragraph to table cell: {str(e)}"
 
@@ -721,48 +1142,52 @@ async def search_and_replace_in_scope(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    _, error = _stat_or_error(filename, write=True)
+    if error:
         return error
 
     if not find_text:
         return "Find text cannot be empty."
 
-    if scope_type not in ["paragraph", "table_cell"]:
+    if scope_type not in _SCOPE_REQUIRED_KEYS:
         return f"Invalid scope_type '{scope_type}'. Must be either 'paragraph' or 'table_cell'."
 
     if error := _validate_scope_identifier(scope_type, scope_identifier):
         return error
 
-    if error := _check_file_writable(filename):
-        return error
+    def _write():
+        scope = _SCOPE_BUILDERS[scope_type](scope_identifier)
 
-    try:
-        editor = FormattedEditor(filename)
-
-        # Create scope location object
-        if scope_type == "paragraph":
-            scope = ScopeLocation(
-                scope_type=scope_type,
-                paragraph_index=scope_identifier.get("paragraph_index"),
-            )
-        else:  # table_cell
-            scope = ScopeLocation(
-                scope_type=scope_type,
-                table_index=scope_identifier.get("table_index"),
-                row_index=scope_identifier.get("row_index"),
-                col_index=scope_identifier.get("col_index"),
+        # A read-only copy that is already parsed can show there is nothing to replace
+        # without preparing a writable one
+        cached = cached_document(filename)
+        if cached is not None:
+            result = FormattedEditor.from_document(cached, filename).precheck_search_and_replace(
+                find_text, replace_text, scope
             )
+            if result is not None:
+                return result["message"]
+
+        doc = checkout_document(filename)
+        editor = FormattedEditor.from_document(doc, filename)
 
         result = editor.search_and_replace_in_scope(find_text, replace_text, scope)
         if "error" in result:
             return f"Failed to perform replacement: {result['error']}"
+        checkin_document(filename, doc)
+        if result.get("changed", True):
+            invalidate(filename)
         return result["message"]
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Unable to perform search and replace: {str(e)}"
 
 
 async def is_element_empty(
-    filename: str, element_type: str, element_identifier: dict
+    filename: str, element_type: str, element_identifier: dict, pretty: bool = False
 ) -> str:
     """Check if a specific element (paragraph or table cell) is empty in a Word document.
 
@@ -772,6 +1197,7 @@ async def is_element_empty(
         element_identifier: Dictionary identifying the specific element location
             For paragraph: {"paragraph_index": 0}
             For table_cell: {"table_index": 0, "row_index": 1, "col_index": 2}
+        pretty: If True, indent the JSON output for readability (default: False)
 
     Returns:
         JSON string containing emptiness status and element details
@@ -782,66 +1208,225 @@ async def is_element_empty(
     filename = ensure_docx_extension(filename)
 
     # Validate inputs
-    if error := _validate_file_exists(filename):
+    st, error = _stat_or_error(filename)
+    if error:
         return error
 
-    if element_type not in ["paragraph", "table_cell"]:
+    if element_type not in _SCOPE_REQUIRED_KEYS:
         return f"Invalid element_type '{element_type}'. Must be either 'paragraph' or 'table_cell'."
 
     if error := _validate_scope_identifier(element_type, element_identifier):
         return error
 
-    try:
-        # Use DocumentAnalyzer to check if element is empty
-        analyzer = DocumentAnalyzer(filename)
+    def _check():
+        # Only the requested element is inspected, not the whole document
+        analyzer = _get_analyzer(filename, st)
 
         if element_type == "paragraph":
-            paragraphs = analyzer.get_paragraphs_analysis()
-            para_index = element_identifier["paragraph_index"]
+            status = analyzer.get_paragraph_emptiness(element_identifier["paragraph_index"])
+        else:  # table_cell
+            status = analyzer.get_cell_emptiness(
+                element_identifier["table_index"],
+                element_identifier["row_index"],
+                element_identifier["col_index"],
+            )
 
-            if not (0 <= para_index < len(paragraphs)):
-                return f"Invalid paragraph index: {para_index}. Document has {len(paragraphs)} paragraphs."
+        if "error" in status:
+            return status["error"]
 
-            paragraph = paragraphs[para_index]
-            is_empty = not paragraph["text"].strip()
+        result = {
+            "element_type": element_type,
+            "element_identifier": element_identifier,
+            **status,
+        }
 
-            result = {
-                "element_type": element_type,
-                "element_identifier": element_identifier,
-                "is_empty": is_empty,
-                "text_length": len(paragraph["text"]),
-                "has_content": bool(paragraph["text"].strip()),
-            }
+        return dumps(result, pretty=pretty)
 
-        else:  # table_cell
-            tables = analyzer.get_tables_analysis()
-            table_index = element_identifier["table_index"]
-            row_index = element_identifier["row_index"]
-            col_index = element_identifier["col_index"]
+    try:
+        return await asyncio.to_thread(_check)
+    except Exception as e:
+        return f"Unable to check element status: {str(e)}"
+
+
+# Batch operations. Each handler edits the shared Document in place and returns the
+# same result dictionary as the matching single-operation utility; nothing is saved
+# until every operation has succeeded.
+
+
+def _batch_set_paragraph_text(
+    doc, paragraph_index: int, new_text: str, style_to_apply: Optional[str] = None
+) -> Dict[str, Any]:
+    return set_paragraph_text_in_document(doc, paragraph_index, new_text, style_to_apply)
+
+
+def _batch_insert_paragraph_after_index(
+    doc,
+    target_paragraph_index: int,
+    text_to_insert: str,
+    style_to_apply: Optional[str] = None,
+) -> Dict[str, Any]:
+    return insert_paragraph_after_index_in_document(
+        doc, target_paragraph_index, text_to_insert, style_to_apply
+    )
+
+
+def _batch_table_manager(doc) -> TableManager:
+    table_manager = TableManager.from_document(doc)
+    table_manager.autosave = False
+    return table_manager
 
-            if not (0 <= table_index < len(tables)):
-                return f"Invalid table index: {table_index}. Document has {len(tables)} tables."
 
-            table = tables[table_index]
+def _batch_set_table_cell_text(
+    doc,
+    table_index: int,
+    row_index: int,
+    col_index: int,
+    text_to_set: str,
+    clear_existing_content: bool = True,
+    paragraph_style: Optional[str] = None,
+) -> Dict[str, Any]:
+    location = CellLocation(table_index, row_index, col_index)
+    return _batch_table_manager(doc).set_cell_text(
+        location, text_to_set, clear_existing_content, paragraph_style
+    )
+
 
-            if not (0 <= row_index < len(table["cells"])):
-                return f"Invalid row index: {row_index}. Table has {len(table['cells'])} rows."
+def _batch_clear_table_cell_content(
+    doc, table_index: int, row_index: int, col_index: int
+) -> Dict[str, Any]:
+    location = CellLocation(table_index, row_index, col_index)
+    return _batch_table_manager(doc).clear_cell_content(location)
 
-            if not (0 <= col_index < len(table["cells"][row_index])):
-                return f"Invalid column index: {col_index}. Row has {len(table['cells'][row_index])} columns."
 
-            cell = table["cells"][row_index][col_index]
-            is_empty = not cell["text"].strip()
+def _batch_add_paragraph_to_table_cell(
+    doc,
+    table_index: int,
+    row_index: int,
+    col_index: int,
+    paragraph_text: str,
+    paragraph_style: Optional[str] = None,
+) -> Dict[str, Any]:
+    location = CellLocation(table_index, row_index, col_index)
+    return _batch_table_manager(doc).add_paragraph_to_cell(
+        location, paragraph_text, paragraph_style
+    )
+
+
+def _batch_search_and_replace_in_scope(
+    doc, find_text: str, replace_text: str, scope_type: str, scope_identifier: dict
+) -> Dict[str, Any]:
+    if scope_type not in _SCOPE_REQUIRED_KEYS:
+        return {
+            "error": f"Invalid scope_type '{scope_type}'. Must be either 'paragraph' or 'table_cell'."
+        }
+    if error := _validate_scope_identifier(scope_type, scope_identifier):
+        return {"error": error}
 
-            result = {
-                "element_type": element_type,
-                "element_identifier": element_identifier,
-                "is_empty": is_empty,
-                "text_length": len(cell["text"]),
-                "has_content": bool(cell["text"].strip()),
-                "paragraph_count": len(cell["paragraphs"]),
-            }
+    editor = FormattedEditor.from_document(doc)
+    editor.autosave = False
+    return editor.search_and_replace_in_scope(
+        find_text, replace_text, _SCOPE_BUILDERS[scope_type](scope_identifier)
+    )
 
-        return json.dumps(result, indent=2)
+
+_BATCH_OPERATIONS = {
+    "set_paragraph_text": _batch_set_paragraph_text,
+    "insert_paragraph_after_index": _batch_insert_paragraph_after_index,
+    "set_table_cell_text": _batch_set_table_cell_text,
+    "clear_table_cell_content": _batch_clear_table_cell_content,
+    "add_paragraph_to_table_cell": _batch_add_paragraph_to_table_cell,
+    "search_and_replace_in_scope": _batch_search_and_replace_in_scope,
+}
+
+
+async def document_batch_ops(
+    filename: str, operations: List[dict], compress: bool = True, pretty: bool = False
+) -> str:
+    """Apply several edits to a Word document (.docx only) with a single load and save.
+
+    Opening and saving a document dominates the cost of every editing tool, so
+    applying N edits through this tool is much faster than N separate tool calls.
+
+    Use this tool when:
+    - Making several edits to the same document in one step
+    - Filling in multiple table cells or paragraphs at once
+
+    Args:
+        filename: Path to the Word document
+        operations: List of operations, applied in order. Each operation is a dictionary
+            with an "op" key naming one of the editing tools below, plus that tool's
+            arguments (without filename):
+            - set_paragraph_text: paragraph_index, new_text, style_to_apply
+            - insert_paragraph_after_index: target_paragraph_index, text_to_insert, style_to_apply
+            - set_table_cell_text: table_index, row_index, col_index, text_to_set,
+              clear_existing_content, paragraph_style
+            - clear_table_cell_content: table_index, row_index, col_index
+            - add_paragraph_to_table_cell: table_index, row_index, col_index,
+              paragraph_text, paragraph_style
+            - search_and_replace_in_scope: find_text, replace_text, scope_type, scope_identifier
+        compress: If False, save the package uncompressed. Saving is several times faster
+            but the file is larger; useful for intermediate documents that will be edited again
+        pretty: If True, indent the JSON output for readability (default: False)
+
+    Returns:
+        JSON string with a result entry per operation and whether the document was saved
+
+    Limitations:
+        - All or nothing: if any operation fails, processing stops and the document is not saved
+        - Paragraph indexes refer to the document as changed by earlier operations
+
+    Example:
+        document_batch_ops("report.docx", [
+            {"op": "set_paragraph_text", "paragraph_index": 0, "new_text": "Title"},
+            {"op": "set_table_cell_text", "table_index": 0, "row_index": 1,
+             "col_index": 0, "text_to_set": "Total"}
+        ])
+    """
+    filename = ensure_docx_extension(filename)
+
+    # Validate inputs
+    _, error = _stat_or_error(filename, write=True)
+    if error:
+        return error
+
+    if not operations:
+        return "Please provide at least one operation."
+
+    def _write():
+        doc = checkout_document(filename)
+        results = []
+
+        for index, operation in enumerate(operations):
+            arguments = dict(operation) if isinstance(operation, dict) else {}
+            name = arguments.pop("op", None)
+            handler = _BATCH_OPERATIONS.get(name)
+
+            if handler is None:
+                result = {
+                    "error": f"Unknown operation '{name}'. Supported operations: {', '.join(_BATCH_OPERATIONS)}"
+                }
+            else:
+                try:
+                    result = handler(doc, **arguments)
+                except TypeError as e:
+                    result = {"error": f"Invalid arguments for '{name}': {str(e)}"}
+
+            results.append({"index": index, "op": name, **result})
+            if "error" in result:
+                return dumps({"saved": False, "results": results}, pretty=pretty)
+
+        # Operations that turned out to be no-ops leave nothing to save
+        if not any(result.get("changed", True) for result in results):
+            checkin_document(filename, doc)
+            return dumps({"saved": False, "results": results}, pretty=pretty)
+
+        save_document(doc, filename, compress)
+        checkin_document(filename, doc)
+        invalidate(filename)
+        return dumps({"saved": True, "results": results}, pretty=pretty)
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
-        return f"Unable to check element status: {str(e)}"
+        return f"Unable to apply batch operations: {str(e)}"
@@ -5,15 +5,22 @@ These tools handle footnote and endnote functionality,
 including adding, customizing, and converting between them.
 """
 
+import asyncio
 import os
 from typing import Optional
-from docx import Document
 from docx.shared import Pt
 from docx.enum.style import WD_STYLE_TYPE
 
 from word_document_server.utils.file_utils import (
     check_file_writeable,
     ensure_docx_extension,
+    save_document,
+    write_lock,
+)
+from word_document_server.utils.doc_cache import (
+    checkout_document,
+    checkin_document,
+    invalidate,
 )
 from word_document_server.core.footnotes import (
     find_footnote_references,
@@ -50,8 +57,8 @@ async def add_footnote_to_document(
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Validate paragraph index
         if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
@@ -67,7 +74,9 @@ async def add_footnote_to_document(
             # Create the footnote reference
             footnote.add_footnote(footnote_text)
 
-            doc.save(filename)
+            save_document(doc, filename)
+            checkin_document(filename, doc)
+            invalidate(filename)
             return f"Footnote added to paragraph {paragraph_index} in {filename}"
         except AttributeError:
             # Fall back to a simpler approach if direct footnote addition fails
@@ -92,8 +101,14 @@ async def add_footnote_to_document(
                 "Footnote Text" if "Footnote Text" in doc.styles else "Normal"
             )
 
-            doc.save(filename)
+            save_document(doc, filename)
+            checkin_document(filename, doc)
+            invalidate(filename)
             return f"Footnote added to paragraph {paragraph_index} in {filename} (simplified approach)"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add footnote: {str(e)}"
 
@@ -126,8 +141,8 @@ async def add_endnote_to_document(
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Validate paragraph index
         if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
@@ -158,8 +173,14 @@ async def add_endnote_to_document(
             "Endnote Text" if "Endnote Text" in doc.styles else "Normal"
         )
 
-        doc.save(filename)
+        save_document(doc, filename)
+        checkin_document(filename, doc)
+        invalidate(filename)
         return f"Endnote added to paragraph {paragraph_index} in {filename}"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add endnote: {str(e)}"
 
@@ -182,8 +203,8 @@ async def convert_footnotes_to_endnotes_in_document(filename: str) -> str:
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Find all runs that might be footnote references
         footnote_references = []
@@ -242,11 +263,17 @@ async def convert_footnotes_to_endnotes_in_document(filename: str) -> str:
                 pass
 
         # Save the document
-        doc.save(filename)
+        save_document(doc, filename)
+        checkin_document(filename, doc)
+        invalidate(filename)
 
         return (
             f"Converted {len(footnote_references)} footnotes to endnotes in {filename}"
         )
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to convert footnotes to endnotes: {str(e)}"
 
@@ -279,8 +306,8 @@ async def customize_footnote_style(
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Create or get footnote style
         footnote_style_name = "Footnote Text"
@@ -315,8 +342,14 @@ async def customize_footnote_style(
         )
 
         # Save the document
-        doc.save(filename)
+        save_document(doc, filename)
+        checkin_document(filename, doc)
+        invalidate(filename)
 
         return f"Footnote style and numbering customized in {filename}"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to customize footnote style: {str(e)}"
@@ -5,15 +5,22 @@ These tools handle formatting operations for Word documents,
 including text formatting, table formatting, and custom styles.
 """
 
+import asyncio
 import os
 from typing import List, Optional
-from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.style import WD_STYLE_TYPE
 
 from word_document_server.utils.file_utils import (
     check_file_writeable,
     ensure_docx_extension,
+    save_document,
+    write_lock,
+)
+from word_document_server.utils.doc_cache import (
+    checkout_document,
+    checkin_document,
+    invalidate,
 )
 from word_document_server.core.styles import create_style
 from word_document_server.core.tables import apply_table_style
@@ -67,8 +74,8 @@ async def format_text(
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Validate paragraph index
         if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
@@ -133,8 +140,14 @@ async def format_text(
         if end_pos < len(text):
             paragraph.add_run(text[end_pos:])
 
-        doc.save(filename)
+        save_document(doc, filename)
+        checkin_document(filename, doc)
+        invalidate(filename)
         return f"Text '{target_text}' formatted successfully in paragraph {paragraph_index}."
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to format text: {str(e)}"
 
@@ -173,8 +186,8 @@ async def create_custom_style(
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Build font properties dictionary
         font_properties = {}
@@ -198,8 +211,14 @@ async def create_custom_style(
             font_properties=font_properties,
         )
 
-        doc.save(filename)
+        save_document(doc, filename)
+        checkin_document(filename, doc)
+        invalidate(filename)
         return f"Style '{style_name}' created successfully."
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to create style: {str(e)}"
 
@@ -232,8 +251,8 @@ async def format_table(
             f"Cannot modify document: {error_message}. Consider creating a copy first."
         )
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Validate table index
         if table_index < 0 or table_index >= len(doc.tables):
@@ -245,9 +264,15 @@ async def format_table(
         success = apply_table_style(table, has_header_row, border_style, shading)
 
         if success:
-            doc.save(filename)
+            save_document(doc, filename)
+            checkin_document(filename, doc)
+            invalidate(filename)
             return f"Table at index {table_index} formatted successfully."
         else:
             return f"Failed to format table at index {table_index}."
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to format table: {str(e)}"
@@ -5,13 +5,34 @@ This module provides tools for generating visual representations of document pag
 particularly useful when textual analysis is insufficient for complex layouts.
 """
 
+import asyncio
+import base64
+import io
+import math
 import os
-import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
 from word_document_server.utils.file_utils import ensure_docx_extension
-from word_document_server.utils.conversion_utils import convert_docx_to_pdf_temp, cleanup_temp_file
+from word_document_server.utils.json_utils import dumps
+from word_document_server.utils.conversion_utils import convert_docx_to_pdf_cached, cleanup_temp_file
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:  # optional; pages are rendered with pdf2image (poppler) instead
+    pdfium = None
+
+try:
+    from pdf2image import convert_from_path
+except ImportError:  # optional; only used when pypdfium2 is not installed
+    convert_from_path = None
+
+try:
+    import simplejpeg
+except ImportError:  # optional; JPEG pages are encoded with Pillow instead
+    simplejpeg = None
 
 
 def _validate_file_exists(filename: str) -> Optional[str]:
@@ -33,7 +54,8 @@ def _validate_page_numbers(page_numbers: List[int]) -> Optional[str]:
         return f"Too many pages requested. Maximum 10 pages allowed per request (you requested {len(page_numbers)} pages)."
     
     for i, page_num in enumerate(page_numbers):
-        if not isinstance(page_num, int):
+        # bool is an int subclass, but True/False are never meant as page numbers
+        if type(page_num) is not int:
             return f"All page numbers must be integers. Item at index {i} is not an integer: {page_num}"
         if page_num < 1:
             return f"Page numbers must be 1 or greater (you provided {page_num} at index {i}). Page numbering starts from 1."
@@ -58,12 +80,205 @@ def _validate_dpi(dpi: int) -> Optional[str]:
     return None
 
 
+def _validate_preview_dpi(preview_dpi: Optional[int], dpi: int) -> Optional[str]:
+    """Validate preview DPI value and return user-friendly error if invalid."""
+    if preview_dpi is None:
+        return None
+    if type(preview_dpi) is not int:
+        return f"preview_dpi must be an integer (you provided {type(preview_dpi).__name__}: {preview_dpi})"
+    if preview_dpi < 10 or preview_dpi >= dpi:
+        return f"preview_dpi must be at least 10 and lower than dpi ({dpi}) (you provided {preview_dpi})"
+    return None
+
+
+# Pillow format name and encoder options per output format. The images are working
+# copies for visual analysis, so fast encoding is preferred over the smallest file.
+_SAVE_OPTIONS = {
+    "png": ("PNG", {"compress_level": 1}),
+    "jpeg": ("JPEG", {"quality": 90, "progressive": True, "subsampling": "4:4:4"}),
+    "jpg": ("JPEG", {"quality": 90, "progressive": True, "subsampling": "4:4:4"}),
+    "tiff": ("TIFF", {"compression": "tiff_lzw"}),
+    "bmp": ("BMP", {}),
+}
+
+
+def _validate_compress_level(compress_level: Optional[int]) -> Optional[str]:
+    """Validate PNG compression level and return user-friendly error if invalid."""
+    if compress_level is None:
+        return None
+    if type(compress_level) is not int or not 0 <= compress_level <= 9:
+        return f"compress_level must be an integer from 0 to 9 (you provided {compress_level})"
+    return None
+
+
+def _save_image(image, target, image_format: str, compress_level: Optional[int]) -> None:
+    """
+    Save a rendered page (a PIL image, or an RGB array for simplejpeg) with the encoder
+    options for its format. target is a file path or a writable binary file object.
+    """
+    pil_format, options = _SAVE_OPTIONS[image_format.lower()]
+    if not hasattr(image, "save"):
+        # libjpeg-turbo straight from the pixel array, without a Pillow image
+        data = simplejpeg.encode_jpeg(
+            image, quality=options["quality"], colorspace="RGB", colorsubsampling="444", fastdct=True
+        )
+        if isinstance(target, str):
+            with open(target, "wb") as f:
+                f.write(data)
+        else:
+            target.write(data)
+        return
+    if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+        # JPEG has no alpha channel; renderers may return RGBA
+        image = image.convert("RGB")
+    if compress_level is not None and pil_format == "PNG":
+        options = {**options, "compress_level": compress_level}
+    image.save(target, pil_format, **options)
+
+
+def _save_page(image, target, preview_target, preview_scale: float, image_format: str, compress_level: Optional[int]) -> None:
+    """Save a rendered page and, when preview_target is given, a downscaled copy of it."""
+    _save_image(image, target, image_format, compress_level)
+    if preview_target is None:
+        return
+
+    from PIL import Image
+
+    if not hasattr(image, "save"):
+        image = Image.fromarray(image)
+    size = (max(1, round(image.width * preview_scale)), max(1, round(image.height * preview_scale)))
+    # reducing_gap shrinks by whole factors first, which is much cheaper on large pages
+    preview = image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+    _save_image(preview, preview_target, image_format, compress_level)
+
+
+def _output_value(target) -> str:
+    """Response value for a saved image: its path, or base64 data for an in-memory target."""
+    if isinstance(target, str):
+        return target
+    return base64.b64encode(target.getbuffer()).decode("ascii")
+
+
+# Inline responses are capped so a single tool result cannot grow without bound
+_MAX_INLINE_BYTES = 20 * 1024 * 1024
+
+_MIME_TYPES = {"PNG": "image/png", "JPEG": "image/jpeg", "TIFF": "image/tiff", "BMP": "image/bmp"}
+
+
+# Pages taller or wider than this many pixels are rendered in strips
+_MAX_WHOLE_PAGE_PIXELS = 4096
+_STRIP_ROWS = 2048
+
+
+def _render_strips_pdfium(page, width: int, height: int):
+    """
+    Render a page in horizontal strips pasted into one image.
+
+    Pillow copies an RGB bitmap when converting it, so a whole-page render briefly holds
+    the page twice; with strips only one strip is held beside the final image.
+    """
+    from PIL import Image
+
+    image = Image.new("RGB", (width, height))
+    for top in range(0, height, _STRIP_ROWS):
+        rows = min(_STRIP_ROWS, height - top)
+        bitmap = pdfium.PdfBitmap.new_native(width, rows, pdfium_c.FPDFBitmap_BGR, rev_byteorder=True)
+        try:
+            bitmap.fill_rect((255, 255, 255, 255), 0, 0, width, rows)
+            # Lay the full-size page out shifted up so only this strip lands in the bitmap,
+            # which is how pypdfium2 renders crops and keeps strips pixel-aligned
+            pdfium_c.FPDF_RenderPageBitmap(
+                bitmap, page, 0, -top, width, height, 0,
+                pdfium_c.FPDF_ANNOT | pdfium_c.FPDF_REVERSE_BYTE_ORDER,
+            )
+            image.paste(bitmap.to_pil(), (0, top))
+        finally:
+            bitmap.close()
+    return image
+
+
+def _render_page_pdfium(pdf, page_num: int, dpi: int, as_array: bool = False):
+    """
+    Render one page of an open pypdfium2 document, or return None if it does not exist.
+
+    With as_array, pages rendered whole are returned as an RGB numpy array instead of
+    a PIL image, for encoding with simplejpeg.
+    """
+    if page_num > len(pdf):
+        return None
+    page = pdf[page_num - 1]
+    try:
+        # PDF user space is 72 units per inch
+        scale = dpi / 72
+        width = math.ceil(page.get_width() * scale)
+        height = math.ceil(page.get_height() * scale)
+        if max(width, height) > _MAX_WHOLE_PAGE_PIXELS:
+            return _render_strips_pdfium(page, width, height)
+        # pdfium renders BGR by default; asking for RGB spares Pillow a per-pixel
+        # channel swap when it takes over the buffer
+        bitmap = page.render(scale=scale, rev_byteorder=True)
+        if not as_array:
+            return bitmap.to_pil()
+        try:
+            # Copy out of pdfium's buffer so the bitmap is freed here; pdfium must only
+            # be called from the rendering thread, not from the encoding workers
+            return bitmap.to_numpy().copy()
+        finally:
+            bitmap.close()
+    finally:
+        page.close()
+
+
+def _pdf2image_renderer(convert_from_path, pdf_path: str, page_numbers: List[int], dpi: int, fmt: str):
+    """
+    Build a render(page_num) function on top of pdf2image.
+
+    Each pdf2image call starts poppler and parses the PDF, so every run of consecutive
+    requested pages is converted with a single call when its first page is needed.
+    render returns None for pages that do not exist.
+    """
+    run_starts = {}
+    run_ends = {}
+    start = previous = None
+    for page_num in sorted(set(page_numbers)):
+        if previous is None or page_num != previous + 1:
+            start = page_num
+        run_starts[page_num] = start
+        run_ends[start] = page_num
+        previous = page_num
+
+    rendered = {}
+
+    def render(page_num: int):
+        if page_num not in rendered:
+            start = run_starts[page_num]
+            end = run_ends[start]
+            # pdf2image uses 1-indexed pages and stops at the end of the document
+            images = convert_from_path(
+                pdf_path,
+                dpi=dpi,
+                first_page=start,
+                last_page=end,
+                fmt=fmt
+            )
+            for run_page in range(start, end + 1):
+                offset = run_page - start
+                rendered[run_page] = images[offset] if offset < len(images) else None
+        # Rendered pages are released as soon as they are handed out
+        return rendered.pop(page_num)
+
+    return render
+
+
 async def get_document_page_images(
     filename: str,
     page_numbers: List[int],
     output_directory: str = "mcp_server_temp_images",
-    image_format: str = "png",
-    dpi: int = 200
+    image_format: str = "jpeg",
+    dpi: int = 200,
+    compress_level: Optional[int] = None,
+    inline: bool = False,
+    preview_dpi: Optional[int] = None
 ) -> str:
     """Generate images of specific pages from a Word document (.docx only).
 
@@ -81,36 +296,50 @@ async def get_document_page_images(
         filename: Path to the Word document (.docx format only)
         page_numbers: List of page numbers to convert (1-indexed, e.g., [1, 3, 5], max 10 pages per request)
         output_directory: Server-side directory for generated images (default: "mcp_server_temp_images")
-        image_format: Image format for output files (default: "png", supports: png, jpeg, jpg, tiff, bmp)
+        image_format: Image format for output files (default: "jpeg", supports: png, jpeg, jpg, tiff, bmp).
+            JPEG encodes rendered pages much faster and smaller than PNG and is visually
+            lossless for text at the quality used; choose png for pixel-exact output
         dpi: Dots per inch for image quality (default: 200, range: 50-600)
+        compress_level: PNG compression level from 0 (fastest) to 9 (smallest). Defaults to 1,
+            which encodes many times faster than Pillow's default for slightly larger files
+        inline: If True, return the images base64-encoded in the response instead of writing
+            them to output_directory (default: False). Saves the client reading the files back;
+            inline images are limited to 20 MB in total, so prefer jpeg and a modest dpi
+        preview_dpi: If set (e.g. 72), also produce a low-resolution preview of each page at this
+            DPI, downscaled from the same rendering, so a quick overview and the detailed image
+            come from one conversion (default: None, must be lower than dpi)
 
     Returns:
         JSON string containing:
         - success flag and image paths on success
         - error message on failure
-        - mapping of page numbers to their server-side file paths
+        - mapping of page numbers to their server-side file paths, or to base64 image data with inline
+        - the same mapping for previews under preview_paths / preview_b64 when preview_dpi is set
 
     Process:
         1. Validates input parameters and file existence
         2. Converts DOCX to temporary PDF using platform-appropriate tools
-        3. Extracts specified pages as images using pdf2image library
+        3. Renders specified pages as images (pypdfium2 if installed, otherwise pdf2image)
         4. Saves images to the specified output directory
         5. Cleans up temporary PDF file
         6. Returns paths to generated image files
 
     Requirements:
-        - pdf2image library (automatically installed)
-        - poppler-utils system package for PDF processing
-        - Platform-specific conversion tools (LibreOffice/Microsoft Word)
+        - pypdfium2 (optional, renders in-process and much faster), or
+          pdf2image library with the poppler-utils system package
+        - simplejpeg (optional, encodes JPEG output faster when rendering with pypdfium2)
+        - Platform-specific conversion tools (LibreOffice/Microsoft Word); without LibreOffice,
+          mammoth and weasyprint give an approximate rendering whose pages differ from Word's
 
     Output format:
-        Success: {"success": true, "image_paths": {"page_1": "/path/to/image1.png", ...}, "message": "..."}
+        Success: {"success": true, "image_paths": {"page_1": "/path/to/image1.jpeg", ...}, "message": "..."}
+        Inline: {"success": true, "mime_type": "image/jpeg", "image_b64": {"page_1": "<base64>", ...}, "message": "..."}
         Failure: {"error": "Description of the error"}
 
     Limitations:
         - Only works with .docx format (Microsoft Word 2007+)
         - Cannot process password-protected documents
-        - Requires poppler-utils to be installed on the system
+        - Requires pypdfium2, or poppler-utils for pdf2image, to be installed on the system
         - Page numbers must exist in the document
         - Complex animations or interactive elements won't be captured
 
@@ -122,91 +351,183 @@ async def get_document_page_images(
 
     # Validate inputs
     if error := _validate_file_exists(filename):
-        return json.dumps({"error": error})
+        return dumps({"error": error}, pretty=False)
 
     if error := _validate_page_numbers(page_numbers):
-        return json.dumps({"error": error})
+        return dumps({"error": error}, pretty=False)
 
     if error := _validate_image_format(image_format):
-        return json.dumps({"error": error})
+        return dumps({"error": error}, pretty=False)
+
+    # Normalised once; everything below uses the lowercase name
+    image_format = image_format.lower()
 
     if error := _validate_dpi(dpi):
-        return json.dumps({"error": error})
+        return dumps({"error": error}, pretty=False)
 
-    # Create output directory if it doesn't exist
-    try:
-        os.makedirs(output_directory, exist_ok=True)
-    except Exception as e:
-        return json.dumps({"error": f"Cannot create output directory '{output_directory}': {str(e)}"})
+    if error := _validate_compress_level(compress_level):
+        return dumps({"error": error}, pretty=False)
+
+    if error := _validate_preview_dpi(preview_dpi, dpi):
+        return dumps({"error": error}, pretty=False)
+
+    # Known at import time, so a missing renderer is reported before converting anything
+    if pdfium is None and convert_from_path is None:
+        return dumps({
+            "error": "No PDF renderer is available. Please install pypdfium2 (pip install pypdfium2) "
+                     "or pdf2image (pip install pdf2image)\n"
+                     "Note: pdf2image also requires poppler-utils to be installed on your system."
+        }, pretty=False)
+
+    # A page requested twice is rendered and saved once
+    page_numbers = list(dict.fromkeys(page_numbers))
+
+    # Resolved once so every image path below is already absolute
+    output_directory = os.path.abspath(output_directory)
 
-    # Convert DOCX to temporary PDF
-    success, result = convert_docx_to_pdf_temp(filename)
+    # Create output directory if it doesn't exist
+    if not inline:
+        try:
+            os.makedirs(output_directory, exist_ok=True)
+        except Exception as e:
+            return dumps({"error": f"Cannot create output directory '{output_directory}': {str(e)}"}, pretty=False)
+
+    # Conversion can run LibreOffice for minutes and rendering is CPU-bound, so both
+    # run in a worker thread rather than on the event loop
+    response = await asyncio.to_thread(
+        _generate_page_images,
+        filename,
+        page_numbers,
+        output_directory,
+        image_format,
+        dpi,
+        compress_level,
+        inline,
+        preview_dpi,
+    )
+    return dumps(response, pretty=False)
+
+
+def _generate_page_images(
+    filename: str,
+    page_numbers: List[int],
+    output_directory: str,
+    image_format: str,
+    dpi: int,
+    compress_level: Optional[int],
+    inline: bool,
+    preview_dpi: Optional[int],
+) -> Dict[str, Any]:
+    """Convert a validated document to PDF and render the requested pages; returns the response dict."""
+    # Convert DOCX to PDF, reusing the conversion from an earlier call when unchanged
+    success, result = convert_docx_to_pdf_cached(filename)
     if not success:
-        return json.dumps({"error": f"Failed to convert DOCX to PDF: {result}"})
+        return {"error": f"Failed to convert DOCX to PDF: {result}"}
 
     temp_pdf_path = result
     generated_images = {}
+    previews = {}
     errors = []
+    pdf = None
 
     try:
-        # Import pdf2image for PDF to image conversion
-        try:
-            from pdf2image import convert_from_path
-        except ImportError:
-            return json.dumps({
-                "error": "pdf2image library is not available. Please install it using: pip install pdf2image\n"
-                         "Note: This also requires poppler-utils to be installed on your system."
-            })
+        if pdfium is not None:
+            # Parse the PDF once in-process and render every requested page from it
+            pdf = pdfium.PdfDocument(temp_pdf_path)
+            as_array = simplejpeg is not None and _SAVE_OPTIONS[image_format][0] == "JPEG"
+
+            def render(page_num):
+                return _render_page_pdfium(pdf, page_num, dpi, as_array)
+        else:
+            render = _pdf2image_renderer(
+                convert_from_path, temp_pdf_path, page_numbers, dpi, image_format
+            )
 
         # Get base filename for image naming
         base_filename = os.path.splitext(os.path.basename(filename))[0]
-
-        # Convert each requested page to image
-        for page_num in page_numbers:
-            try:
-                # Convert single page from PDF (pdf2image uses 1-indexed pages)
-                images = convert_from_path(
-                    temp_pdf_path,
-                    dpi=dpi,
-                    first_page=page_num,
-                    last_page=page_num,
-                    fmt=image_format.lower()
-                )
-
-                if not images:
-                    errors.append(f"Page {page_num} could not be converted to image (page may not exist)")
-                    continue
-
-                # Save the image
-                image = images[0]  # Should only be one image since we specified a single page
-                image_filename = f"{base_filename}_page_{page_num}.{image_format.lower()}"
-                image_path = os.path.join(output_directory, image_filename)
-
-                # Save image to file
-                image.save(image_path, image_format.upper())
-                
-                # Store the absolute path for the response
-                generated_images[f"page_{page_num}"] = os.path.abspath(image_path)
-
-            except Exception as e:
-                errors.append(f"Failed to generate image for page {page_num}: {str(e)}")
+        extension = f".{image_format}"
+        preview_scale = preview_dpi / dpi if preview_dpi else 1.0
+
+        # pdfium and poppler render one page at a time, but Pillow's encoders release
+        # the GIL, so each page is saved on a worker while the next one is rendered
+        workers = min(len(page_numbers), os.cpu_count() or 1)
+        saves = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Convert each requested page to image
+            for page_num in page_numbers:
+                try:
+                    image = render(page_num)
+
+                    if image is None:
+                        errors.append(f"Page {page_num} could not be converted to image (page may not exist)")
+                        continue
+
+                    preview_target = None
+                    if inline:
+                        target = io.BytesIO()
+                        if preview_dpi:
+                            preview_target = io.BytesIO()
+                    else:
+                        target = os.path.join(output_directory, f"{base_filename}_page_{page_num}{extension}")
+                        if preview_dpi:
+                            preview_target = os.path.join(
+                                output_directory, f"{base_filename}_page_{page_num}_preview{extension}"
+                            )
+
+                    # Save image to file, or encode it in memory for an inline response
+                    future = pool.submit(
+                        _save_page, image, target, preview_target, preview_scale, image_format, compress_level
+                    )
+                    saves[page_num] = (target, preview_target, future)
+
+                except Exception as e:
+                    errors.append(f"Failed to generate image for page {page_num}: {str(e)}")
+
+            inline_bytes = 0
+            for page_num, (target, preview_target, future) in saves.items():
+                try:
+                    future.result()
+                    image_value = _output_value(target)
+                    preview_value = _output_value(preview_target) if preview_target is not None else None
+                    if inline:
+                        size = len(image_value) + len(preview_value or "")
+                        if inline_bytes + size > _MAX_INLINE_BYTES:
+                            errors.append(
+                                f"Page {page_num} omitted: inline images are limited to "
+                                f"{_MAX_INLINE_BYTES // (1024 * 1024)} MB in total; use a lower dpi, "
+                                f"jpeg output or inline=False"
+                            )
+                            continue
+                        inline_bytes += size
+                    # Absolute paths, or base64 data for an inline response
+                    generated_images[f"page_{page_num}"] = image_value
+                    if preview_value is not None:
+                        previews[f"page_{page_num}"] = preview_value
+                except Exception as e:
+                    errors.append(f"Failed to generate image for page {page_num}: {str(e)}")
 
     except Exception as e:
-        # Clean up temporary PDF
-        cleanup_temp_file(temp_pdf_path)
-        return json.dumps({"error": f"Image generation failed: {str(e)}"})
+        return {"error": f"Image generation failed: {str(e)}"}
 
     finally:
-        # Always clean up the temporary PDF file
+        # Always release the PDF and clean up the temporary file
+        if pdf is not None:
+            pdf.close()
         cleanup_temp_file(temp_pdf_path)
 
     # Prepare response
     if generated_images:
-        response = {
-            "success": True,
-            "image_paths": generated_images,
-            "message": f"Successfully generated {len(generated_images)} image(s) for the specified page(s)."
-        }
+        response = {"success": True}
+        if inline:
+            response["mime_type"] = _MIME_TYPES[_SAVE_OPTIONS[image_format][0]]
+            response["image_b64"] = generated_images
+            if previews:
+                response["preview_b64"] = previews
+        else:
+            response["image_paths"] = generated_images
+            if previews:
+                response["preview_paths"] = previews
+        response["message"] = f"Successfully generated {len(generated_images)} image(s) for the specified page(s)."
         
         if errors:
             response["warnings"] = errors
@@ -215,4 +536,4 @@ async def get_document_page_images(
         error_summary = "; ".join(errors) if errors else "No images were generated"
         response = {"error": f"Failed to generate any images: {error_summary}"}
 
-    return json.dumps(response, indent=2) 
\ No newline at end of file
+    return response
@@ -5,6 +5,7 @@ These tools handle document protection features such as
 password protection, restricted editing, and digital signatures.
 """
 
+import asyncio
 import os
 import hashlib
 import datetime
@@ -14,8 +15,16 @@ from docx import Document
 import msoffcrypto
 
 from word_document_server.utils.file_utils import (
+    atomic_replace,
     check_file_writeable,
     ensure_docx_extension,
+    save_document,
+    write_lock,
+)
+from word_document_server.utils.doc_cache import (
+    checkout_document,
+    checkin_document,
+    invalidate,
 )
 
 
@@ -43,7 +52,7 @@ async def protect_document(filename: str, password: str) -> str:
     if not is_writeable:
         return f"Cannot protect document: {error_message}"
 
-    try:
+    def _write():
         # Read the original file content
         with open(filename, "rb") as infile:
             original_data = infile.read()
@@ -58,8 +67,9 @@ async def protect_document(filename: str, password: str) -> str:
         file.encrypt(password=password, outfile=encrypted_data_io)
 
         # Overwrite the original file with the encrypted data
-        with open(filename, "wb") as outfile:
+        with atomic_replace(filename) as outfile:
             outfile.write(encrypted_data_io.getvalue())
+        invalidate(filename)
 
         base_path, _ = os.path.splitext(filename)
         metadata_path = f"{base_path}.protection"
@@ -68,17 +78,12 @@ async def protect_document(filename: str, password: str) -> str:
 
         return f"Document {filename} encrypted successfully with password."
 
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
-        # Attempt to restore original file content on failure
-        try:
-            if "original_data" in locals():
-                with open(filename, "wb") as outfile:
-                    outfile.write(original_data)
-                return f"Failed to encrypt document {filename}: {str(e)}. Original file restored."
-            else:
-                return f"Failed to encrypt document {filename}: {str(e)}. Could not restore original file."
-        except Exception as restore_e:
-            return f"Failed to encrypt document {filename}: {str(e)}. Also failed to restore original file: {str(restore_e)}"
+        # The file is only ever replaced whole, so a failure leaves it as it was
+        return f"Failed to encrypt document {filename}: {str(e)}. Original file left unchanged."
 
 
 async def add_restricted_editing(
@@ -101,7 +106,7 @@ async def add_restricted_editing(
     if not is_writeable:
         return f"Cannot protect document: {error_message}"
 
-    try:
+    def _write():
         # Hash the password for security
         password_hash = hashlib.sha256(password.encode()).hexdigest()
 
@@ -120,6 +125,10 @@ async def add_restricted_editing(
             return f"Document {filename} protected with restricted editing. Editable sections: {', '.join(editable_sections)}"
         else:
             return f"Failed to protect document {filename} with restricted editing"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add restricted editing: {str(e)}"
 
@@ -144,8 +153,8 @@ async def add_digital_signature(
     if not is_writeable:
         return f"Cannot add signature to document: {error_message}"
 
-    try:
-        doc = Document(filename)
+    def _write():
+        doc = checkout_document(filename)
 
         # Create signature info
         signature_info = create_signature_info(doc, signer_name, reason)
@@ -173,11 +182,17 @@ async def add_digital_signature(
             )
 
             # Save the document with the visible signature
-            doc.save(filename)
+            save_document(doc, filename)
+            checkin_document(filename, doc)
+            invalidate(filename)
 
             return f"Digital signature added to document {filename}"
         else:
             return f"Failed to add digital signature to document {filename}"
+
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except Exception as e:
         return f"Failed to add digital signature: {str(e)}"
 
@@ -253,7 +268,7 @@ async def unprotect_document(filename: str, password: str) -> str:
     if not is_writeable:
         return f"Cannot modify document: {error_message}"
 
-    try:
+    def _write():
         # Read the encrypted file content
         with open(filename, "rb") as infile:
             encrypted_data = infile.read()
@@ -269,23 +284,19 @@ async def unprotect_document(filename: str, password: str) -> str:
         )  # Pass the buffer as the 'outfile' argument
 
         # Overwrite the original file with the decrypted data
-        with open(filename, "wb") as outfile:
+        with atomic_replace(filename) as outfile:
             outfile.write(decrypted_data_io.getvalue())
+        invalidate(filename)
 
         return f"Document {filename} decrypted successfully."
 
+    try:
+        async with write_lock(filename):
+            return await asyncio.to_thread(_write)
     except msoffcrypto.exceptions.InvalidKeyError:
         return f"Failed to decrypt document {filename}: Incorrect password."
     except msoffcrypto.exceptions.InvalidFormatError:
         return f"Failed to decrypt document {filename}: File is not encrypted or is not a supported Office format."
     except Exception as e:
-        # Attempt to restore encrypted file content on failure
-        try:
-            if "encrypted_data" in locals():
-                with open(filename, "wb") as outfile:
-                    outfile.write(encrypted_data)
-                return f"Failed to decrypt document {filename}: {str(e)}. Encrypted file restored."
-            else:
-                return f"Failed to decrypt document {filename}: {str(e)}. Could not restore encrypted file."
-        except Exception as restore_e:
-            return f"Failed to decrypt document {filename}: {str(e)}. Also failed to restore encrypted file: {str(restore_e)}"
+        # The file is only ever replaced whole, so a failure leaves it as it was
+        return f"Failed to decrypt document {filename}: {str(e)}. Encrypted file left unchanged."
@@ -5,9 +5,20 @@ This package contains utility modules for file operations and document handling.
 """
 
 from word_document_server.utils.file_utils import (
+    atomic_replace,
     check_file_writeable,
     create_document_copy,
     ensure_docx_extension,
+    save_document,
+    write_lock,
+)
+from word_document_server.utils.doc_cache import (
+    load_document,
+    cached_document,
+    load_derived,
+    checkout_document,
+    checkin_document,
+    invalidate,
 )
 from word_document_server.utils.document_utils import (
     get_document_properties,
@@ -24,9 +35,19 @@ from word_document_server.utils.formatted_editor import FormattedEditor, ScopeLo
 
 __all__ = [
     # File utilities
+    "atomic_replace",
     "check_file_writeable",
     "create_document_copy",
     "ensure_docx_extension",
+    "save_document",
+    "write_lock",
+    # Document cache
+    "load_document",
+    "cached_document",
+    "load_derived",
+    "checkout_document",
+    "checkin_document",
+    "invalidate",
     # Document utilities
     "get_document_properties",
     "extract_document_text",
@@ -6,16 +6,310 @@ between different formats, particularly for generating temporary files needed
 for other operations.
 """
 
+import atexit
+import contextlib
+import hashlib
 import os
+import pathlib
 import platform
+import secrets
+import stat
 import subprocess
 import shutil
+import sys
 import tempfile
-from typing import Optional, Tuple
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
 
 from word_document_server.utils.file_utils import check_file_writeable
 
 
+# The platform cannot change while the server runs
+SYSTEM = platform.system()
+
+# LibreOffice executables to look for, in order of preference
+_LIBREOFFICE_CANDIDATES = {
+    "Darwin": ("soffice", "/Applications/LibreOffice.app/Contents/MacOS/soffice"),
+    "Linux": ("libreoffice", "soffice"),
+}
+
+_libreoffice_path: Optional[str] = None
+_libreoffice_probed = False
+
+
+def find_libreoffice() -> Optional[str]:
+    """Locate the LibreOffice executable, searching only on the first call.
+
+    Uses shutil.which, which only inspects PATH entries, so no process is started
+    for candidates that are not installed.
+
+    Returns:
+        Full path to the executable, or None if LibreOffice is not installed
+    """
+    global _libreoffice_path, _libreoffice_probed
+    if not _libreoffice_probed:
+        for candidate in _LIBREOFFICE_CANDIDATES.get(SYSTEM, ()):
+            _libreoffice_path = shutil.which(candidate)
+            if _libreoffice_path:
+                break
+        _libreoffice_probed = True
+    return _libreoffice_path
+
+
+# docx2pdf is optional; a failed import is not cached in sys.modules, so the outcome
+# of the first attempt is kept instead of re-running the import machinery every call
+_docx2pdf_convert = None
+_docx2pdf_error: Optional[str] = None
+
+
+def get_docx2pdf_convert():
+    """Return docx2pdf's convert function, attempting the import only on the first call.
+
+    Raises:
+        ImportError: If docx2pdf is not installed or could not be imported
+    """
+    global _docx2pdf_convert, _docx2pdf_error
+    if _docx2pdf_convert is None and _docx2pdf_error is None:
+        try:
+            from docx2pdf import convert
+
+            _docx2pdf_convert = convert
+        except Exception as e:
+            _docx2pdf_error = str(e)
+    if _docx2pdf_convert is None:
+        raise ImportError(_docx2pdf_error)
+    return _docx2pdf_convert
+
+
+# Last-resort renderer for hosts without LibreOffice: mammoth turns the document into
+# HTML and WeasyPrint lays it out. Pagination and styling only approximate Word's, so
+# it is used only when no office suite is installed. Resolved once like docx2pdf;
+# WeasyPrint raises OSError rather than ImportError when its system libraries are missing.
+_html_renderer = None
+_html_renderer_error: Optional[str] = None
+
+
+def _get_html_renderer():
+    """Return the (mammoth, weasyprint) modules, attempting the imports only on the first call.
+
+    Raises:
+        ImportError: If either package is not installed or could not be loaded
+    """
+    global _html_renderer, _html_renderer_error
+    if _html_renderer is None and _html_renderer_error is None:
+        try:
+            # A failed WeasyPrint import prints a notice; stdout carries the MCP protocol
+            with contextlib.redirect_stdout(sys.stderr):
+                import mammoth
+                import weasyprint
+
+            _html_renderer = (mammoth, weasyprint)
+        except Exception as e:
+            _html_renderer_error = str(e)
+    if _html_renderer is None:
+        raise ImportError(_html_renderer_error)
+    return _html_renderer
+
+
+def convert_with_html_renderer(filename: str, pdf_path: str) -> Optional[str]:
+    """Convert a document to PDF through HTML, without an office suite.
+
+    Args:
+        filename: Path to the source document
+        pdf_path: Path the PDF is written to
+
+    Returns:
+        None on success, otherwise an error message
+    """
+    try:
+        mammoth, weasyprint = _get_html_renderer()
+    except ImportError as e:
+        return f"mammoth/weasyprint not available: {e}"
+
+    try:
+        with open(filename, "rb") as f:
+            html = mammoth.convert_to_html(f).value
+        weasyprint.HTML(
+            string=html, base_url=os.path.dirname(os.path.abspath(filename))
+        ).write_pdf(pdf_path)
+        return None
+    except Exception as e:
+        return f"HTML renderer error: {str(e)}"
+
+
+# Persistent LibreOffice listener used through the UNO bridge. Starting soffice takes
+# seconds, so when python-uno is importable one headless instance is kept running
+# and every conversion is sent to it instead of spawning a new process.
+# It listens on a named pipe with a random name rather than a fixed TCP port, so a
+# listener started by another process or user is never mistaken for ours.
+_LO_SERVER: Optional[subprocess.Popen] = None
+_lo_server_url: Optional[str] = None
+_lo_server_profile: Optional[str] = None
+_lo_server_lock = threading.Lock()
+# After the listener fails to start, conversions go straight to soffice for a while
+_LO_SERVER_RETRY_AFTER = 300  # seconds
+_lo_server_failed_at: Optional[float] = None
+# Longest a single conversion may keep the listener busy, like the soffice subprocess
+_LO_SERVER_CONVERT_TIMEOUT = 120  # seconds
+
+
+def _stop_lo_server() -> None:
+    """Terminate the LibreOffice listener started by this process."""
+    global _LO_SERVER, _lo_server_profile
+    if _LO_SERVER is not None and _LO_SERVER.poll() is None:
+        _LO_SERVER.terminate()
+        try:
+            _LO_SERVER.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            _LO_SERVER.kill()
+    _LO_SERVER = None
+    if _lo_server_profile is not None:
+        shutil.rmtree(_lo_server_profile, ignore_errors=True)
+        _lo_server_profile = None
+
+
+atexit.register(_stop_lo_server)
+
+
+def _start_lo_server(connect: Callable[[str], Any]) -> Any:
+    """Return the component context of our LibreOffice listener, starting it if needed.
+
+    A listener that has exited or stopped answering is replaced by a new one.
+
+    Args:
+        connect: Resolves a UNO URL to its component context; raises while nothing
+            accepts connections on it
+
+    Returns:
+        The listener's component context, or None if no listener could be started
+    """
+    global _LO_SERVER, _lo_server_url, _lo_server_profile, _lo_server_failed_at
+    if _LO_SERVER is not None:
+        if _LO_SERVER.poll() is None:
+            try:
+                return connect(_lo_server_url)
+            except Exception:
+                pass
+        # Exited or wedged; start a fresh one below
+        _stop_lo_server()
+    if (
+        _lo_server_failed_at is not None
+        and time.monotonic() - _lo_server_failed_at < _LO_SERVER_RETRY_AFTER
+    ):
+        return None
+
+    lo_binary = find_libreoffice()
+    if not lo_binary:
+        _lo_server_failed_at = time.monotonic()
+        return None
+
+    # A private profile keeps the listener from attaching to, or locking, the
+    # profile of a LibreOffice instance the user has open
+    _lo_server_profile = tempfile.mkdtemp(prefix="word_mcp_lo_profile_")
+    pipe_name = f"word_mcp_lo_{os.getpid()}_{secrets.token_hex(8)}"
+    _lo_server_url = f"uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext"
+
+    _LO_SERVER = subprocess.Popen(
+        [
+            lo_binary,
+            "-env:UserInstallation=" + pathlib.Path(_lo_server_profile).as_uri(),
+            "--headless",
+            "--invisible",
+            "--nodefault",
+            "--nolockcheck",
+            "--nologo",
+            "--norestore",
+            f"--accept=pipe,name={pipe_name};urp;",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline and _LO_SERVER.poll() is None:
+        try:
+            return connect(_lo_server_url)
+        except Exception:
+            time.sleep(0.25)
+
+    _stop_lo_server()
+    _lo_server_failed_at = time.monotonic()
+    return None
+
+
+def convert_with_lo_server(filename: str, pdf_path: str) -> bool:
+    """Convert a document to PDF through the persistent LibreOffice listener.
+
+    Args:
+        filename: Path to the source document
+        pdf_path: Path the PDF is written to
+
+    Returns:
+        True on success, False if python-uno or the listener is unavailable or the
+        conversion failed, in which case callers should run LibreOffice directly
+    """
+    try:
+        import uno
+        from com.sun.star.beans import PropertyValue
+    except ImportError:
+        return False
+
+    def prop(name, value):
+        p = PropertyValue()
+        p.Name = name
+        p.Value = value
+        return p
+
+    # A single UNO connection is not safe to drive from several threads at once
+    with _lo_server_lock:
+        try:
+            local_ctx = uno.getComponentContext()
+            resolver = local_ctx.ServiceManager.createInstanceWithContext(
+                "com.sun.star.bridge.UnoUrlResolver", local_ctx
+            )
+            ctx = _start_lo_server(resolver.resolve)
+            if ctx is None:
+                return False
+            desktop = ctx.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", ctx
+            )
+        except Exception:
+            return False
+
+        converted = threading.Event()
+
+        def _convert():
+            try:
+                document = desktop.loadComponentFromURL(
+                    uno.systemPathToFileUrl(os.path.abspath(filename)),
+                    "_blank",
+                    0,
+                    (prop("Hidden", True),),
+                )
+                try:
+                    document.storeToURL(
+                        uno.systemPathToFileUrl(os.path.abspath(pdf_path)),
+                        (prop("FilterName", "writer_pdf_Export"),),
+                    )
+                finally:
+                    document.close(True)
+                converted.set()
+            except Exception:
+                # Reported to the caller as a failed conversion
+                pass
+
+        # UNO calls have no time limit of their own; a document that hangs LibreOffice
+        # must not hold the lock, so the listener is killed once the deadline passes
+        worker = threading.Thread(target=_convert, daemon=True)
+        worker.start()
+        worker.join(_LO_SERVER_CONVERT_TIMEOUT)
+        if worker.is_alive():
+            _stop_lo_server()
+            return False
+        return converted.is_set()
+
+
 def convert_docx_to_pdf_temp(filename: str, temp_dir: Optional[str] = None) -> Tuple[bool, str]:
     """Convert a DOCX file to a temporary PDF file.
     
@@ -49,46 +343,46 @@ def convert_docx_to_pdf_temp(filename: str, temp_dir: Optional[str] = None) -> T
         # Check if output file can be written
         is_writeable, error_message = check_file_writeable(temp_pdf_path)
         if not is_writeable:
-            os.unlink(temp_pdf_path)  # Clean up the temp file
+            cleanup_temp_file(temp_pdf_path)
             return False, f"Cannot create temporary PDF: {error_message}"
 
-        # Determine platform for appropriate conversion method
-        system = platform.system()
+        system = SYSTEM
 
         if system == "Windows":
             # On Windows, try docx2pdf which uses Microsoft Word
             try:
-                from docx2pdf import convert
-                convert(filename, temp_pdf_path)
+                get_docx2pdf_convert()(filename, temp_pdf_path)
                 return True, temp_pdf_path
             except (ImportError, Exception) as e:
-                os.unlink(temp_pdf_path)  # Clean up on failure
+                cleanup_temp_file(temp_pdf_path)  # Clean up on failure
                 return False, f"Failed to convert document to PDF: {str(e)}\nNote: docx2pdf requires Microsoft Word to be installed."
 
         elif system in ["Linux", "Darwin"]:  # Linux or macOS
             # Use LibreOffice for headless conversion (preferred for server environments)
             try:
-                # Choose the appropriate command based on OS
-                if system == "Darwin":  # macOS
-                    lo_commands = [
-                        "soffice",
-                        "/Applications/LibreOffice.app/Contents/MacOS/soffice",
-                    ]
-                else:  # Linux
-                    lo_commands = ["libreoffice", "soffice"]
-
-                # Try each possible command
                 conversion_successful = False
                 errors = []
+                lo_binary = find_libreoffice()
 
-                for cmd_name in lo_commands:
+                if not lo_binary:
+                    errors.append("LibreOffice executable not found")
+                    html_error = convert_with_html_renderer(filename, temp_pdf_path)
+                    if html_error is None:
+                        conversion_successful = True
+                    else:
+                        errors.append(html_error)
+                elif convert_with_lo_server(filename, temp_pdf_path):
+                    conversion_successful = True
+                else:
+                    # LibreOffice names its output after the source, so each conversion
+                    # writes into a private directory next to the temp PDF; conversions
+                    # of same-named documents cannot collide, and the final move is a
+                    # rename on the same filesystem
+                    output_dir = tempfile.mkdtemp(dir=os.path.dirname(temp_pdf_path))
                     try:
-                        # Get the directory for output
-                        output_dir = os.path.dirname(temp_pdf_path)
-                        
                         # Enhanced command for headless operation
                         cmd = [
-                            cmd_name,
+                            lo_binary,
                             "--headless",
                             "--invisible",
                             "--nodefault",
@@ -109,10 +403,12 @@ def convert_docx_to_pdf_temp(filename: str, temp_dir: Optional[str] = None) -> T
                             "HOME": os.path.expanduser("~"),  # Ensure HOME is set
                         })
 
+                        # Only stderr is ever reported, and only when the conversion fails
                         result = subprocess.run(
-                            cmd, 
-                            capture_output=True, 
-                            text=True, 
+                            cmd,
+                            stdin=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
                             timeout=120,  # Increased timeout for larger files
                             env=env
                         )
@@ -123,24 +419,25 @@ def convert_docx_to_pdf_temp(filename: str, temp_dir: Optional[str] = None) -> T
                             pdf_base_name = os.path.splitext(base_name)[0] + ".pdf"
                             created_pdf = os.path.join(output_dir, pdf_base_name)
 
-                            # If the created PDF is not at the desired location, move it
-                            if created_pdf != temp_pdf_path and os.path.exists(created_pdf):
-                                shutil.move(created_pdf, temp_pdf_path)
-
-                            conversion_successful = True
-                            break  # Exit the loop if successful
+                            try:
+                                os.replace(created_pdf, temp_pdf_path)
+                                conversion_successful = True
+                            except FileNotFoundError:
+                                errors.append(f"{lo_binary} error: no PDF was produced")
                         else:
-                            errors.append(f"{cmd_name} error (returncode {result.returncode}): {result.stderr.strip()}")
+                            errors.append(f"{lo_binary} error (returncode {result.returncode}): {result.stderr.decode('utf-8', errors='replace').strip()}")
                     except subprocess.TimeoutExpired:
-                        errors.append(f"{cmd_name} error: Conversion timed out after 120 seconds")
+                        errors.append(f"{lo_binary} error: Conversion timed out after 120 seconds")
                     except (subprocess.SubprocessError, FileNotFoundError) as e:
-                        errors.append(f"{cmd_name} error: {str(e)}")
+                        errors.append(f"{lo_binary} error: {str(e)}")
+                    finally:
+                        shutil.rmtree(output_dir, ignore_errors=True)
 
                 if conversion_successful:
                     return True, temp_pdf_path
                 else:
                     # For headless environments, don't fall back to docx2pdf (which opens GUI apps)
-                    os.unlink(temp_pdf_path)  # Clean up on failure
+                    cleanup_temp_file(temp_pdf_path)  # Clean up on failure
                     error_msg = "Failed to convert document to PDF using LibreOffice (headless mode).\n"
                     error_msg += "LibreOffice errors: " + "; ".join(errors) + "\n"
                     error_msg += "For headless operation, please ensure LibreOffice is properly installed:\n"
@@ -150,31 +447,159 @@ def convert_docx_to_pdf_temp(filename: str, temp_dir: Optional[str] = None) -> T
                     return False, error_msg
 
             except Exception as e:
-                os.unlink(temp_pdf_path)  # Clean up on failure
+                cleanup_temp_file(temp_pdf_path)  # Clean up on failure
                 return False, f"Failed to convert document to PDF: {str(e)}"
         else:
-            os.unlink(temp_pdf_path)  # Clean up on failure
+            cleanup_temp_file(temp_pdf_path)  # Clean up on failure
             return False, f"PDF conversion not supported on {system} platform"
 
     except Exception as e:
         # Clean up temporary file on any exception
-        if os.path.exists(temp_pdf_path):
-            os.unlink(temp_pdf_path)
+        cleanup_temp_file(temp_pdf_path)
         return False, f"Failed to convert document to PDF: {str(e)}"
 
 
+def _default_pdf_cache_dir() -> str:
+    """Per-user cache location; a shared, predictable /tmp path could be pre-created by anyone."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    if not os.path.isabs(base):
+        # No usable home directory: keep the cache private to this process
+        path = tempfile.mkdtemp(prefix="word_mcp_pdf_cache_")
+        atexit.register(shutil.rmtree, path, True)
+        return path
+    return os.path.join(base, "word_mcp", "pdf")
+
+
+# Converted PDFs kept between calls, keyed by the source document's version
+PDF_CACHE_DIR = _default_pdf_cache_dir()
+_PDF_CACHE_MAX_FILES = 32
+_PDF_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_PDF_CACHE_KEY_PREFIX_BYTES = 64 * 1024
+_PDF_CACHE_NAME_LENGTH = 44  # sha1 hex digest + ".pdf"
+# Every cache directory handed out so far, so cleanup_temp_file recognises their PDFs
+_pdf_cache_dirs = {os.path.abspath(PDF_CACHE_DIR)}
+
+
+def _pdf_cache_key(filename: str) -> str:
+    """Key a document version on its size, mtime and the hash of its first 64 KB."""
+    st = os.stat(filename)
+    digest = hashlib.sha1(f"{st.st_size}:{st.st_mtime_ns}:".encode())
+    with open(filename, "rb") as f:
+        digest.update(f.read(_PDF_CACHE_KEY_PREFIX_BYTES))
+    return digest.hexdigest()
+
+
+def _ensure_private_dir(path: str) -> bool:
+    """Create path with mode 0o700 if needed; True only if it is a real directory owned by us."""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, "getuid"):
+        if st.st_uid != os.getuid():
+            return False
+        if st.st_mode & 0o077:
+            os.chmod(path, 0o700)
+    return True
+
+
+def _evict_pdf_cache(cache_dir: str) -> None:
+    """Remove the least recently used PDFs until the cache is within its limits."""
+    try:
+        with os.scandir(cache_dir) as it:
+            # Only finished entries; conversions in progress write here under temporary names
+            entries = [
+                (e.stat(), e.path)
+                for e in it
+                if len(e.name) == _PDF_CACHE_NAME_LENGTH and e.name.endswith(".pdf")
+            ]
+    except OSError:
+        return
+
+    # Hits refresh the mtime, so the oldest mtime is the least recently used
+    entries.sort(key=lambda entry: entry[0].st_mtime_ns)
+    total = sum(st.st_size for st, _ in entries)
+    while entries and (len(entries) > _PDF_CACHE_MAX_FILES or total > _PDF_CACHE_MAX_BYTES):
+        st, path = entries.pop(0)
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        total -= st.st_size
+
+
+def convert_docx_to_pdf_cached(filename: str, cache_dir: Optional[str] = None) -> Tuple[bool, str]:
+    """Convert a DOCX file to PDF, reusing the PDF from an earlier call when the file is unchanged.
+
+    The returned PDF belongs to the cache and must not be modified; cleanup_temp_file
+    leaves it in place, so callers can release it the same way as a temporary PDF.
+
+    Args:
+        filename: Path to the source DOCX file
+        cache_dir: Directory holding cached PDFs (defaults to PDF_CACHE_DIR)
+
+    Returns:
+        Tuple of (success: bool, result: str)
+        - If success=True, result contains the path to the cached PDF
+        - If success=False, result contains the error message
+    """
+    if not os.path.exists(filename):
+        return False, f"Source document '{filename}' does not exist"
+
+    cache_dir = cache_dir or PDF_CACHE_DIR
+    try:
+        if not _ensure_private_dir(cache_dir):
+            # Another user's directory, or not a directory: never trust its contents
+            return convert_docx_to_pdf_temp(filename)
+        cached_pdf = os.path.join(cache_dir, _pdf_cache_key(filename) + ".pdf")
+        _pdf_cache_dirs.add(os.path.abspath(cache_dir))
+    except OSError:
+        # No usable cache; convert without one
+        return convert_docx_to_pdf_temp(filename)
+
+    try:
+        os.utime(cached_pdf)
+        return True, cached_pdf
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return convert_docx_to_pdf_temp(filename)
+
+    # Convert inside the cache directory so the rename below stays on one filesystem
+    success, result = convert_docx_to_pdf_temp(filename, temp_dir=cache_dir)
+    if not success:
+        return success, result
+    try:
+        # Readers only ever see a complete PDF under the cached name
+        os.replace(result, cached_pdf)
+    except OSError:
+        return True, result
+    _evict_pdf_cache(cache_dir)
+    return True, cached_pdf
+
+
+def _is_cached_pdf(file_path: str) -> bool:
+    directory, name = os.path.split(os.path.abspath(file_path))
+    return directory in _pdf_cache_dirs and len(name) == _PDF_CACHE_NAME_LENGTH
+
+
 def cleanup_temp_file(file_path: str) -> bool:
     """Safely remove a temporary file.
     
+    PDFs owned by the conversion cache are left in place.
+    
     Args:
         file_path: Path to the temporary file to remove
         
     Returns:
         True if file was successfully removed or didn't exist, False otherwise
     """
-    try:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
+    if _is_cached_pdf(file_path):
         return True
-    except Exception:
-        return False 
\ No newline at end of file
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    return True 
\ No newline at end of file
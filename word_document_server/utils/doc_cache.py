@@ -0,0 +1,210 @@
+"""
+Parsed document cache for Word Document Server.
+
+Parsing a .docx (unzipping the package and building the lxml tree) dominates the
+cost of read-only tools, so parsed Document objects are kept in a small LRU cache
+keyed by path, modification time and size. Any write to the file changes the key,
+so stale entries are never returned. The cache is bounded both by entry count and
+by the total size of the cached packages, since a parsed tree takes many times the
+memory of its compressed file; documents too large for the budget are not cached.
+
+Values derived from a cached document (such as a DocumentAnalyzer wrapping it)
+can be stored alongside it with ``load_derived`` and are dropped with it.
+
+Documents returned from the cache are shared between callers and must be treated
+as read-only. Tools that modify a document should take a private copy with
+``checkout_document(path)``, hand it back with ``checkin_document(path, doc)``
+once it has been saved, and call ``invalidate(path)`` to release the outdated
+read-only entry. A checked-in document is reused by the next write to the same
+unchanged file, so back-to-back edits parse the package only once.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+from docx import Document
+
+
+_MAX_ENTRIES = 32
+_MAX_BYTES = 64 * 1024 * 1024  # summed .docx file sizes
+
+# key -> (document, values derived from it)
+_cache: "OrderedDict[Tuple[str, int, int], Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+_cached_bytes = 0
+_lock = threading.Lock()
+
+# abspath -> (file identity, document) for documents handed back by writers.
+# Entries are owned by one writer at a time: checkout removes them.
+_MAX_WRITABLE = 4
+_writable: "OrderedDict[str, Tuple[Tuple[int, ...], Any]]" = OrderedDict()
+
+
+def _identity(st: os.stat_result) -> Tuple[int, ...]:
+    """
+    Stat fields that tell a checked-in document's file apart from any later version.
+
+    mtime and size alone miss a same-sized rewrite within the timestamp resolution
+    or one that restores the old mtime; the inode changes when the file is replaced
+    (as every save here does) and ctime changes on any in-place write.
+    """
+    return (st.st_dev, st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size)
+
+
+def _load(path: str, st: Optional[os.stat_result] = None) -> Tuple[Any, Dict[str, Any]]:
+    """Return the cache entry for a document, parsing and caching it on a miss."""
+    if st is None:
+        st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            return entry
+
+    # Parse outside the lock so different documents can load concurrently
+    entry = (Document(path), {})
+    if st.st_size > _MAX_BYTES:
+        return entry
+
+    global _cached_bytes
+    with _lock:
+        if key in _cache:
+            # Another thread parsed the same version first; keep its entry
+            _cache.move_to_end(key)
+            return _cache[key]
+        _cached_bytes += st.st_size
+        _cache[key] = entry
+        while len(_cache) > _MAX_ENTRIES or _cached_bytes > _MAX_BYTES:
+            evicted_key, _ = _cache.popitem(last=False)
+            _cached_bytes -= evicted_key[2]
+    return entry
+
+
+def load_document(path: str, st: Optional[os.stat_result] = None):
+    """
+    Load a Word document, reusing an already-parsed instance when the file is unchanged.
+
+    Args:
+        path: Path to the Word document
+        st: Result of os.stat(path) if the caller already has it
+
+    Returns:
+        A shared, read-only python-docx Document
+    """
+    return _load(path, st)[0]
+
+
+def cached_document(path: str, st: Optional[os.stat_result] = None):
+    """
+    Return the cached document for the file's current version without ever parsing it.
+
+    Args:
+        path: Path to the Word document
+        st: Result of os.stat(path) if the caller already has it
+
+    Returns:
+        A shared, read-only python-docx Document, or None if it is not cached
+    """
+    if st is None:
+        st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    with _lock:
+        entry = _cache.get(key)
+    return entry[0] if entry is not None else None
+
+
+def load_derived(
+    path: str,
+    name: str,
+    factory: Callable[[Any], Any],
+    st: Optional[os.stat_result] = None,
+) -> Any:
+    """
+    Return a value computed from a cached document, computing it once per file version.
+
+    Args:
+        path: Path to the Word document
+        name: Name the value is stored under for this document
+        factory: Called with the shared Document to build the value on first use
+        st: Result of os.stat(path) if the caller already has it
+
+    Returns:
+        The stored value
+    """
+    doc, derived = _load(path, st)
+    value = derived.get(name)
+    if value is None:
+        # Two threads may both build the value; either result is equivalent
+        value = derived.setdefault(name, factory(doc))
+    return value
+
+
+def checkout_document(path: str):
+    """
+    Take a document for modification.
+
+    The document saved by the previous write is reused when the file has not changed
+    since; otherwise the file is parsed. Either way the caller owns the document until
+    it is checked back in, and simply dropping it discards any unsaved changes.
+
+    Args:
+        path: Path to the Word document
+
+    Returns:
+        A python-docx Document that no other caller holds
+    """
+    st = os.stat(path)
+    with _lock:
+        entry = _writable.pop(os.path.abspath(path), None)
+    if entry is not None and entry[0] == _identity(st):
+        return entry[1]
+    return Document(path)
+
+
+def checkin_document(path: str, doc) -> None:
+    """
+    Hand back a checked-out document whose state matches the file on disk.
+
+    Call this only after the document was saved to path, or when it was left unmodified.
+
+    Args:
+        path: Path to the Word document
+        doc: The document returned by checkout_document
+    """
+    st = os.stat(path)
+    if st.st_size > _MAX_BYTES:
+        return
+    abspath = os.path.abspath(path)
+    with _lock:
+        _writable[abspath] = (_identity(st), doc)
+        _writable.move_to_end(abspath)
+        while len(_writable) > _MAX_WRITABLE:
+            _writable.popitem(last=False)
+
+
+def invalidate(path: str) -> None:
+    """
+    Drop every cached read-only version of a document.
+
+    Checked-in documents are kept; they are validated against the file on checkout.
+
+    Args:
+        path: Path to the Word document
+    """
+    global _cached_bytes
+    abspath = os.path.abspath(path)
+    with _lock:
+        for key in [key for key in _cache if key[0] == abspath]:
+            del _cache[key]
+            _cached_bytes -= key[2]
+
+
+def clear() -> None:
+    """Drop all cached documents."""
+    global _cached_bytes
+    with _lock:
+        _cache.clear()
+        _writable.clear()
+        _cached_bytes = 0
@@ -2,10 +2,28 @@
 Simplified document structure utilities using DocumentAnalyzer class.
 """
 
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Optional
+from .doc_cache import load_derived
 from .document_analyzer import DocumentAnalyzer
 
 
+def shared_analyzer(doc_path: str, st: Optional[os.stat_result] = None) -> DocumentAnalyzer:
+    """
+    Analyzer over the cached document, shared by all callers until the file changes.
+
+    Args:
+        doc_path: Path to the Word document
+        st: Result of os.stat(doc_path) if the caller already has it
+
+    Returns:
+        A DocumentAnalyzer that must only be used for reading
+    """
+    return load_derived(
+        doc_path, "analyzer", lambda doc: DocumentAnalyzer.from_document(doc, doc_path), st
+    )
+
+
 def get_document_structure_details(doc_path: str) -> Dict[str, Any]:
     """
     Get detailed structure information about a Word document including
@@ -17,7 +35,7 @@ def get_document_structure_details(doc_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary with comprehensive document structure details
     """
-    analyzer = DocumentAnalyzer(doc_path)
+    analyzer = shared_analyzer(doc_path)
     return analyzer.get_complete_structure()
 
 
@@ -36,7 +54,7 @@ def find_text(
     Returns:
         Dictionary with search results
     """
-    analyzer = DocumentAnalyzer(doc_path)
+    analyzer = shared_analyzer(doc_path)
     return analyzer.find_text(text_to_find, match_case, whole_word)
 
 
@@ -54,34 +72,24 @@ def is_element_empty_util(
     Returns:
         Dictionary indicating whether element is empty
     """
-    analyzer = DocumentAnalyzer(doc_path)
+    analyzer = shared_analyzer(doc_path)
 
     try:
+        # Only the requested element is read, not the whole document
         if element_type == "paragraph":
             if "paragraph_index" not in element_identifier:
                 return {
                     "error": "Missing 'paragraph_index' in element_identifier for paragraph type"
                 }
 
-            paragraphs = analyzer.get_paragraphs_analysis()
-            if not paragraphs:
-                return {"error": "Failed to analyze document paragraphs"}
-
-            para_index = element_identifier["paragraph_index"]
-            if not (0 <= para_index < len(paragraphs)):
-                return {
-                    "error": f"Invalid paragraph index: {para_index}. Document has {len(paragraphs)} paragraphs."
-                }
-
-            paragraph = paragraphs[para_index]
-            is_empty = not paragraph["text"].strip()
+            status = analyzer.get_paragraph_emptiness(element_identifier["paragraph_index"])
+            if "error" in status:
+                return status
 
             return {
                 "element_type": element_type,
                 "element_identifier": element_identifier,
-                "is_empty": is_empty,
-                "text_length": len(paragraph["text"]),
-                "has_content": bool(paragraph["text"].strip()),
+                **status,
             }
 
         elif element_type == "table_cell":
@@ -92,40 +100,18 @@ def is_element_empty_util(
                         "error": f"Missing '{key}' in element_identifier for table_cell type"
                     }
 
-            tables = analyzer.get_tables_analysis()
-            if not tables:
-                return {"error": "Failed to analyze document tables"}
-
-            table_index = element_identifier["table_index"]
-            if not (0 <= table_index < len(tables)):
-                return {
-                    "error": f"Invalid table index: {table_index}. Document has {len(tables)} tables."
-                }
-
-            table = tables[table_index]
-            row_index = element_identifier["row_index"]
-            col_index = element_identifier["col_index"]
-
-            if not (0 <= row_index < len(table["cells"])):
-                return {
-                    "error": f"Invalid row index: {row_index}. Table has {len(table['cells'])} rows."
-                }
-
-            if not (0 <= col_index < len(table["cells"][row_index])):
-                return {
-                    "error": f"Invalid column index: {col_index}. Row has {len(table['cells'][row_index])} columns."
-                }
-
-            cell = table["cells"][row_index][col_index]
-            is_empty = not cell["text"].strip()
+            status = analyzer.get_cell_emptiness(
+                element_identifier["table_index"],
+                element_identifier["row_index"],
+                element_identifier["col_index"],
+            )
+            if "error" in status:
+                return status
 
             return {
                 "element_type": element_type,
                 "element_identifier": element_identifier,
-                "is_empty": is_empty,
-                "text_length": len(cell["text"]),
-                "has_content": bool(cell["text"].strip()),
-                "paragraph_count": len(cell["paragraphs"]),
+                **status,
             }
 
         else:
@@ -2,9 +2,173 @@
 DocumentAnalyzer class for analyzing Word document structure and content.
 """
 
+import atexit
+import functools
+import hashlib
+import io
+import multiprocessing
 import os
-from typing import Dict, Any, List
+import re
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from docx import Document
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.parser import element_class_lookup, parse_xml
+from docx.styles.styles import Styles
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from lxml import etree
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; multi-text search falls back to str.find
+    ahocorasick = None
+
+
+_BODY = qn("w:body")
+_P = qn("w:p")
+_R = qn("w:r")
+_HYPERLINK = qn("w:hyperlink")
+_TBL = qn("w:tbl")
+_SECT_PR = qn("w:sectPr")
+
+# Cell properties of every top-level cell of a table, fetched in one call
+_TABLE_TC_PR = etree.XPath("w:tr/w:tc/w:tcPr", namespaces={"w": nsmap["w"]})
+_NO_MERGE = {"grid_span": 1, "v_merge": None}
+
+# Tables of a streamed document are analyzed in worker processes only when the
+# body, and the tables in it, are large enough to repay shipping them to the pool
+_PARALLEL_MIN_XML_BYTES = 8 * 1024 * 1024
+_PARALLEL_MIN_TABLE_BYTES = 4 * 1024 * 1024
+
+# Content of every w:t element; only valid where the main namespace uses the w prefix
+_W_T_RE = re.compile(rb"<w:t(?:\s[^>]*)?>([^<]*)</w:t>")
+_W_NS_DECL = b'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+# Characters that can be escaped in the XML or produced from elements (w:tab, w:br,
+# w:noBreakHyphen), so the raw w:t content cannot rule out a match containing them
+_PREFILTER_UNSAFE = frozenset("&<>\"'\t\n\r-")
+
+
+@functools.lru_cache(maxsize=64)
+def _whole_word_pattern(search_text: str, match_case: bool) -> "re.Pattern[str]":
+    """
+    Compiled pattern matching search_text only where it is not part of a longer word.
+
+    Lookarounds are used instead of \b so queries that start or end with punctuation
+    (such as "C++") still match.
+    """
+    flags = 0 if match_case else re.IGNORECASE
+    return re.compile(r"(?<!\w)" + re.escape(search_text) + r"(?!\w)", flags)
+
+
+def _is_word_char(ch: str) -> bool:
+    """True for characters the regex class \\w matches."""
+    return ch.isalnum() or ch == "_"
+
+
+def _whole_word_matches(
+    text: str, matches: Iterable[Tuple[str, int]]
+) -> Iterator[Tuple[str, int]]:
+    """
+    The (needle, position) matches _whole_word_pattern would find in text.
+
+    Like re.finditer, each needle's matches are taken from the left and one that
+    overlaps the previous match taken for the same needle is skipped, so texts that
+    can overlap themselves are counted the same way as by find_text.
+    """
+    taken_until: Dict[str, int] = {}
+    for needle, pos in sorted(matches, key=lambda match: match[1]):
+        end = pos + len(needle)
+        if pos < taken_until.get(needle, 0):
+            continue
+        if (pos > 0 and _is_word_char(text[pos - 1])) or (
+            end < len(text) and _is_word_char(text[end])
+        ):
+            continue
+        taken_until[needle] = end
+        yield needle, pos
+
+
+def _whole_word_occurrence(
+    para_text: str, words: List[str], start: int, para_index: int
+) -> Dict[str, Any]:
+    """Occurrence record for a whole-word match starting at start in para_text."""
+    # Index of the whitespace-separated word the match starts in
+    prefix = para_text[:start]
+    word_idx = len(prefix.split())
+    if prefix and not prefix[-1].isspace():
+        word_idx -= 1
+    return {
+        "paragraph_index": para_index,
+        "word_index": word_idx,
+        "position": start,
+        "text": para_text,
+        "context": " ".join(words[max(0, word_idx - 2) : word_idx + 3]),
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _self_overlapping(needle: str) -> bool:
+    """True if two occurrences of needle can overlap, i.e. a proper prefix is also a suffix."""
+    return any(needle.endswith(needle[:k]) for k in range(1, len(needle)))
+
+
+@functools.lru_cache(maxsize=256)
+def _ignore_case_pattern(search_text: str) -> "re.Pattern[str]":
+    """Literal pattern that ignores case; the regex engine folds case without copying the text."""
+    return re.compile(re.escape(search_text), re.IGNORECASE)
+
+
+def _iter_positions(text: str, search_text: str, match_case: bool) -> Iterator[int]:
+    """Yield the start of every occurrence of search_text in text, overlapping ones included."""
+    if match_case:
+        pos = text.find(search_text)
+        while pos != -1:
+            yield pos
+            pos = text.find(search_text, pos + 1)
+    else:
+        search = _ignore_case_pattern(search_text).search
+        match = search(text)
+        while match is not None:
+            yield match.start()
+            match = search(text, match.start() + 1)
+
+
+def _has_no_text(p) -> bool:
+    """
+    True when a w:p has no run or hyperlink children, so paragraph.text is certainly empty.
+
+    Cheaper than reading paragraph.text, which runs an XPath query and joins the runs.
+    """
+    return next(p.iterchildren(_R, _HYPERLINK), None) is None
+
+
+def _is_blank(text: str) -> bool:
+    """True for empty or whitespace-only text, without building a stripped copy."""
+    return not text or text.isspace()
+
+
+def _analyze_runs(runs) -> List[Dict[str, Any]]:
+    """Formatting of each run plus its index, as one flat dict per run."""
+    analyzed = []
+    for idx, run in enumerate(runs):
+        font = run.font
+        font_size = font.size
+        analyzed.append(
+            {
+                "text": run.text,
+                "bold": run.bold,
+                "italic": run.italic,
+                "underline": run.underline,
+                "font_name": font.name,
+                "font_size": font_size.pt if font_size is not None else None,
+                "index": idx,
+            }
+        )
+    return analyzed
 
 
 class RunAnalyzer:
@@ -12,37 +176,64 @@ class RunAnalyzer:
 
     @staticmethod
     def analyze_run(run) -> Dict[str, Any]:
-        """Extract formatting information from a single run."""
+        """Extract formatting information from a single run; font_size is in points."""
+        font = run.font
+        font_size = font.size
         return {
             "text": run.text,
             "bold": run.bold,
             "italic": run.italic,
             "underline": run.underline,
-            "font_name": run.font.name,
-            "font_size": str(run.font.size) if run.font.size else None,
+            "font_name": font.name,
+            "font_size": font_size.pt if font_size is not None else None,
         }
 
     @staticmethod
     def analyze_runs(runs) -> List[Dict[str, Any]]:
         """Analyze a collection of runs."""
-        return [
-            {**RunAnalyzer.analyze_run(run), "index": idx}
-            for idx, run in enumerate(runs)
-        ]
+        return _analyze_runs(runs)
 
 
 class ParagraphAnalyzer:
     """Helper class for analyzing paragraph content and formatting."""
 
-    def __init__(self):
-        self.run_analyzer = RunAnalyzer()
+    @staticmethod
+    def _paragraph_text(p, runs: List[Dict[str, Any]]) -> str:
+        """Same as paragraph.text, reusing the text already read from each run."""
+        run_texts = iter([run["text"] for run in runs])
+        return "".join(
+            next(run_texts) if child.tag == _R else child.text
+            for child in p.iterchildren(_R, _HYPERLINK)
+        )
+
+    @staticmethod
+    def _style_name(paragraph, style_names: Dict[Any, str] = None) -> str:
+        """
+        Name of the paragraph's style, looked up once per style id when style_names is given.
+
+        Resolving paragraph.style searches the styles part, so callers analyzing many
+        paragraphs of one document pass a dict that lives as long as that document.
+        """
+        if style_names is None:
+            style = paragraph.style
+            return style.name if style else "Normal"
+
+        style_id = paragraph._p.style
+        if style_id not in style_names:
+            style = paragraph.style
+            style_names[style_id] = style.name if style else "Normal"
+        return style_names[style_id]
 
-    def analyze_paragraph(self, paragraph, index: int = None) -> Dict[str, Any]:
+    @staticmethod
+    def analyze_paragraph(
+        paragraph, index: int = None, style_names: Dict[Any, str] = None
+    ) -> Dict[str, Any]:
         """Analyze a single paragraph including its runs."""
+        runs = _analyze_runs(paragraph.runs)
         para_info = {
-            "text": paragraph.text,
-            "style": paragraph.style.name if paragraph.style else "Normal",
-            "runs": self.run_analyzer.analyze_runs(paragraph.runs),
+            "text": ParagraphAnalyzer._paragraph_text(paragraph._p, runs),
+            "style": ParagraphAnalyzer._style_name(paragraph, style_names),
+            "runs": runs,
         }
 
         if index is not None:
@@ -50,51 +241,72 @@ class ParagraphAnalyzer:
 
         return para_info
 
-    def analyze_paragraphs(self, paragraphs) -> List[Dict[str, Any]]:
+    @staticmethod
+    def analyze_paragraphs(paragraphs, style_names: Dict[Any, str] = None) -> List[Dict[str, Any]]:
         """Analyze a collection of paragraphs."""
-        return [
-            self.analyze_paragraph(para, idx) for idx, para in enumerate(paragraphs)
-        ]
+        if style_names is None:
+            style_names = {}
+        analyze = ParagraphAnalyzer.analyze_paragraph
+        return [analyze(para, idx, style_names) for idx, para in enumerate(paragraphs)]
 
 
 class TableCellAnalyzer:
     """Helper class for analyzing table cell content and formatting."""
 
-    def __init__(self):
-        self.paragraph_analyzer = ParagraphAnalyzer()
-
-    def _extract_cell_formatting(self, cell) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_cell_formatting(cell) -> Dict[str, Any]:
         """Extract merge and span information from a cell."""
-        try:
-            tc_element = cell._tc
-            grid_span = tc_element.tcPr.gridSpan
-            grid_span_val = grid_span.val if grid_span is not None else 1
-
-            v_merge = tc_element.tcPr.vMerge
-            v_merge_val = (
-                v_merge.val
-                if v_merge is not None and v_merge.val
-                else ("continue" if v_merge is not None else None)
-            )
+        return TableCellAnalyzer._merge_info(cell._tc.tcPr)
+
+    @staticmethod
+    def _merge_info(tc_pr) -> Dict[str, Any]:
+        """Merge and span information from a cell's tcPr element, which may be absent."""
+        if tc_pr is None:
+            return dict(_NO_MERGE)
+
+        grid_span = tc_pr.gridSpan
+        v_merge = tc_pr.vMerge
+        return {
+            "grid_span": grid_span.val if grid_span is not None else 1,
+            # A vMerge without a val continues the merge above
+            "v_merge": (v_merge.val or "continue") if v_merge is not None else None,
+        }
+
+    @staticmethod
+    def extract_table_formatting(table) -> Dict[Any, Dict[str, Any]]:
+        """
+        Extract merge and span information for every cell of a table at once.
 
-            return {"grid_span": grid_span_val, "v_merge": v_merge_val}
-        except (AttributeError, TypeError):
-            return {"grid_span": 1, "v_merge": None}
+        Returns a mapping from w:tc element to the cell's formatting; cells without
+        properties are left out and have no merge or span.
+        """
+        merge_info = TableCellAnalyzer._merge_info
+        return {tc_pr.getparent(): merge_info(tc_pr) for tc_pr in _TABLE_TC_PR(table._tbl)}
 
-    def analyze_cell(self, cell, row_idx: int, col_idx: int) -> Dict[str, Any]:
-        """Analyze a single table cell."""
+    @staticmethod
+    def analyze_cell(
+        cell,
+        row_idx: int,
+        col_idx: int,
+        formatting: Dict[str, Any] = None,
+        style_names: Dict[Any, str] = None,
+    ) -> Dict[str, Any]:
+        """Analyze a single table cell, optionally with its already extracted formatting."""
+        analyze_paragraph = ParagraphAnalyzer.analyze_paragraph
+        paragraphs = [
+            analyze_paragraph(para, style_names=style_names) for para in cell.paragraphs
+        ]
         cell_info = {
             "row": row_idx,
             "column": col_idx,
-            "text": cell.text,
-            "paragraphs": [
-                self.paragraph_analyzer.analyze_paragraph(para)
-                for para in cell.paragraphs
-            ],
+            # Same as cell.text, without reading every run a second time
+            "text": "\n".join(para["text"] for para in paragraphs),
+            "paragraphs": paragraphs,
         }
 
         # Add formatting information
-        formatting = self._extract_cell_formatting(cell)
+        if formatting is None:
+            formatting = TableCellAnalyzer._extract_cell_formatting(cell)
         cell_info.update(formatting)
 
         return cell_info
@@ -103,10 +315,10 @@ class TableCellAnalyzer:
 class TableAnalyzer:
     """Helper class for analyzing table structure and content."""
 
-    def __init__(self):
-        self.cell_analyzer = TableCellAnalyzer()
-
-    def analyze_table(self, table, index: int = None) -> Dict[str, Any]:
+    @staticmethod
+    def analyze_table(
+        table, index: int = None, style_names: Dict[Any, str] = None
+    ) -> Dict[str, Any]:
         """Analyze a single table including all its cells."""
         table_info = {
             "rows": len(table.rows),
@@ -117,19 +329,31 @@ class TableAnalyzer:
         if index is not None:
             table_info["index"] = index
 
+        merge_info = TableCellAnalyzer.extract_table_formatting(table)
+        analyze_cell = TableCellAnalyzer.analyze_cell
+        if style_names is None:
+            style_names = {}
+
         # Analyze each row and cell
         for row_idx, row in enumerate(table.rows):
-            row_cells = []
-            for col_idx, cell in enumerate(row.cells):
-                cell_info = self.cell_analyzer.analyze_cell(cell, row_idx, col_idx)
-                row_cells.append(cell_info)
-            table_info["cells"].append(row_cells)
+            table_info["cells"].append(
+                [
+                    analyze_cell(
+                        cell, row_idx, col_idx, merge_info.get(cell._tc, _NO_MERGE), style_names
+                    )
+                    for col_idx, cell in enumerate(row.cells)
+                ]
+            )
 
         return table_info
 
-    def analyze_tables(self, tables) -> List[Dict[str, Any]]:
+    @staticmethod
+    def analyze_tables(tables, style_names: Dict[Any, str] = None) -> List[Dict[str, Any]]:
         """Analyze a collection of tables."""
-        return [self.analyze_table(table, idx) for idx, table in enumerate(tables)]
+        if style_names is None:
+            style_names = {}
+        analyze = TableAnalyzer.analyze_table
+        return [analyze(table, idx, style_names) for idx, table in enumerate(tables)]
 
 
 class StyleAnalyzer:
@@ -161,11 +385,15 @@ class DocumentAnalyzer:
         """Initialize with a document path."""
         self.doc_path = doc_path
         self._doc = None
+        # Style id -> name for self._doc, filled in as paragraphs are analyzed
+        self._style_names: Dict[Any, str] = {}
 
-        # Initialize analyzers
-        self.style_analyzer = StyleAnalyzer()
-        self.paragraph_analyzer = ParagraphAnalyzer()
-        self.table_analyzer = TableAnalyzer()
+    @classmethod
+    def from_document(cls, doc, doc_path: str = ""):
+        """Create an instance around an already-parsed document instead of loading one."""
+        instance = cls(doc_path)
+        instance._doc = doc
+        return instance
 
     def _load_document(self) -> Dict[str, Any]:
         """Load and validate the document."""
@@ -198,7 +426,7 @@ class DocumentAnalyzer:
             if "error" in load_result:
                 return []
 
-        return self.style_analyzer.analyze_styles(self._doc.styles)
+        return StyleAnalyzer.analyze_styles(self._doc.styles)
 
     def get_paragraphs_analysis(self) -> List[Dict[str, Any]]:
         """Get detailed analysis of all paragraphs."""
@@ -207,7 +435,18 @@ class DocumentAnalyzer:
             if "error" in load_result:
                 return []
 
-        return self.paragraph_analyzer.analyze_paragraphs(self._doc.paragraphs)
+        return list(self.iter_paragraphs())
+
+    def iter_paragraphs(self) -> Iterator[Dict[str, Any]]:
+        """Yield the analysis of each paragraph in turn rather than building the full list."""
+        if not self._doc:
+            load_result = self._load_document()
+            if "error" in load_result:
+                return
+
+        analyze = ParagraphAnalyzer.analyze_paragraph
+        for idx, para in enumerate(self._doc.paragraphs):
+            yield analyze(para, idx, self._style_names)
 
     def get_tables_analysis(self) -> List[Dict[str, Any]]:
         """Get detailed analysis of all tables."""
@@ -216,7 +455,18 @@ class DocumentAnalyzer:
             if "error" in load_result:
                 return []
 
-        return self.table_analyzer.analyze_tables(self._doc.tables)
+        return list(self.iter_tables())
+
+    def iter_tables(self) -> Iterator[Dict[str, Any]]:
+        """Yield the analysis of each table in turn rather than building the full list."""
+        if not self._doc:
+            load_result = self._load_document()
+            if "error" in load_result:
+                return
+
+        analyze = TableAnalyzer.analyze_table
+        for idx, table in enumerate(self._doc.tables):
+            yield analyze(table, idx, self._style_names)
 
     def get_complete_structure(self) -> Dict[str, Any]:
         """Get complete document structure analysis."""
@@ -226,19 +476,100 @@ class DocumentAnalyzer:
                 return load_result
 
         try:
+            # One pass over each collection; the counts come from the same lists
+            doc = self._doc
+            paragraphs = doc.paragraphs
+            tables = doc.tables
+            style_names = self._style_names
+            analyze_paragraph = ParagraphAnalyzer.analyze_paragraph
+            analyze_table = TableAnalyzer.analyze_table
             return {
-                "document_info": self.get_basic_info(),
-                "styles": self.get_styles(),
-                "paragraphs": self.get_paragraphs_analysis(),
-                "tables": self.get_tables_analysis(),
+                "document_info": {
+                    "paragraph_count": len(paragraphs),
+                    "table_count": len(tables),
+                    "section_count": len(doc.sections),
+                },
+                "styles": StyleAnalyzer.analyze_styles(doc.styles),
+                "paragraphs": [
+                    analyze_paragraph(para, idx, style_names)
+                    for idx, para in enumerate(paragraphs)
+                ],
+                "tables": [
+                    analyze_table(table, idx, style_names) for idx, table in enumerate(tables)
+                ],
             }
         except Exception as e:
             return {"error": f"Failed to get document structure details: {str(e)}"}
 
+    def get_paragraph_emptiness(self, paragraph_index: int) -> Dict[str, Any]:
+        """Check whether one body paragraph is empty without analyzing the others."""
+        if not self._doc:
+            load_result = self._load_document()
+            if "error" in load_result:
+                return load_result
+
+        paragraphs = self._doc.element.body.findall(_P)
+        if not (0 <= paragraph_index < len(paragraphs)):
+            return {
+                "error": f"Invalid paragraph index: {paragraph_index}. Document has {len(paragraphs)} paragraphs."
+            }
+
+        text = Paragraph(paragraphs[paragraph_index], self._doc._body).text
+        is_empty = _is_blank(text)
+        return {
+            "is_empty": is_empty,
+            "text_length": len(text),
+            "has_content": not is_empty,
+        }
+
+    def get_cell_emptiness(
+        self, table_index: int, row_index: int, col_index: int
+    ) -> Dict[str, Any]:
+        """Check whether one table cell is empty without analyzing the other tables."""
+        if not self._doc:
+            load_result = self._load_document()
+            if "error" in load_result:
+                return load_result
+
+        tables = self._doc.element.body.findall(_TBL)
+        if not (0 <= table_index < len(tables)):
+            return {
+                "error": f"Invalid table index: {table_index}. Document has {len(tables)} tables."
+            }
+
+        rows = Table(tables[table_index], self._doc._body).rows
+        if not (0 <= row_index < len(rows)):
+            return {"error": f"Invalid row index: {row_index}. Table has {len(rows)} rows."}
+
+        # row.cells expands merged cells the same way the full table analysis does
+        cells = rows[row_index].cells
+        if not (0 <= col_index < len(cells)):
+            return {
+                "error": f"Invalid column index: {col_index}. Row has {len(cells)} columns."
+            }
+
+        cell = cells[col_index]
+        text = cell.text
+        is_empty = _is_blank(text)
+        return {
+            "is_empty": is_empty,
+            "text_length": len(text),
+            "has_content": not is_empty,
+            "paragraph_count": len(cell.paragraphs),
+        }
+
     def find_text(
-        self, text_to_find: str, match_case: bool = True, whole_word: bool = False
+        self,
+        text_to_find: str,
+        match_case: bool = True,
+        whole_word: bool = False,
+        count_only: bool = False,
     ) -> Dict[str, Any]:
-        """Find all occurrences of specific text in the document."""
+        """
+        Find all occurrences of specific text in the document.
+
+        With count_only, only total_count is computed and no occurrences are listed.
+        """
         if not self._doc:
             load_result = self._load_document()
             if "error" in load_result:
@@ -248,48 +579,107 @@ class DocumentAnalyzer:
             return {"error": "Search text cannot be empty"}
 
         try:
-            results = {
+            if count_only:
+                count = self._count_in_paragraph
+                return {
+                    "query": text_to_find,
+                    "match_case": match_case,
+                    "whole_word": whole_word,
+                    "total_count": sum(
+                        count(para, text_to_find, match_case, whole_word)
+                        for para, _, _ in self._iter_search_paragraphs()
+                    ),
+                }
+
+            find = self._find_text_in_paragraph
+            occurrences = [
+                occurrence
+                for para, para_idx, location_context in self._iter_search_paragraphs()
+                for occurrence in find(
+                    para, text_to_find, para_idx, match_case, whole_word, location_context
+                )
+            ]
+            return {
                 "query": text_to_find,
                 "match_case": match_case,
                 "whole_word": whole_word,
-                "occurrences": [],
-                "total_count": 0,
+                "occurrences": occurrences,
+                "total_count": len(occurrences),
             }
 
-            # Search in paragraphs
-            for i, para in enumerate(self._doc.paragraphs):
-                occurrences = self._find_text_in_paragraph(
-                    para, text_to_find, i, match_case, whole_word
-                )
-                results["occurrences"].extend(occurrences)
-
-            # Search in table cells
-            for table_idx, table in enumerate(self._doc.tables):
-                for row_idx, row in enumerate(table.rows):
-                    for col_idx, cell in enumerate(row.cells):
-                        for para_idx, para in enumerate(cell.paragraphs):
-                            occurrences = self._find_text_in_paragraph(
-                                para,
-                                text_to_find,
-                                para_idx,
-                                match_case,
-                                whole_word,
-                                location_context={
-                                    "table_index": table_idx,
-                                    "row_index": row_idx,
-                                    "col_index": col_idx,
-                                },
-                            )
-                            results["occurrences"].extend(occurrences)
-
-            results["total_count"] = len(results["occurrences"])
-            return results
-
         except Exception as e:
             return {"error": f"Failed to search for text: {str(e)}"}
 
+    def find_many_texts(
+        self, texts: List[str], match_case: bool = True, whole_word: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Find all occurrences of several texts, in the format of find_many_texts_streaming.
+        """
+        texts = list(dict.fromkeys(text for text in texts if text))
+        if not texts:
+            return {"error": "Search texts cannot be empty"}
+
+        results = {
+            "queries": texts,
+            "match_case": match_case,
+            "whole_word": whole_word,
+            "results": {},
+            "total_count": 0,
+        }
+        for text in texts:
+            found = self.find_text(text, match_case, whole_word)
+            if "error" in found:
+                return found
+            results["results"][text] = {
+                "occurrences": found["occurrences"],
+                "total_count": found["total_count"],
+            }
+            results["total_count"] += found["total_count"]
+        return results
+
+    def _iter_search_paragraphs(self):
+        """
+        Yield (paragraph, index, location_context) for body paragraphs, then for the
+        paragraphs of every table cell, with one location dict per cell.
+        """
+        for i, para in enumerate(self._doc.paragraphs):
+            yield para, i, None
+
+        for table_idx, table in enumerate(self._doc.tables):
+            for row_idx, row in enumerate(table.rows):
+                for col_idx, cell in enumerate(row.cells):
+                    location_context = {
+                        "table_index": table_idx,
+                        "row_index": row_idx,
+                        "col_index": col_idx,
+                    }
+                    for para_idx, para in enumerate(cell.paragraphs):
+                        yield para, para_idx, location_context
+
+    @staticmethod
+    def _count_in_paragraph(
+        paragraph, search_text: str, match_case: bool, whole_word: bool
+    ) -> int:
+        """Number of occurrences _find_text_in_paragraph would report, without building them."""
+        if _has_no_text(paragraph._p):
+            return 0
+
+        para_text = paragraph.text
+        if whole_word:
+            return sum(1 for _ in _whole_word_pattern(search_text, match_case).finditer(para_text))
+
+        # Counting skips past each match, which only differs from the overlapping
+        # search for texts that can overlap themselves
+        if match_case:
+            if not _self_overlapping(search_text):
+                return para_text.count(search_text)
+        elif search_text.isascii() and not _self_overlapping(search_text.lower()):
+            return len(_ignore_case_pattern(search_text).findall(para_text))
+        return sum(1 for _ in _iter_positions(para_text, search_text, match_case))
+
+    @staticmethod
     def _find_text_in_paragraph(
-        self,
         paragraph,
         search_text: str,
         para_index: int,
@@ -298,51 +688,533 @@ class DocumentAnalyzer:
         location_context: Dict[str, Any] = None,
     ) -> List[Dict[str, Any]]:
         """Find text occurrences within a single paragraph."""
+        occurrences = []
+
+        # Empty paragraphs are common, especially in table cells
+        if _has_no_text(paragraph._p):
+            return occurrences
+
+        if whole_word:
+            para_text = paragraph.text
+            words = None
+            for match in _whole_word_pattern(search_text, match_case).finditer(para_text):
+                if words is None:
+                    words = para_text.split()
+                occurrence = _whole_word_occurrence(para_text, words, match.start(), para_index)
+                if location_context:
+                    occurrence.update(location_context)
+                occurrences.append(occurrence)
+            return occurrences
+
+        # paragraph.text re-joins every run, so it is read once
         para_text = paragraph.text
-        search_text_compare = search_text
 
-        if not match_case:
-            para_text = para_text.lower()
-            search_text_compare = search_text_compare.lower()
+        for pos in _iter_positions(para_text, search_text, match_case):
+            occurrence = {
+                "paragraph_index": para_index,
+                "position": pos,
+                "text": para_text,
+                "context": para_text[max(0, pos - 20) : pos + len(search_text) + 20],
+            }
+            if location_context:
+                occurrence.update(location_context)
 
-        occurrences = []
-        start_pos = 0
+            occurrences.append(occurrence)
+
+        return occurrences
+
+
+def find_text_streaming(
+    doc_path: str,
+    text_to_find: str,
+    match_case: bool = True,
+    whole_word: bool = False,
+    count_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    Find all occurrences of text by streaming word/document.xml.
+
+    Returns the same result as DocumentAnalyzer.find_text, but parses body-level
+    paragraphs and tables one at a time and discards each once searched, so the
+    full document tree is never built or retained. Documents that cannot contain
+    the text at all are rejected from the raw XML bytes without any parsing.
+    """
+    if not text_to_find:
+        return {"error": "Search text cannot be empty"}
+
+    results = {
+        "query": text_to_find,
+        "match_case": match_case,
+        "whole_word": whole_word,
+        "occurrences": [],
+        "total_count": 0,
+    }
+    if count_only:
+        del results["occurrences"]
+
+    with zipfile.ZipFile(doc_path) as z:
+        info = z.getinfo("word/document.xml")
+        # The central directory gives the uncompressed size without inflating anything
+        if info.file_size < len(text_to_find.encode("utf-8")):
+            return results
+        xml = z.read(info)
+
+    if not _xml_may_contain(xml, text_to_find, match_case):
+        return results
+
+    if count_only:
+        count = DocumentAnalyzer._count_in_paragraph
+        results["total_count"] = sum(
+            count(paragraph, text_to_find, match_case, whole_word)
+            for paragraph, _, _ in _iter_paragraphs(xml)
+        )
+        return results
 
-        while True:
+    find = DocumentAnalyzer._find_text_in_paragraph
+    paragraph_occurrences = []
+    table_occurrences = []
+
+    for paragraph, para_idx, location_context in _iter_paragraphs(xml):
+        occurrences = find(
+            paragraph,
+            text_to_find,
+            para_idx,
+            match_case,
+            whole_word,
+            location_context=location_context,
+        )
+        if location_context:
+            table_occurrences.extend(occurrences)
+        else:
+            paragraph_occurrences.extend(occurrences)
+
+    results["occurrences"] = paragraph_occurrences + table_occurrences
+    results["total_count"] = len(results["occurrences"])
+    return results
+
+
+def find_many_texts_streaming(
+    doc_path: str, texts: List[str], match_case: bool = True, whole_word: bool = False
+) -> Dict[str, Any]:
+    """
+    Find all occurrences of several texts in a single pass over word/document.xml.
+
+    When pyahocorasick is installed, every paragraph is scanned once with an
+    Aho-Corasick automaton regardless of how many texts are searched for;
+    otherwise each text is located with str.find within the same pass. Ignoring
+    case, lowercasing is only equivalent to find_text's re.IGNORECASE matching
+    for ASCII, so non-ASCII texts and paragraphs are searched with that pattern.
+
+    Args:
+        doc_path: Path to the Word document
+        texts: Texts to search for; empty strings and duplicates are ignored
+        match_case: Whether to perform case-sensitive search
+        whole_word: Whether to match whole words only; matches adjoining a word
+            character are dropped and overlapping ones are skipped as in find_text
+
+    Returns:
+        Dictionary with the occurrences of each text, in the format used by find_text
+    """
+    texts = list(dict.fromkeys(text for text in texts if text))
+    if not texts:
+        return {"error": "Search texts cannot be empty"}
+
+    # Several texts can compare equal once case is ignored. Needles are what the
+    # automaton searches for; non-ASCII texts are kept as given when ignoring case
+    needles: Dict[str, List[str]] = {}
+    for text in texts:
+        fold = not match_case and text.isascii()
+        needles.setdefault(text.lower() if fold else text, []).append(text)
+
+    results = {
+        "queries": texts,
+        "match_case": match_case,
+        "whole_word": whole_word,
+        "results": {text: {"occurrences": [], "total_count": 0} for text in texts},
+        "total_count": 0,
+    }
+
+    with zipfile.ZipFile(doc_path) as z:
+        info = z.getinfo("word/document.xml")
+        # Texts longer than the whole uncompressed XML cannot occur in it
+        needles = {
+            needle: originals
+            for needle, originals in needles.items()
+            if len(needle.encode("utf-8")) <= info.file_size
+        }
+        if not needles:
+            return results
+        xml = z.read(info)
+
+    needles = {
+        needle: originals
+        for needle, originals in needles.items()
+        if _xml_may_contain(xml, needle, match_case)
+    }
+    if not needles:
+        return results
+
+    if match_case:
+        fast_needles = list(needles)
+        pattern_needles = []
+    else:
+        fast_needles = [needle for needle in needles if needle.isascii()]
+        pattern_needles = [needle for needle in needles if not needle.isascii()]
+
+    if ahocorasick is not None and fast_needles:
+        automaton = ahocorasick.Automaton()
+        for needle in fast_needles:
+            automaton.add_word(needle, needle)
+        automaton.make_automaton()
+
+        def fast_matches(text):
+            for end, needle in automaton.iter(text):
+                yield needle, end - len(needle) + 1
+    else:
+        def fast_matches(text):
+            for needle in fast_needles:
+                pos = text.find(needle)
+                while pos != -1:
+                    yield needle, pos
+                    pos = text.find(needle, pos + 1)
+
+    def pattern_matches(text, selected):
+        for needle in selected:
+            for pos in _iter_positions(text, needle, False):
+                yield needle, pos
+
+    def matches(text):
+        """(needle, position in text) for every match, overlapping ones included."""
+        if match_case:
+            yield from fast_matches(text)
+        elif text.isascii():
+            # Lowercasing ASCII keeps every position and agrees with IGNORECASE
+            yield from fast_matches(text.lower())
+            yield from pattern_matches(text, pattern_needles)
+        else:
+            yield from pattern_matches(text, needles)
+
+    paragraph_occurrences: Dict[str, list] = {text: [] for text in texts}
+    table_occurrences: Dict[str, list] = {text: [] for text in texts}
+
+    for paragraph, para_idx, location_context in _iter_paragraphs(xml):
+        if _has_no_text(paragraph._p):
+            continue
+        para_text = paragraph.text
+        words = None
+        found = matches(para_text)
+        if whole_word:
+            found = _whole_word_matches(para_text, found)
+        for needle, pos in found:
             if whole_word:
-                # Simple word boundary checking
-                words = para_text.split()
-                for word_idx, word in enumerate(words):
-                    if word == search_text_compare:
-                        occurrence = {
-                            "paragraph_index": para_index,
-                            "word_index": word_idx,
-                            "text": paragraph.text,
-                            "context": " ".join(
-                                words[max(0, word_idx - 2) : word_idx + 3]
-                            ),
-                        }
-                        if location_context:
-                            occurrence.update(location_context)
-                        occurrences.append(occurrence)
-                break
+                if words is None:
+                    words = para_text.split()
+                occurrence = _whole_word_occurrence(para_text, words, pos, para_idx)
             else:
-                pos = para_text.find(search_text_compare, start_pos)
-                if pos == -1:
-                    break
-
                 occurrence = {
-                    "paragraph_index": para_index,
+                    "paragraph_index": para_idx,
                     "position": pos,
-                    "text": paragraph.text,
-                    "context": paragraph.text[
-                        max(0, pos - 20) : pos + len(search_text) + 20
-                    ],
+                    "text": para_text,
+                    "context": para_text[max(0, pos - 20) : pos + len(needle) + 20],
                 }
-                if location_context:
-                    occurrence.update(location_context)
+            if location_context:
+                occurrence.update(location_context)
+            target = table_occurrences if location_context else paragraph_occurrences
+            for text in needles[needle]:
+                target[text].append(occurrence)
 
-                occurrences.append(occurrence)
-                start_pos = pos + 1
+    for text in texts:
+        occurrences = paragraph_occurrences[text] + table_occurrences[text]
+        results["results"][text] = {
+            "occurrences": occurrences,
+            "total_count": len(occurrences),
+        }
+        results["total_count"] += len(occurrences)
+    return results
 
-        return occurrences
+
+class _StylesOnlyPart:
+    """
+    Stands in for the document part of streamed paragraphs and tables.
+
+    python-docx resolves paragraph styles through the owning part; this answers those
+    lookups from the styles part alone, so streamed content reports the same style
+    names as a fully loaded document.
+    """
+
+    def __init__(self, styles: Styles):
+        self._styles = styles
+        self._resolved = {}
+        # Paragraphs, tables and cells find their part through their parent
+        self.part = self
+
+    def get_style(self, style_id, style_type):
+        key = (style_id, style_type)
+        if key not in self._resolved:
+            self._resolved[key] = self._styles.get_by_id(style_id, style_type)
+        return self._resolved[key]
+
+
+def iter_structure_streaming(
+    doc_path: str, table_xml: bool = False
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream the parts of DocumentAnalyzer.get_complete_structure from word/document.xml.
+
+    Yields ("styles", list) first, then ("paragraph", dict) and ("table", dict) for
+    body paragraphs and tables in document order, and ("document_info", dict) last,
+    once the counts are known. Each paragraph or table is parsed, analyzed and freed
+    before the next, so neither the document tree nor the full result is held. With
+    table_xml, tables are yielded as serialized w:tbl bytes instead of analyzed. Raises
+    for packages without the standard word/document.xml and word/styles.xml parts,
+    which need the full parser.
+    """
+    with zipfile.ZipFile(doc_path) as z:
+        xml = z.read("word/document.xml")
+        styles = Styles(parse_xml(z.read("word/styles.xml")))
+
+    yield "styles", StyleAnalyzer.analyze_styles(styles)
+
+    parent = _StylesOnlyPart(styles)
+    style_names = {}
+    analyze_paragraph = ParagraphAnalyzer.analyze_paragraph
+    analyze_table = TableAnalyzer.analyze_table
+    paragraph_count = 0
+    table_count = 0
+    section_count = 0
+
+    with io.BytesIO(xml) as stream:
+        context = etree.iterparse(stream, events=("end",), tag=(_P, _TBL, _SECT_PR))
+        context.set_element_class_lookup(element_class_lookup)
+
+        for _, elem in context:
+            body = elem.getparent()
+            if body is None or body.tag != _BODY:
+                continue
+
+            if elem.tag == _P:
+                yield "paragraph", analyze_paragraph(
+                    Paragraph(elem, parent), paragraph_count, style_names
+                )
+                paragraph_count += 1
+                # A paragraph carrying section properties ends a section
+                if elem.pPr is not None and elem.pPr.sectPr is not None:
+                    section_count += 1
+            elif elem.tag == _TBL:
+                if table_xml:
+                    yield "table", etree.tostring(elem)
+                else:
+                    yield "table", analyze_table(Table(elem, parent), table_count, style_names)
+                table_count += 1
+            else:
+                # The body's own sectPr describes the last section
+                section_count += 1
+
+            elem.clear()
+            while elem.getprevious() is not None:
+                del body[0]
+
+    yield "document_info", {
+        "paragraph_count": paragraph_count,
+        "table_count": table_count,
+        "section_count": section_count,
+    }
+
+
+def get_complete_structure_streaming(doc_path: str) -> Dict[str, Any]:
+    """
+    Build the result of DocumentAnalyzer.get_complete_structure by streaming word/document.xml.
+
+    See iter_structure_streaming; raises where it does. For large documents with many
+    tables the tables are analyzed in a process pool.
+    """
+    with zipfile.ZipFile(doc_path) as z:
+        large = z.getinfo("word/document.xml").file_size >= _PARALLEL_MIN_XML_BYTES
+    parallel = large and (os.cpu_count() or 1) > 1
+
+    parts = {"paragraph": [], "table": []}
+    for kind, value in iter_structure_streaming(doc_path, table_xml=parallel):
+        if kind in parts:
+            parts[kind].append(value)
+        else:
+            parts[kind] = value
+
+    if parallel:
+        parts["table"] = _analyze_tables_xml(doc_path, parts["table"])
+
+    return {
+        "document_info": parts["document_info"],
+        "styles": parts["styles"],
+        "paragraphs": parts["paragraph"],
+        "tables": parts["table"],
+    }
+
+
+# Styles of the document last analyzed in this worker process, keyed by their digest
+_worker_styles_digest: Optional[bytes] = None
+_worker_parent = None
+_worker_style_names: Dict[Any, str] = {}
+
+# Worker processes shared by every structure request, started on first use
+_table_pool: Optional[ProcessPoolExecutor] = None
+_table_pool_lock = threading.Lock()
+
+
+def _use_worker_styles(digest: bytes, styles_xml: bytes) -> None:
+    global _worker_styles_digest, _worker_parent, _worker_style_names
+    if digest != _worker_styles_digest:
+        _worker_parent = _StylesOnlyPart(Styles(parse_xml(styles_xml)))
+        _worker_style_names = {}
+        _worker_styles_digest = digest
+
+
+def _analyze_table_batch(
+    batch: Tuple[bytes, bytes, List[Tuple[bytes, int]]]
+) -> List[Dict[str, Any]]:
+    digest, styles_xml, jobs = batch
+    _use_worker_styles(digest, styles_xml)
+    return [
+        TableAnalyzer.analyze_table(
+            Table(parse_xml(tbl_xml), _worker_parent), index, _worker_style_names
+        )
+        for tbl_xml, index in jobs
+    ]
+
+
+def _shutdown_table_pool() -> None:
+    global _table_pool
+    with _table_pool_lock:
+        pool, _table_pool = _table_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_table_pool() -> ProcessPoolExecutor:
+    """Return the shared table worker pool, starting it on first use."""
+    global _table_pool
+    with _table_pool_lock:
+        if _table_pool is None:
+            # Spawned rather than forked: the server process runs worker threads
+            _table_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_shutdown_table_pool)
+        return _table_pool
+
+
+def _analyze_tables_xml(doc_path: str, tables_xml: List[bytes]) -> List[Dict[str, Any]]:
+    """Analyze serialized body tables, spreading them over worker processes when they are large enough."""
+    with zipfile.ZipFile(doc_path) as z:
+        styles_xml = z.read("word/styles.xml")
+    digest = hashlib.sha1(styles_xml).digest()
+
+    jobs = [(tbl_xml, index) for index, tbl_xml in enumerate(tables_xml)]
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if sum(len(tbl_xml) for tbl_xml in tables_xml) < _PARALLEL_MIN_TABLE_BYTES or workers < 2:
+        return _analyze_table_batch((digest, styles_xml, jobs))
+
+    # A few batches per worker balance the load; each carries the styles once
+    batch_size = max(1, len(jobs) // (workers * 4))
+    batches = [
+        (digest, styles_xml, jobs[start:start + batch_size])
+        for start in range(0, len(jobs), batch_size)
+    ]
+    try:
+        results = _get_table_pool().map(_analyze_table_batch, batches)
+        return [table for batch in results for table in batch]
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next request starts a fresh one
+        _shutdown_table_pool()
+        return _analyze_table_batch((digest, styles_xml, jobs))
+
+
+def _iter_paragraphs(xml: bytes):
+    """
+    Stream the searchable paragraphs of word/document.xml in document order.
+
+    Yields (paragraph, paragraph_index, location_context) for each body paragraph and
+    each paragraph of a body-level table cell, numbered the way DocumentAnalyzer.find_text
+    numbers them; location_context is None for body paragraphs and holds the table
+    coordinates otherwise. Each body element is freed once its paragraphs are consumed.
+    """
+    para_idx = 0
+    table_idx = 0
+
+    with io.BytesIO(xml) as stream:
+        context = etree.iterparse(stream, events=("end",), tag=(_P, _TBL))
+        # Build python-docx element classes so text and merged-cell handling match the analyzer
+        context.set_element_class_lookup(element_class_lookup)
+
+        for _, elem in context:
+            parent = elem.getparent()
+            # Paragraphs and tables nested inside tables are handled with their table
+            if parent is None or parent.tag != _BODY:
+                continue
+
+            if elem.tag == _P:
+                yield Paragraph(elem, None), para_idx, None
+                para_idx += 1
+            else:
+                for row_idx, row in enumerate(Table(elem, None).rows):
+                    for col_idx, cell in enumerate(row.cells):
+                        location_context = {
+                            "table_index": table_idx,
+                            "row_index": row_idx,
+                            "col_index": col_idx,
+                        }
+                        for cell_para_idx, para in enumerate(cell.paragraphs):
+                            yield para, cell_para_idx, location_context
+                table_idx += 1
+
+            # Free the searched element and everything before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def _run_text(xml: bytes) -> Optional[str]:
+    """
+    Concatenate the content of every w:t element in document XML.
+
+    Whitespace between elements (e.g. in pretty-printed XML) is not part of any run,
+    so it is left out. Returns None when the text cannot be extracted reliably.
+    """
+    # Other prefixes, CDATA sections and character references would hide run text
+    if _W_NS_DECL not in xml or b"<![CDATA[" in xml or b"&#" in xml:
+        return None
+    try:
+        return b"".join(_W_T_RE.findall(xml)).decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _xml_may_contain(xml: bytes, text: str, match_case: bool) -> bool:
+    """
+    Cheaply check whether document XML could contain text.
+
+    A False result is authoritative; True only means the document must be searched.
+    Runs can split the text across several w:t elements, so a miss on the raw bytes
+    is confirmed against the concatenated w:t content, never against the XML with
+    its tags removed, which keeps any whitespace between elements.
+    """
+    if not _PREFILTER_UNSAFE.isdisjoint(text):
+        return True
+
+    if match_case:
+        if text.encode("utf-8") in xml:
+            return True
+    else:
+        # bytes.lower() folds ASCII only; a hit in the raw bytes is enough to search
+        folded = text.lower()
+        if folded.isascii() and folded.encode("ascii") in xml.lower():
+            return True
+
+    run_text = _run_text(xml)
+    if run_text is None:
+        # Leave the decision to the parser
+        return True
+    if match_case:
+        return text in run_text
+    # Fold case exactly as find_text does
+    return _ignore_case_pattern(text).search(run_text) is not None
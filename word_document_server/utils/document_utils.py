@@ -3,22 +3,131 @@ Document utility functions for Word Document Server.
 """
 
 from typing import Dict, Any
-from docx import Document
+import io
 import zipfile
 import xml.etree.ElementTree as ET
 import logging
 from collections import defaultdict
+from lxml import etree
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from word_document_server.utils.doc_cache import load_document
+from word_document_server.utils.fast_props import read_core_props
+
+
+_BODY = qn("w:body")
+_P = qn("w:p")
+_TBL = qn("w:tbl")
+_SECT_PR = qn("w:sectPr")
+_P_PR = qn("w:pPr")
+_R = qn("w:r")
+_HYPERLINK = qn("w:hyperlink")
+_T = qn("w:t")
+_BR = qn("w:br")
+_TYPE = qn("w:type")
+
+# Plain-text equivalents of run content, matching python-docx's Run.text
+_RUN_CHAR_TEXT = {
+    qn("w:tab"): "\t",
+    qn("w:ptab"): "\t",
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-",
+}
+
+
+def _run_text(r) -> str:
+    """Text of a <w:r> element, the way python-docx renders it."""
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == _T:
+            parts.append(child.text or "")
+        elif tag == _BR:
+            # Only line breaks produce text; page and column breaks do not
+            if child.get(_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_CHAR_TEXT:
+            parts.append(_RUN_CHAR_TEXT[tag])
+    return "".join(parts)
+
+
+def _paragraph_text(p) -> str:
+    """Text of a <w:p> element, the way python-docx renders Paragraph.text."""
+    parts = []
+    for child in p.iterchildren(_R, _HYPERLINK):
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        else:
+            parts.extend(_run_text(r) for r in child.iterchildren(_R))
+    return "".join(parts)
+
+
+def _fast_counts(path: str) -> Dict[str, int]:
+    """Count sections, words, paragraphs and tables by streaming word/document.xml.
+
+    Counts match python-docx (only body-level paragraphs and tables are counted)
+    but each element is released as soon as it has been seen, so memory stays
+    bounded regardless of document size.
+    """
+    counts = {"page_count": 0, "word_count": 0, "paragraph_count": 0, "table_count": 0}
+
+    with zipfile.ZipFile(path) as z, z.open("word/document.xml") as f:
+        for _, el in etree.iterparse(f, events=("end",), tag=(_P, _TBL, _SECT_PR)):
+            tag = el.tag
+            parent = el.getparent()
+
+            if tag == _SECT_PR:
+                # Section properties live on the body or in a body paragraph's pPr;
+                # any others (e.g. the old properties in a w:sectPrChange) are not sections
+                if parent.tag == _BODY or (
+                    parent.tag == _P_PR
+                    and parent.getparent().tag == _P
+                    and parent.getparent().getparent().tag == _BODY
+                ):
+                    counts["page_count"] += 1
+                continue
+
+            if parent.tag == _BODY:
+                if tag == _P:
+                    counts["paragraph_count"] += 1
+                    counts["word_count"] += len(_paragraph_text(el).split())
+                else:
+                    counts["table_count"] += 1
+
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
+
+    return counts
 
 
-def get_document_properties(doc_path: str) -> Dict[str, Any]:
-    """Get properties of a Word document."""
+def get_document_properties(doc_path: str, fast: bool = True) -> Dict[str, Any]:
+    """Get properties of a Word document.
+
+    Args:
+        doc_path: Path to the Word document
+        fast: If True, read core properties and stream counts straight from the
+            package XML instead of loading the whole document with python-docx
+
+    Returns:
+        Dictionary of document properties and statistics
+    """
     import os
 
     if not os.path.exists(doc_path):
         return {"error": f"Document {doc_path} does not exist"}
 
+    if fast:
+        try:
+            return {**read_core_props(doc_path), **_fast_counts(doc_path)}
+        except Exception:
+            # Unusual package layouts are handled by python-docx below
+            pass
+
     try:
-        doc = Document(doc_path)
+        doc = load_document(doc_path)
         core_props = doc.core_properties
 
         return {
@@ -51,6 +160,7 @@ def extract_document_text(doc_path: str) -> str:
 
     Extracts text while preserving table structure with clear row/cell boundaries
     to maintain relationships between cells (essential for Q&A pairs, forms, etc.).
+    Paragraphs and tables are emitted in document order in a single pass over the body.
 
     Args:
         doc_path: Path to the Word document
@@ -64,44 +174,30 @@ def extract_document_text(doc_path: str) -> str:
         return f"Document {doc_path} does not exist"
 
     try:
-        from word_document_server.utils.document_analyzer import DocumentAnalyzer
-
-        doc = Document(doc_path)
-        analyzer = DocumentAnalyzer(doc_path)
-        structure = analyzer.get_complete_structure()
-
-        if "error" in structure:
-            return structure["error"]
-
-        text_parts = []
+        doc = load_document(doc_path)
+        parent = doc._body
+        buf = io.StringIO()
         table_index = 0
 
-        # Get all body elements and process them in order
-        for element in doc.element.body:
-            tag_name = element.tag.split("}")[-1] if "}" in element.tag else element.tag
-
-            if tag_name == "p":  # paragraph
-                # Find the corresponding paragraph in the parsed document
-                for para in doc.paragraphs:
-                    if para._element == element:
-                        para_text = para.text.strip()
-                        if para_text:  # Only add non-empty paragraphs
-                            text_parts.append(para_text)
-                        break
-
-            elif tag_name == "tbl":  # table
-                if table_index < len(structure["tables"]):
-                    table_text = _format_table_for_llm(
-                        structure["tables"][table_index], table_index
-                    )
-                    text_parts.append(table_text)
-                    table_index += 1
-
-        return "\n\n".join(text_parts)
+        for element in doc.element.body.iterchildren(_P, _TBL):
+            if element.tag == _P:
+                para_text = Paragraph(element, parent).text.strip()
+                if not para_text:  # Only add non-empty paragraphs
+                    continue
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write(para_text)
+            else:
+                if buf.tell():
+                    buf.write("\n\n")
+                _write_table_for_llm(buf, Table(element, parent), table_index)
+                table_index += 1
+
+        return buf.getvalue()
 
     except Exception:
         # Fallback to simple extraction if structured fails
-        doc = Document(doc_path)
+        doc = load_document(doc_path)
         text = []
 
         for paragraph in doc.paragraphs:
@@ -116,30 +212,33 @@ def extract_document_text(doc_path: str) -> str:
         return "\n".join(text)
 
 
-def _format_table_for_llm(table_data: Dict[str, Any], table_index: int) -> str:
-    """Format table data with clear row/cell boundaries for LLM parsing."""
-    if not table_data.get("cells"):
-        return f"=== TABLE {table_index + 1} (empty) ==="
-
-    formatted_lines = [f"=== TABLE {table_index + 1} ==="]
-
-    for row_idx, row_cells in enumerate(table_data["cells"]):
-        row_parts = []
-        for col_idx, cell in enumerate(row_cells):
-            cell_text = cell.get("text", "").strip()
-            # Handle merged cells
-            if cell.get("v_merge") == "continue":
-                cell_text = "(merged with above)"
-            elif not cell_text:
-                cell_text = "(empty)"
-
-            row_parts.append(f"Col{col_idx}: {cell_text}")
-
-        row_line = f"Row{row_idx}: | " + " | ".join(row_parts) + " |"
-        formatted_lines.append(row_line)
-
-    formatted_lines.append("=== END TABLE ===")
-    return "\n".join(formatted_lines)
+def _cell_text_for_llm(cell) -> str:
+    """Text shown for a table cell, marking vertical merge continuations and empty cells."""
+    tc_pr = cell._tc.tcPr
+    v_merge = tc_pr.vMerge if tc_pr is not None else None
+    if v_merge is not None and (v_merge.val or "continue") == "continue":
+        return "(merged with above)"
+    return cell.text.strip() or "(empty)"
+
+
+def _write_table_for_llm(buf: io.StringIO, table, table_index: int) -> None:
+    """Write a table with clear row/cell boundaries for LLM parsing."""
+    rows = table.rows
+    if not len(rows):
+        buf.write(f"=== TABLE {table_index + 1} (empty) ===")
+        return
+
+    buf.write(f"=== TABLE {table_index + 1} ===")
+    for row_idx, row in enumerate(rows):
+        buf.write(f"\nRow{row_idx}: | ")
+        buf.write(
+            " | ".join(
+                f"Col{col_idx}: {_cell_text_for_llm(cell)}"
+                for col_idx, cell in enumerate(row.cells)
+            )
+        )
+        buf.write(" |")
+    buf.write("\n=== END TABLE ===")
 
 
 def get_document_structure(doc_path: str) -> Dict[str, Any]:
@@ -150,7 +249,7 @@ def get_document_structure(doc_path: str) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
 
     try:
-        doc = Document(doc_path)
+        doc = load_document(doc_path)
         structure = {"paragraphs": [], "tables": []}
 
         # Get paragraphs
@@ -0,0 +1,99 @@
+"""
+Fast document property reading for Word Document Server.
+
+Document metadata lives in two small package parts, docProps/core.xml and
+docProps/app.xml, so it can be read without parsing word/document.xml.
+"""
+
+import zipfile
+from typing import Dict, Any
+from lxml import etree
+from docx.oxml import parse_xml
+from docx.opc.coreprops import CoreProperties
+
+
+_EP_NS = {"ep": "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"}
+
+# Statistics recorded in app.xml, mapped to the keys they are reported under
+_APP_STATISTICS = {
+    "Pages": "pages",
+    "Words": "words",
+    "Characters": "characters",
+    "Paragraphs": "paragraphs",
+}
+
+
+def _core_props(z: zipfile.ZipFile) -> Dict[str, Any]:
+    """Metadata from docProps/core.xml, formatted the same way as python-docx reports it."""
+    try:
+        core_props = CoreProperties(parse_xml(z.read("docProps/core.xml")))
+    except KeyError:
+        return {
+            "title": "",
+            "author": "",
+            "subject": "",
+            "keywords": "",
+            "created": "",
+            "modified": "",
+            "last_modified_by": "",
+            "revision": 0,
+        }
+
+    return {
+        "title": core_props.title or "",
+        "author": core_props.author or "",
+        "subject": core_props.subject or "",
+        "keywords": core_props.keywords or "",
+        "created": str(core_props.created) if core_props.created else "",
+        "modified": str(core_props.modified) if core_props.modified else "",
+        "last_modified_by": core_props.last_modified_by or "",
+        "revision": core_props.revision or 0,
+    }
+
+
+def _app_statistics(z: zipfile.ZipFile) -> Dict[str, int]:
+    """Statistics from docProps/app.xml. Only fields present in the part are returned."""
+    try:
+        app = etree.fromstring(z.read("docProps/app.xml"))
+    except KeyError:
+        return {}
+
+    stats = {}
+    for element_name, key in _APP_STATISTICS.items():
+        value = app.xpath(f"string(ep:{element_name})", namespaces=_EP_NS)
+        if value.isdigit():
+            stats[key] = int(value)
+    return stats
+
+
+def read_core_props(path: str) -> Dict[str, Any]:
+    """
+    Read document metadata from docProps/core.xml.
+
+    Args:
+        path: Path to the Word document
+
+    Returns:
+        Dictionary with title, author, subject, keywords, dates, last_modified_by and revision
+    """
+    with zipfile.ZipFile(path) as z:
+        return _core_props(z)
+
+
+def read_props(path: str) -> Dict[str, Any]:
+    """
+    Read document metadata and the statistics stored by the authoring application.
+
+    The statistics in app.xml are only refreshed by Word itself, so they can be
+    stale for documents last saved by other tools (python-docx never updates them).
+
+    Args:
+        path: Path to the Word document
+
+    Returns:
+        Dictionary of core metadata plus an "app_statistics" dictionary
+    """
+    with zipfile.ZipFile(path) as z:
+        props = _core_props(z)
+        props["app_statistics"] = _app_statistics(z)
+        return props
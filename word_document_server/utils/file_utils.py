@@ -2,46 +2,167 @@
 File utility functions for Word Document Server.
 """
 
+import asyncio
+import contextlib
+import functools
+import io
 import os
-from typing import Tuple, Optional
+import tempfile
+import weakref
+from typing import BinaryIO, Iterator, Tuple, Optional
 import shutil
+from zipfile import ZipFile, ZIP_STORED
+from docx.opc.pkgwriter import PackageWriter
+
+
+# The uncompressed writer drives python-docx's PackageWriter helpers directly, since
+# OpcPackage.save always deflates. They are private, so the dependency is pinned to
+# the tested python-docx releases and a re-zip of a normal save is kept as fallback.
+_PKG_WRITER_STEPS = ("_write_content_types_stream", "_write_pkg_rels", "_write_parts")
+_HAS_PKG_WRITER_STEPS = all(hasattr(PackageWriter, step) for step in _PKG_WRITER_STEPS)
+
+
+class _StoredZipPkgWriter:
+    """Physical package writer for python-docx that stores parts without compression."""
+
+    def __init__(self, pkg_file):
+        self._zipf = ZipFile(pkg_file, "w", compression=ZIP_STORED)
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self._zipf.close()
+
+
+# Writes to one file are serialized so concurrent edits cannot overwrite each other;
+# reads never wait on these locks
+_write_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def write_lock(filename: str) -> asyncio.Lock:
+    """Lock serializing the write tools for one file."""
+    path = os.path.abspath(filename)
+    lock = _write_locks.get(path)
+    if lock is None:
+        lock = _write_locks[path] = asyncio.Lock()
+    return lock
+
+
+def _write_package(doc, stream, compress: bool) -> None:
+    """Write the document package to an open binary stream."""
+    if compress:
+        doc.save(stream)
+        return
+
+    if not _HAS_PKG_WRITER_STEPS:
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        with ZipFile(buffer) as source, ZipFile(stream, "w", compression=ZIP_STORED) as target:
+            for info in source.infolist():
+                target.writestr(info.filename, source.read(info))
+        return
+
+    # Mirrors OpcPackage.save, which has no way to choose the zip compression
+    package = doc.part.package
+    for part in package.parts:
+        part.before_marshal()
+    writer = _StoredZipPkgWriter(stream)
+    try:
+        PackageWriter._write_content_types_stream(writer, package.parts)
+        PackageWriter._write_pkg_rels(writer, package.rels)
+        PackageWriter._write_parts(writer, package.parts)
+    finally:
+        writer.close()
+
+
+@contextlib.contextmanager
+def atomic_replace(path: str) -> Iterator[BinaryIO]:
+    """
+    Open a binary stream whose contents replace ``path`` when the block succeeds.
+
+    An existing file is written to a temporary file next to it and then moved
+    over it, so a failed or interrupted write never leaves a truncated file and
+    readers see either the old contents or the new ones. The original
+    permissions are kept.
+
+    Args:
+        path: Destination path
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        # Nothing to protect yet, and a plain create applies the usual umask
+        with open(path, "wb") as stream:
+            yield stream
+        return
+
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            yield stream
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_document(doc, path: str, compress: bool = True) -> None:
+    """
+    Save a python-docx Document, optionally without compressing its parts.
+
+    The save goes through atomic_replace, so an existing document is never
+    left half-written.
+
+    Deflating every XML part dominates save time for large documents. Uncompressed
+    packages are valid .docx files, only larger, which suits intermediate files
+    that will be rewritten again shortly.
+
+    Args:
+        doc: python-docx Document to save
+        path: Destination path
+        compress: If False, write the package with ZIP_STORED
+    """
+    with atomic_replace(path) as stream:
+        _write_package(doc, stream, compress)
 
 
 def check_file_writeable(filepath: str) -> Tuple[bool, str]:
     """
     Check if a file can be written to.
 
+    Only permissions are checked here. Other failures, such as a file locked by
+    another application, are reported by the save call that actually writes it.
+
     Args:
         filepath: Path to the file
 
     Returns:
         Tuple of (is_writeable, error_message)
     """
-    # If file doesn't exist, check if directory is writeable
-    if not os.path.exists(filepath):
-        directory = os.path.dirname(filepath)
-        # If no directory is specified (empty string), use current directory
-        if directory == "":
-            directory = "."
-        if not os.path.exists(directory):
-            return False, f"Directory {directory} does not exist"
-        if not os.access(directory, os.W_OK):
-            return False, f"Directory {directory} is not writeable"
+    # An existing, writeable file is the common case and needs a single syscall
+    if os.access(filepath, os.W_OK):
         return True, ""
 
-    # If file exists, check if it's writeable
-    if not os.access(filepath, os.W_OK):
+    # If file exists, it is not writeable
+    if os.path.exists(filepath):
         return False, f"File {filepath} is not writeable (permission denied)"
 
-    # Try to open the file for writing to see if it's locked
-    try:
-        with open(filepath, "a"):
-            pass
-        return True, ""
-    except IOError as e:
-        return False, f"File {filepath} is not writeable: {str(e)}"
-    except Exception as e:
-        return False, f"Unknown error checking file permissions: {str(e)}"
+    # If file doesn't exist, check if directory is writeable
+    directory = os.path.dirname(filepath)
+    # If no directory is specified (empty string), use current directory
+    if directory == "":
+        directory = "."
+    if not os.path.exists(directory):
+        return False, f"Directory {directory} does not exist"
+    if not os.access(directory, os.W_OK):
+        return False, f"Directory {directory} is not writeable"
+    return True, ""
 
 
 def create_document_copy(
@@ -65,14 +186,19 @@ def create_document_copy(
         base, ext = os.path.splitext(source_path)
         dest_path = f"{base}_copy{ext}"
 
+    if os.path.exists(dest_path) and os.path.samefile(source_path, dest_path):
+        return False, f"Source and destination are the same file: {dest_path}", None
+
     try:
-        # Simple file copy
-        shutil.copy2(source_path, dest_path)
+        # Byte-level copy; the kernel copies the data directly where supported
+        shutil.copyfile(source_path, dest_path)
         return True, f"Document copied to {dest_path}", dest_path
     except Exception as e:
         return False, f"Failed to copy document: {str(e)}", None
 
 
+# Every tool normalises its filename argument, usually with the same few names
+@functools.lru_cache(maxsize=256)
 def ensure_docx_extension(filename: str) -> str:
     """
     Ensure filename has .docx extension.
@@ -83,6 +209,5 @@ def ensure_docx_extension(filename: str) -> str:
     Returns:
         Filename with .docx extension
     """
-    if not filename.endswith(".docx"):
-        return filename + ".docx"
-    return filename
+    # Only the suffix is case-folded, so no lowercased copy of the whole path is made
+    return filename if filename[-5:].lower() == ".docx" else filename + ".docx"
@@ -7,9 +7,10 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from docx import Document
 from docx.text.font import Font as DocxFont
+from word_document_server.utils.file_utils import save_document
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScopeLocation:
     """Data class representing a scope for text operations."""
 
@@ -246,8 +247,17 @@ class FormattedEditor:
         """Initialize with a document path."""
         self.doc_path = doc_path
         self._doc = None
+        # Write methods save after every change unless the caller batches edits
+        self.autosave = True
         self.text_replacer = TextReplacer()
 
+    @classmethod
+    def from_document(cls, doc, doc_path: str = ""):
+        """Create an instance around an already-parsed document instead of loading one."""
+        instance = cls(doc_path)
+        instance._doc = doc
+        return instance
+
     def _load_document(self) -> Dict[str, Any]:
         """Load and validate the document."""
         if not os.path.exists(self.doc_path):
@@ -311,6 +321,43 @@ class FormattedEditor:
                 "error": f"Invalid scope_type: {scope.scope_type}. Must be 'paragraph' or 'table_cell'"
             }
 
+    @staticmethod
+    def _no_replacements(
+        find_text: str, replace_text: str, scope: ScopeLocation
+    ) -> Dict[str, Any]:
+        """Result of a search and replace that found nothing to change."""
+        return {
+            "success": True,
+            "changed": False,
+            "message": f"No occurrences of '{find_text}' found in {scope}; no changes made",
+            "scope": str(scope),
+            "replacements_made": 0,
+            "find_text": find_text,
+            "replace_text": replace_text,
+        }
+
+    def precheck_search_and_replace(
+        self, find_text: str, replace_text: str, scope: ScopeLocation
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Settle a search and replace that cannot change anything, without modifying the document.
+
+        Safe to call on a shared read-only document. Returns the no-op result when
+        find_text does not occur in the scope, or None when the replacement has to run
+        (including invalid scopes, which search_and_replace_in_scope reports).
+        """
+        if not find_text:
+            return None
+
+        validation_result = self._validate_scope(scope)
+        if "error" in validation_result:
+            return None
+
+        # Matches never span paragraphs, so absence from the whole scope text is conclusive
+        if find_text in validation_result["target"].text:
+            return None
+        return self._no_replacements(find_text, replace_text, scope)
+
     def search_and_replace_in_scope(
         self, find_text: str, replace_text: str, scope: ScopeLocation
     ) -> Dict[str, Any]:
@@ -338,10 +385,16 @@ class FormattedEditor:
                         paragraph, find_text, replace_text
                     )
 
-            self._doc.save(self.doc_path)
+            # Nothing was rewritten, so there is nothing to save
+            if not total_replacements:
+                return self._no_replacements(find_text, replace_text, scope)
+
+            if self.autosave:
+                save_document(self._doc, self.doc_path)
 
             return {
                 "success": True,
+                "changed": True,
                 "message": f"Replaced '{find_text}' with '{replace_text}' in {scope}",
                 "scope": str(scope),
                 "replacements_made": total_replacements,
@@ -0,0 +1,36 @@
+"""
+JSON serialization helpers for Word Document Server.
+
+orjson is used when it is installed (``pip install office-word-mcp-server[speedups]``);
+otherwise the standard library encoder produces the same output.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, pretty: bool = True) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Args:
+        obj: Value to serialize
+        pretty: Indent by two spaces if True; otherwise emit compact JSON without whitespace
+
+    Returns:
+        JSON string with non-ASCII characters left unescaped
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+        except TypeError:
+            # orjson is stricter (e.g. non-string keys); let the stdlib encoder handle it
+            pass
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -7,9 +7,12 @@ from typing import Dict, Any, Optional
 from docx import Document
 from docx.oxml import OxmlElement  # For insert_paragraph_after_index_util
 from docx.oxml.ns import qn  # For insert_paragraph_after_index_util
+from word_document_server.utils.doc_cache import load_document
+from word_document_server.utils.file_utils import save_document
 
 # Functions moved from extended_document_utils.py:
 # get_paragraph_text, set_paragraph_text_util, insert_paragraph_after_index_util
+# The *_in_document variants modify an open Document and leave saving to the caller.
 
 
 def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
@@ -27,7 +30,7 @@ def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
 
     try:
-        doc = Document(doc_path)
+        doc = load_document(doc_path)
 
         if not (0 <= paragraph_index < len(doc.paragraphs)):
             return {
@@ -48,17 +51,17 @@ def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
         return {"error": f"Failed to get paragraph text: {str(e)}"}
 
 
-def set_paragraph_text_util(
-    doc_path: str,
+def set_paragraph_text_in_document(
+    doc,
     paragraph_index: int,
     new_text: str,
     style_to_apply: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
-    Set text in a specific paragraph in a Word document.
+    Set text in a specific paragraph of an open document without saving it.
 
     Args:
-        doc_path: Path to the Word document
+        doc: python-docx Document to modify
         paragraph_index: Index of the paragraph (0-based)
         new_text: New text to set
         style_to_apply: Optional style to apply to the paragraph
@@ -66,18 +69,28 @@ def set_paragraph_text_util(
     Returns:
         Dictionary with operation result
     """
-    if not os.path.exists(doc_path):
-        return {"error": f"Document {doc_path} does not exist"}
-
     try:
-        doc = Document(doc_path)
-
         if not (0 <= paragraph_index < len(doc.paragraphs)):
             return {
                 "error": f"Invalid paragraph index: {paragraph_index}. Document has {len(doc.paragraphs)} paragraphs."
             }
 
         paragraph = doc.paragraphs[paragraph_index]
+
+        # Identical text and style: leave the runs (and their formatting) untouched
+        if paragraph.text == new_text and (
+            not style_to_apply
+            or (paragraph.style is not None and paragraph.style.name == style_to_apply)
+        ):
+            return {
+                "success": True,
+                "changed": False,
+                "message": f"Paragraph {paragraph_index} already contains this text; no changes made",
+                "paragraph_index": paragraph_index,
+                "text_set": new_text,
+                "style_applied": None,
+            }
+
         paragraph.text = new_text
 
         if style_to_apply:
@@ -86,10 +99,9 @@ def set_paragraph_text_util(
             except KeyError:  # Python-docx raises KeyError if style doesn't exist
                 return {"error": f"Style '{style_to_apply}' not found in document"}
 
-        doc.save(doc_path)
-
         return {
             "success": True,
+            "changed": True,
             "message": f"Text set in paragraph {paragraph_index}",
             "paragraph_index": paragraph_index,
             "text_set": new_text,
@@ -99,20 +111,20 @@ def set_paragraph_text_util(
         return {"error": f"Failed to set paragraph text: {str(e)}"}
 
 
-def insert_paragraph_after_index_util(
+def set_paragraph_text_util(
     doc_path: str,
-    target_paragraph_index: int,
-    text_to_insert: str,
+    paragraph_index: int,
+    new_text: str,
     style_to_apply: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
-    Insert a new paragraph after a specific paragraph index in a Word document.
+    Set text in a specific paragraph in a Word document.
 
     Args:
         doc_path: Path to the Word document
-        target_paragraph_index: Index of the paragraph after which to insert (0-based)
-        text_to_insert: Text for the new paragraph
-        style_to_apply: Optional style to apply to the new paragraph
+        paragraph_index: Index of the paragraph (0-based)
+        new_text: New text to set
+        style_to_apply: Optional style to apply to the paragraph
 
     Returns:
         Dictionary with operation result
@@ -122,7 +134,35 @@ def insert_paragraph_after_index_util(
 
     try:
         doc = Document(doc_path)
+        result = set_paragraph_text_in_document(
+            doc, paragraph_index, new_text, style_to_apply
+        )
+        if result.get("changed"):
+            save_document(doc, doc_path)
+        return result
+    except Exception as e:
+        return {"error": f"Failed to set paragraph text: {str(e)}"}
+
+
+def insert_paragraph_after_index_in_document(
+    doc,
+    target_paragraph_index: int,
+    text_to_insert: str,
+    style_to_apply: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Insert a new paragraph after a specific paragraph index of an open document without saving it.
 
+    Args:
+        doc: python-docx Document to modify
+        target_paragraph_index: Index of the paragraph after which to insert (0-based)
+        text_to_insert: Text for the new paragraph
+        style_to_apply: Optional style to apply to the new paragraph
+
+    Returns:
+        Dictionary with operation result
+    """
+    try:
         if not (0 <= target_paragraph_index < len(doc.paragraphs)):
             return {
                 "error": f"Invalid paragraph index: {target_paragraph_index}. Document has {len(doc.paragraphs)} paragraphs."
@@ -145,8 +185,6 @@ def insert_paragraph_after_index_util(
 
         target_paragraph._element.addnext(new_p_oxml)
 
-        doc.save(doc_path)
-
         # To return the index of the newly inserted paragraph, it would be target_paragraph_index + 1
         # However, this can be complex if other operations happen. For now, confirming success.
         return {
@@ -161,6 +199,39 @@ def insert_paragraph_after_index_util(
         return {"error": f"Failed to insert paragraph: {str(e)}"}
 
 
+def insert_paragraph_after_index_util(
+    doc_path: str,
+    target_paragraph_index: int,
+    text_to_insert: str,
+    style_to_apply: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Insert a new paragraph after a specific paragraph index in a Word document.
+
+    Args:
+        doc_path: Path to the Word document
+        target_paragraph_index: Index of the paragraph after which to insert (0-based)
+        text_to_insert: Text for the new paragraph
+        style_to_apply: Optional style to apply to the new paragraph
+
+    Returns:
+        Dictionary with operation result
+    """
+    if not os.path.exists(doc_path):
+        return {"error": f"Document {doc_path} does not exist"}
+
+    try:
+        doc = Document(doc_path)
+        result = insert_paragraph_after_index_in_document(
+            doc, target_paragraph_index, text_to_insert, style_to_apply
+        )
+        if "error" not in result:
+            save_document(doc, doc_path)
+        return result
+    except Exception as e:
+        return {"error": f"Failed to insert paragraph: {str(e)}"}
+
+
 """
 # End of paragraph_utils.py
 """
@@ -6,6 +6,7 @@ import os
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from docx import Document
+from word_document_server.utils.file_utils import save_document
 
 
 @dataclass
@@ -27,6 +28,15 @@ class TableManager:
         """Initialize with a document path."""
         self.doc_path = doc_path
         self._doc = None
+        # Write methods save after every change unless the caller batches edits
+        self.autosave = True
+
+    @classmethod
+    def from_document(cls, doc, doc_path: str = ""):
+        """Create an instance around an already-parsed document instead of loading one."""
+        instance = cls(doc_path)
+        instance._doc = doc
+        return instance
 
     def _load_document(self) -> Dict[str, Any]:
         """Load and validate the document. Returns error dict if failed."""
@@ -67,22 +77,18 @@ class TableManager:
 
     def _analyze_cell_formatting(self, cell) -> Dict[str, Any]:
         """Extract formatting information from a cell."""
-        try:
-            tc_element = cell._tc
-            grid_span_el = tc_element.tcPr.gridSpan
-            grid_span = grid_span_el.val if grid_span_el is not None else 1
-
-            v_merge_el = tc_element.tcPr.vMerge
-            v_merge = (
-                v_merge_el.val
-                if v_merge_el is not None and v_merge_el.val
-                else ("continue" if v_merge_el is not None else None)
-            )
-
-            return {"grid_span": grid_span, "v_merge": v_merge}
-        except (AttributeError, TypeError):
+        tc_pr = cell._tc.tcPr
+        if tc_pr is None:
             return {"grid_span": 1, "v_merge": None}
 
+        grid_span_el = tc_pr.gridSpan
+        v_merge_el = tc_pr.vMerge
+        return {
+            "grid_span": grid_span_el.val if grid_span_el is not None else 1,
+            # A vMerge without a val continues the merge above
+            "v_merge": (v_merge_el.val or "continue") if v_merge_el is not None else None,
+        }
+
     def _analyze_paragraph_runs(self, paragraph) -> list:
         """Extract run information from a paragraph."""
         runs = []
@@ -94,7 +100,7 @@ class TableManager:
                 "italic": run.italic,
                 "underline": run.underline,
                 "font_name": run.font.name,
-                "font_size": str(run.font.size) if run.font.size else None,
+                "font_size": run.font.size.pt if run.font.size is not None else None,
             }
             runs.append(run_info)
         return runs
@@ -141,6 +147,16 @@ class TableManager:
         except Exception as e:
             return {"error": f"Failed to get table cell content: {str(e)}"}
 
+    @staticmethod
+    def _cell_has_text(cell, text: str, style: Optional[str]) -> bool:
+        """Check whether a cell consists of exactly one paragraph with this text and style."""
+        paragraphs = cell.paragraphs
+        if len(paragraphs) != 1 or cell.tables or paragraphs[0].text != text:
+            return False
+        return style is None or (
+            paragraphs[0].style is not None and paragraphs[0].style.name == style
+        )
+
     def set_cell_text(
         self,
         location: CellLocation,
@@ -157,6 +173,17 @@ class TableManager:
             table = validation_result["table"]
             cell = table.cell(location.row_index, location.col_index)
 
+            # Replacing the content with identical text would only rewrite the file
+            if clear_existing and self._cell_has_text(cell, text, style):
+                return {
+                    "success": True,
+                    "changed": False,
+                    "message": f"{location} already contains this text; no changes made",
+                    "location": str(location),
+                    "text_set": text,
+                    "style_applied": None,
+                }
+
             target_paragraph = None
             if clear_existing:
                 cell.text = text
@@ -171,10 +198,12 @@ class TableManager:
                 except KeyError:
                     return {"error": f"Style '{style}' not found in document"}
 
-            self._doc.save(self.doc_path)
+            if self.autosave:
+                save_document(self._doc, self.doc_path)
 
             return {
                 "success": True,
+                "changed": True,
                 "message": f"Text set in {location}",
                 "location": str(location),
                 "text_set": text,
@@ -199,7 +228,8 @@ class TableManager:
             cell = table.cell(location.row_index, location.col_index)
             cell.text = ""  # Clears all paragraphs and adds a single empty one
 
-            self._doc.save(self.doc_path)
+            if self.autosave:
+                save_document(self._doc, self.doc_path)
 
             return {
                 "success": True,
@@ -233,7 +263,8 @@ class TableManager:
                 except KeyError:
                     return {"error": f"Style '{style}' not found in document"}
 
-            self._doc.save(self.doc_path)
+            if self.autosave:
+                save_document(self._doc, self.doc_path)
 
             return {
                 "success": True,